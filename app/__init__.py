@@ -33,6 +33,11 @@ api = Api(
 
 def configure_logging(app):
     """Configure logging for the application"""
+    # app.logger는 같은 이름의 logger를 공유하므로 create_app()을 다시 호출해도 핸들러를 중복으로 붙이지 않음
+    if any(getattr(handler, '_seobi_handler', False) for handler in app.logger.handlers):
+        app.logger.setLevel(logging.INFO)
+        return
+
     if not os.path.exists('logs'):
         os.mkdir('logs')
     
@@ -54,6 +59,9 @@ def configure_logging(app):
     ))
     console_handler.setLevel(logging.INFO)
     
+    file_handler._seobi_handler = True
+    console_handler._seobi_handler = True
+
     # Configure root logger
     app.logger.addHandler(file_handler)
     app.logger.addHandler(console_handler)
@@ -114,6 +122,7 @@ def create_app(config_name=None):
     from app.routes.debug.auto_task import ns as debug_auto_task_ns
     from app.routes.debug.background import ns as debug_background_ns
     from app.routes.debug.insight import ns as debug_insight_ns
+    from app.routes.debug.metrics import ns as debug_metrics_ns
 
     # Add production namespaces
     api.add_namespace(auth_ns)  # /sign, /verify
@@ -135,5 +144,6 @@ def create_app(config_name=None):
     api.add_namespace(debug_auto_task_ns, path='/debug/autotask')
     api.add_namespace(debug_background_ns, path='/debug/background')
     api.add_namespace(debug_insight_ns, path='/debug/insights')
+    api.add_namespace(debug_metrics_ns, path='/debug/metrics')
 
     return app
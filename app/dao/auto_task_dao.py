@@ -1,7 +1,9 @@
 from app.dao.base import BaseDAO
 from app.models import AutoTask, db
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, case, exists, or_, select, update
+from sqlalchemy.orm import aliased
 import uuid
 
 
@@ -29,6 +31,67 @@ class AutoTaskDAO(BaseDAO[AutoTask]):
             query = query.filter_by(status=status)
         return query.order_by(self.model.start_at.asc()).all()
 
+    def get_schedulable_tasks(self) -> List[AutoTask]:
+        """반복 조건(repeat)이나 선호 실행 시각(preferred_at)이 있는 활성 업무를 모든 사용자에 대해 조회합니다."""
+        return self.query().filter(
+            AutoTask.active.is_(True),
+            or_(and_(AutoTask.repeat.isnot(None), AutoTask.repeat != ''), AutoTask.preferred_at.isnot(None))
+        ).all()
+
+    def claim_next_task(self, user_id: uuid.UUID, stale_after: Optional[float] = None,
+                        task_id: Optional[uuid.UUID] = None) -> Optional[AutoTask]:
+        """
+        다음에 실행할 AutoTask 하나를 DB에서 골라 status='doing', start_at=now로 바꾸고 반환합니다.
+
+        - 선행 업무(task_list[0] 제목)가 done인 서브 업무를 메인 업무(task_list 없음)보다 먼저, 각각 최신순으로 선택
+        - UPDATE ... RETURNING과 FOR UPDATE SKIP LOCKED로 여러 워커가 같은 업무를 가져가지 않음
+        - stale_after(초)가 주어지면 그보다 오래 doing에 머문 업무(워커 중단 등)도 다시 가져감
+        - task_id가 주어지면(스케줄러가 실행 시각이 된 업무를 지정) 선행 업무 조건 없이 그 업무만 선점
+        """
+        now = datetime.now(timezone.utc)
+        parent = aliased(AutoTask)
+        parent_title = AutoTask.task_list[0].as_string()
+
+        runnable_status = AutoTask.status == 'undone'
+        if stale_after is not None:
+            runnable_status = or_(runnable_status, and_(
+                AutoTask.status == 'doing',
+                AutoTask.start_at < now - timedelta(seconds=stale_after)
+            ))
+
+        parent_done = exists().where(
+            parent.user_id == AutoTask.user_id,
+            parent.title == parent_title,
+            parent.status == 'done'
+        )
+        if task_id is not None:
+            selectable = AutoTask.id == task_id
+        else:
+            selectable = or_(parent_title.is_(None), parent_done)
+        candidate = select(AutoTask.id).where(
+            AutoTask.user_id == user_id,
+            runnable_status,
+            selectable
+        ).order_by(
+            case((parent_title.is_(None), 1), else_=0),
+            AutoTask.created_at.desc()
+        ).limit(1).with_for_update(skip_locked=True, of=AutoTask).cte('candidate')
+
+        stmt = update(AutoTask) \
+            .where(AutoTask.id.in_(select(candidate.c.id))) \
+            .values(status='doing', start_at=now) \
+            .returning(AutoTask)
+        task = db.session.execute(
+            select(AutoTask).from_statement(stmt),
+            execution_options={'populate_existing': True}
+        ).scalar_one_or_none()
+        db.session.commit()
+        return task
+
+    def release_task(self, auto_task_id: uuid.UUID) -> Optional[AutoTask]:
+        """claim_next_task로 가져간 업무를 끝내지 못했을 때 다시 undone으로 되돌립니다."""
+        return self.update(auto_task_id, status='undone')
+
     def create(self, user_id: uuid.UUID, **kwargs) -> AutoTask:
         return super().create(user_id=user_id, **kwargs)
 
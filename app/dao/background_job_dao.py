@@ -0,0 +1,87 @@
+from app.dao.base import BaseDAO
+from app.models import BackgroundJob, db
+from typing import Optional
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+import uuid
+
+
+class BackgroundJobDAO(BaseDAO[BackgroundJob]):
+    """Data Access Object for BackgroundJob model"""
+    def __init__(self):
+        super().__init__(BackgroundJob)
+
+    def enqueue(self, job_type: str, payload: dict = None, dedup_key: str = None,
+                max_attempts: int = 3) -> Optional[BackgroundJob]:
+        """작업을 추가합니다. 같은 dedup_key의 작업이 이미 있으면 추가하지 않고 None을 반환합니다."""
+        now = datetime.now(timezone.utc)
+        stmt = insert(BackgroundJob).values(
+            id=uuid.uuid4(),
+            job_type=job_type,
+            dedup_key=dedup_key,
+            payload=payload or {},
+            status='queued',
+            attempts=0,
+            max_attempts=max_attempts,
+            created_at=now,
+            available_at=now
+        ).on_conflict_do_nothing(index_elements=['dedup_key']).returning(BackgroundJob.id)
+        job_id = db.session.execute(stmt).scalar()
+        db.session.commit()
+        return self.get(job_id) if job_id else None
+
+    def claim_next(self) -> Optional[BackgroundJob]:
+        """
+        실행 가능한 가장 오래된 작업 하나를 running으로 바꾸고 반환합니다.
+        FOR UPDATE SKIP LOCKED로 여러 워커/프로세스가 같은 작업을 가져가지 않습니다.
+        """
+        now = datetime.now(timezone.utc)
+        job = self.query().filter(
+            BackgroundJob.status == 'queued',
+            BackgroundJob.available_at <= now
+        ).order_by(BackgroundJob.available_at.asc()) \
+            .with_for_update(skip_locked=True).limit(1).first()
+        if job is None:
+            db.session.rollback()
+            return None
+        job.status = 'running'
+        job.attempts += 1
+        job.started_at = now
+        db.session.commit()
+        return job
+
+    def complete(self, job_id: uuid.UUID) -> Optional[BackgroundJob]:
+        return self.update(job_id, status='done', finished_at=datetime.now(timezone.utc))
+
+    def fail(self, job_id: uuid.UUID, error: str, retry_delay: float = 0) -> Optional[BackgroundJob]:
+        """
+        실패를 기록합니다. 재시도 횟수가 남아 있으면 retry_delay초 뒤에 다시 실행되도록 queued로 되돌립니다.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.last_error = error
+        if job.attempts < job.max_attempts:
+            job.status = 'queued'
+            job.available_at = datetime.now(timezone.utc) + timedelta(seconds=retry_delay)
+        else:
+            job.status = 'failed'
+            job.finished_at = datetime.now(timezone.utc)
+        db.session.commit()
+        return job
+
+    def requeue_stale(self, older_than_seconds: float) -> int:
+        """프로세스 재시작 등으로 running 상태에 남은 작업을 다시 queued로 되돌립니다."""
+        threshold = datetime.now(timezone.utc) - timedelta(seconds=older_than_seconds)
+        count = self.query().filter(
+            BackgroundJob.status == 'running',
+            BackgroundJob.started_at < threshold
+        ).update({'status': 'queued', 'available_at': func.now()}, synchronize_session=False)
+        db.session.commit()
+        return count
+
+    def count_by_status(self) -> dict:
+        rows = db.session.query(BackgroundJob.status, func.count(BackgroundJob.id)) \
+            .group_by(BackgroundJob.status).all()
+        return {status: count for status, count in rows}
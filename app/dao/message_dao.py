@@ -1,10 +1,47 @@
 import uuid
 import numpy as np
-from typing import List, Optional
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert
 
-from app.models import Message
+from app.models import Message, Session
+from app.models.db import db
 from app.dao.base import BaseDAO
 
+# 거리 함수 이름 → pgvector Comparator 메서드
+DISTANCE_METRICS = {
+    "l2": "l2_distance",
+    "cosine": "cosine_distance",
+    "inner_product": "max_inner_product",
+}
+
+
+@contextmanager
+def _local_settings(settings: Dict[str, str]):
+    """
+    블록 안의 쿼리에만 Postgres 설정을 적용합니다.
+    SET LOCAL은 트랜잭션이 끝날 때까지 유지되므로, 블록이 끝나면 이전 값으로 되돌려
+    같은 트랜잭션의 이후 쿼리(다른 테이블 포함)에 영향을 주지 않게 합니다.
+    """
+    previous = {}
+    for name, value in settings.items():
+        previous[name] = db.session.execute(
+            text("SELECT current_setting(:name, true)"), {"name": name}).scalar()
+        db.session.execute(text("SELECT set_config(:name, :value, true)"),
+                           {"name": name, "value": str(value)})
+    try:
+        yield
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                db.session.execute(text(f"RESET {name}"))
+            else:
+                db.session.execute(text("SELECT set_config(:name, :value, true)"),
+                                   {"name": name, "value": value})
+
+
 class MessageDAO(BaseDAO[Message]):
     """Data Access Object for Message model"""
     
@@ -19,21 +56,49 @@ class MessageDAO(BaseDAO[Message]):
         """Get all messages in a session ordered by timestamp"""
         return self.query().filter_by(session_id=session_id).order_by(Message.timestamp.asc()).all()
     
-    def get_similar_pgvector(self, user_id, query_vector, top_k=5):
+    def get_similar_pgvector(self, user_id, query_vector, top_k=5,
+                             ef_search: Optional[int] = None, exact: bool = False,
+                             iterative_scan: Optional[str] = None, metric: str = "l2",
+                             max_distance: Optional[float] = None) -> List[Tuple[Message, float]]:
         """
-        [PGVECTOR] user_id의 메시지 중 query_vector와 가장 유사한 top_k 메시지 반환
+        [PGVECTOR] user_id의 메시지 중 query_vector와 가장 유사한 top_k 메시지를 (메시지, 거리) 쌍으로 반환
         (pgvector 연산자 사용, DB에서 직접 유사도 계산)
+
+        - metric: l2 | cosine | inner_product (inner_product는 pgvector 규약대로 음의 내적을 거리로 사용)
+          HNSW 인덱스는 vector_l2_ops로 만들어지므로 l2일 때만 사용됩니다.
+        - max_distance: 이 거리보다 먼 메시지는 제외
+        - ef_search: 이번 쿼리에만 적용할 hnsw.ef_search (클수록 recall↑, 지연↑)
+        - iterative_scan: hnsw.iterative_scan (relaxed_order | strict_order, pgvector 0.8 이상)
+          user_id 필터는 HNSW 탐색 후에 적용되므로, 여러 사용자의 메시지가 섞인 테이블에서는
+          ef_search개 후보 중 이 사용자의 메시지가 top_k보다 적을 수 있음 → 탐색을 이어서 top_k를 채움
+        - exact: 인덱스를 쓰지 않고 정확한 전체 스캔으로 계산 (recall 비교/디버깅용)
+        ef_search/iterative_scan/exact 설정은 이 쿼리에만 적용되고, 끝나면 이전 값으로 되돌립니다.
         """
         if isinstance(query_vector, np.ndarray):
             query_vector = query_vector.tolist()
-        return (
-            self.query()
+        if metric not in DISTANCE_METRICS:
+            raise ValueError(f"Unsupported distance metric: {metric}")
+        settings = {}
+        if exact:
+            settings["enable_indexscan"] = "off"
+        else:
+            if ef_search:
+                settings["hnsw.ef_search"] = int(ef_search)
+            if iterative_scan and iterative_scan != "off":
+                settings["hnsw.iterative_scan"] = iterative_scan
+
+        distance = getattr(Message.vector, DISTANCE_METRICS[metric])(query_vector).label("distance")
+        query = (
+            db.session.query(Message, distance)
             .filter(Message.user_id == user_id)
             .filter(Message.vector != None)
-            .order_by(Message.vector.l2_distance(query_vector))  # 또는 .cosine_distance(query_vector)
-            .limit(top_k)
-            .all()
         )
+        if max_distance is not None:
+            query = query.filter(distance <= max_distance)
+        with _local_settings(settings):
+            rows = query.order_by(distance).limit(top_k).all()
+        # relaxed_order는 결과 순서가 조금 어긋날 수 있으므로 거리순으로 다시 정렬
+        return sorted(((msg, float(dist)) for msg, dist in rows), key=lambda row: row[1])
 
     def get_keyword_pgvector(self, user_id, query_vector, top_k=5):
         """
@@ -50,6 +115,49 @@ class MessageDAO(BaseDAO[Message]):
             .all()
         )
 
+    def count_by_user_id(self, user_id: Optional[uuid.UUID] = None) -> int:
+        """사용자의 메시지 수를 반환합니다. (user_id가 없으면 전체)"""
+        query = self.query()
+        if user_id:
+            query = query.filter(Message.user_id == user_id)
+        return query.count()
+
+    def count_missing_vectors(self, user_id: Optional[uuid.UUID] = None) -> int:
+        """벡터가 비어 있는 메시지 수를 반환합니다."""
+        query = self.query().filter(Message.vector == None)
+        if user_id:
+            query = query.filter(Message.user_id == user_id)
+        return query.count()
+
+    def get_missing_vector_page(self, user_id: Optional[uuid.UUID] = None,
+                                after_id: Optional[uuid.UUID] = None,
+                                limit: int = 500) -> List[Tuple[uuid.UUID, str]]:
+        """
+        벡터가 비어 있는 메시지의 (id, content)를 id 순으로 limit개씩 반환합니다.
+        after_id 이후부터 조회하는 keyset 페이지네이션이라 전체 이력을 메모리에 올리지 않습니다.
+        """
+        query = (
+            db.session.query(Message.id, Message.content)
+            .filter(Message.vector == None)
+        )
+        if user_id:
+            query = query.filter(Message.user_id == user_id)
+        if after_id:
+            query = query.filter(Message.id > after_id)
+        return query.order_by(Message.id.asc()).limit(limit).all()
+
+    def bulk_update_vectors(self, vectors: Dict[uuid.UUID, list]) -> int:
+        """여러 메시지의 벡터를 한 번의 bulk UPDATE로 저장하고 갱신된 행 수를 반환합니다."""
+        if not vectors:
+            return 0
+        rows = [
+            {"id": message_id, "vector": vector.tolist() if isinstance(vector, np.ndarray) else vector}
+            for message_id, vector in vectors.items()
+        ]
+        db.session.execute(update(Message), rows)
+        db.session.commit()
+        return len(rows)
+
     def create(self, session_id: uuid.UUID, user_id: uuid.UUID, 
                       content: str, role: str, vector=None, metadata=None,
                       keyword_text=None, keyword_vector=None) -> Message:
@@ -63,4 +171,52 @@ class MessageDAO(BaseDAO[Message]):
             message_metadata=metadata,
             keyword_text=keyword_text,
             keyword_vector=keyword_vector
-        )
\ No newline at end of file
+        )
+
+    def bulk_create(self, session_id: uuid.UUID, user_id: uuid.UUID,
+                    messages: List[Dict[str, Any]]) -> List[Message]:
+        """
+        한 턴의 메시지들을 하나의 트랜잭션에서 multi-row INSERT로 저장합니다.
+        세션 검증은 한 번만 수행하며, 각 메시지의 timestamp가 있으면 그대로 사용해 순서를 보존합니다.
+        같은 세션에 이미 있는 idempotency_key는 건너뛰므로(ON CONFLICT DO NOTHING) 실제 저장된 메시지만 반환합니다.
+        messages 항목: {"content", "role", "vector"?, "metadata"?, "timestamp"?, "idempotency_key"?}
+        """
+        if not messages:
+            return []
+
+        session = db.session.get(Session, session_id)
+        if not session:
+            raise ValueError('Session not found')
+        if session.finish_at:
+            raise ValueError('Cannot add message to finished session')
+
+        rows = []
+        for msg in messages:
+            timestamp = msg.get("timestamp") or datetime.now(timezone.utc)
+            if isinstance(timestamp, str):
+                timestamp = datetime.fromisoformat(timestamp)
+            vector = msg.get("vector")
+            rows.append({
+                "id": uuid.uuid4(),
+                "session_id": session_id,
+                "user_id": user_id,
+                "content": msg.get("content"),
+                "role": msg["role"],
+                "timestamp": timestamp,
+                "vector": vector.tolist() if isinstance(vector, np.ndarray) else vector,
+                "message_metadata": msg.get("metadata"),
+                "idempotency_key": msg.get("idempotency_key")
+            })
+
+        stmt = (
+            insert(Message)
+            .on_conflict_do_nothing(index_elements=["session_id", "idempotency_key"])
+            .returning(Message)
+        )
+        try:
+            created = db.session.scalars(stmt, rows).all()
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return created
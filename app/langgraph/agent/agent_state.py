@@ -23,6 +23,7 @@ class AgentState:
     current_tool_call_id: Optional[str] = None  # 현재 실행 중인 도구의 ID
     current_tool_name: Optional[str] = None  # 현재 실행 중인 도구의 이름
     current_tool_calls: Optional[List[Dict]] = None  # 현재 tool_calls 목록
+    turn_context: Optional[Dict] = None  # 턴 단위로 한 번만 조회하는 사용자 정보/검색 결과 캐시
 
     def __post_init__(self):
         """dataclass 초기화 이후 호출되는 메서드"""
@@ -2,13 +2,18 @@
 import json
 import logging
 import os
+import time
 import pytz
-from typing import Dict, List, Any, Union
+from typing import Dict, List, Any, Optional, Union
+from flask import has_app_context
 from langchain_core.messages import AIMessage, ToolMessage, BaseMessage, HumanMessage
 from langchain_core.tools import BaseTool
 from datetime import datetime
 
-from app.utils.openai_client import init_langchain_llm
+from app.utils.openai_client import init_langchain_llm, get_tool_bound_llm
+from app.utils.app_config import get_vector_search_config
+from app.utils.background_executor import BackgroundExecutor
+from app.utils import metrics
 from app.utils.message.converter import convert_to_openai_messages
 from app.utils.message.formatter import format_message_content, format_message_list
 from app.services.user_service import UserService
@@ -16,8 +21,11 @@ from ...tools import agent_tools
 from ..agent_state import AgentState
 from ....utils.prompt.agent_prompt import prompt
 
-# 도구가 바인딩된 모델 초기화
-global_model = init_langchain_llm(agent_tools)
+# 도구 바인딩 전의 기본 모델 (도구 바인딩은 get_tool_bound_llm에서 캐시)
+global_model = init_langchain_llm()
+
+# 과거 대화 검색을 사용자 조회와 동시에 실행하기 위한 스레드 풀
+_executor = BackgroundExecutor("call-model", max_workers=4)
 
 # 로그 디렉토리 설정
 LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'logs')
@@ -65,15 +73,66 @@ def format_tool_results(tool_results: List[Any]) -> Dict:
         formatted_output["stdout"] = f"Error formatting tool results: {str(e)}"
         return formatted_output
 
+def _latest_human_message(messages: List[BaseMessage]) -> str:
+    """가장 최근 사용자 메시지 내용을 반환합니다. (도구 루프 중에는 마지막 메시지가 ToolMessage/AIMessage임)"""
+    for msg in reversed(messages):
+        if isinstance(msg, HumanMessage):
+            return msg.content
+    return ""
+
+
+def _search_memory(user_id: str, query: str) -> list:
+    """과거 대화를 검색합니다. (_executor 워커 스레드에서 현재 앱 컨텍스트로 실행)"""
+    from app.services.message_service import MessageService
+    with metrics.timer("call_model.retrieval_ms"):
+        # 관련도가 낮은 과거 대화는 프롬프트에 넣지 않음 (토큰 절약)
+        return MessageService().search_similar_messages_pgvector(
+            user_id=user_id,
+            query=query,
+            top_k=3,
+            min_score=get_vector_search_config()['min_score']
+        )
+
+
+def _load_turn_context(user_id, messages: List[BaseMessage], cached: Optional[Dict]) -> Dict:
+    """
+    사용자 이름과 과거 대화 검색 결과를 턴마다 한 번만 조회합니다.
+    검색(임베딩 + pgvector)은 워커 스레드에서, 사용자 조회는 현재 스레드에서 동시에 실행하며
+    같은 사용자 입력에 대한 결과가 state에 있으면 도구 루프에서 그대로 재사용합니다.
+    """
+    query = _latest_human_message(messages)
+    if cached and cached.get("query") == query:
+        metrics.increment("call_model.turn_context.reused")
+        return cached
+
+    with metrics.timer("call_model.turn_context_ms"):
+        future = None
+        if user_id and query and has_app_context():
+            future = _executor.submit(_search_memory, str(user_id), query)
+
+        with metrics.timer("call_model.user_lookup_ms"):
+            user = UserService().get_user_by_id(user_id)
+
+        search_results = []
+        if future is not None:
+            try:
+                search_results = future.result()
+            except Exception as e:
+                # 검색 실패는 응답 생성을 막지 않음
+                log.warning(f"[CallModel] Memory retrieval failed: {e}")
+
+    return {
+        "query": query,
+        "user_name": user["username"] if user else None,
+        "search_results": search_results
+    }
+
+
 def call_model(state: Union[Dict, AgentState], mcp_tools: List[BaseTool]) -> Union[Dict, AgentState]:
     """LLM을 호출하고 응답을 생성하는 노드."""
-    user_service = UserService()
     try:
         # state가 dict인지 AgentState인지 확인
         is_dict = isinstance(state, dict)
-        user = user_service.get_user_by_id(
-            state["user_id"] if is_dict else state.user_id)
-        user_name = user["username"] if user else None
         # 기본 state 구조 확인 및 초기화
         if is_dict:
             messages = state["messages"]
@@ -81,23 +140,22 @@ def call_model(state: Union[Dict, AgentState], mcp_tools: List[BaseTool]) -> Uni
             summary = state.get("summary")
             user_id = state.get("user_id")
             user_memory = state.get("user_memory", "")
+            cached_context = state.get("turn_context")
         else:
             messages = state.messages
             user_location = state.user_location
             summary = state.summary
             user_id = state.user_id
             user_memory = state.user_memory or ""
+            cached_context = state.turn_context
 
-        search_results = []
-        if messages and user_id:
-            from app.services.message_service import MessageService
-            message_service = MessageService()
-            latest_message = messages[-1].content if messages else ""
-            search_results = message_service.search_similar_messages_pgvector(
-                user_id=str(user_id),
-                query=latest_message,
-                top_k=3
-            )
+        turn_context = _load_turn_context(user_id, messages, cached_context)
+        if is_dict:
+            state["turn_context"] = turn_context
+        else:
+            state.turn_context = turn_context
+        user_name = turn_context["user_name"]
+        search_results = turn_context["search_results"]
 
         # 이전 도구 실행 결과 처리
         tool_results = state.get("tool_results") if is_dict else getattr(state, "tool_results", None)
@@ -144,6 +202,7 @@ def call_model(state: Union[Dict, AgentState], mcp_tools: List[BaseTool]) -> Uni
             
         current_date = datetime.now(pytz.timezone('Asia/Seoul')).strftime("%Y년 %m월 %d일")
         # LLM에 전달할 메시지 포맷팅
+        prompt_started = time.perf_counter()
         formatted_messages = prompt.format_messages(
             messages=messages,
             user_name=user_name,
@@ -156,12 +215,14 @@ def call_model(state: Union[Dict, AgentState], mcp_tools: List[BaseTool]) -> Uni
         
         # OpenAI 형식으로 메시지 변환
         openai_messages = convert_to_openai_messages(formatted_messages)
+        metrics.observe("call_model.prompt_ms", (time.perf_counter() - prompt_started) * 1000)
         
         try:
-            # 전역 변수와 충돌하지 않도록 다른 변수명 사용
-            bound_llm = global_model.bind_tools(mcp_tools + agent_tools)
+            # 같은 도구 목록이면 이전에 바인딩한 모델을 재사용
+            bound_llm = get_tool_bound_llm(global_model, mcp_tools + agent_tools)
             # LangChain 모델 호출
-            response = bound_llm.invoke(openai_messages)
+            with metrics.timer("call_model.llm_ms"):
+                response = bound_llm.invoke(openai_messages)
             
             # tool_calls 확인 및 처리
             has_tool_calls = (
@@ -3,6 +3,7 @@ from typing import Dict, Union
 import logging
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 from ..agent_state import AgentState
+from app.utils.agent_state_store import AGENT_MESSAGE_WINDOW
 
 # cleanup 로거 설정
 log = logging.getLogger(__name__)
@@ -82,7 +83,7 @@ def cleanup_node(state: Union[Dict, AgentState]) -> Union[Dict, AgentState]:
     state["step_count"] = 0
     
     # summarize 체크
-    if len(cleaned_messages) >= 6:
+    if len(cleaned_messages) >= AGENT_MESSAGE_WINDOW:
         if is_dict:
             state["next_step"] = "summarize"
         else:
@@ -1,5 +1,6 @@
 from app.langgraph.agent.agent_state import AgentState
 from app.utils.openai_client import get_completion
+from app.utils.agent_state_store import AGENT_MESSAGE_WINDOW
 from langchain_core.messages import BaseMessage, HumanMessage, RemoveMessage, AIMessage
 import logging
 from typing import Dict, List, Union
@@ -15,9 +16,9 @@ def delete_message(state: Union[Dict, AgentState]) -> List[BaseMessage]:
     else:
         messages = getattr(state, "messages", [])
 
-    if len(messages) > 6:
-        # 마지막 6개 메시지만 유지
-        return messages[-6:]
+    if len(messages) > AGENT_MESSAGE_WINDOW:
+        # 마지막 AGENT_MESSAGE_WINDOW개 메시지만 유지 (AgentStateStore도 같은 개수만 보관)
+        return messages[-AGENT_MESSAGE_WINDOW:]
     return messages
 
 
@@ -35,7 +36,7 @@ def summarize_node(state: Union[Dict, AgentState]) -> Union[Dict, AgentState]:
             summary = getattr(state, "summary", "")
             messages = getattr(state, "messages", [])
 
-        messages_to_summarize = messages[:-6] if len(messages) > 6 else []
+        messages_to_summarize = messages[:-AGENT_MESSAGE_WINDOW] if len(messages) > AGENT_MESSAGE_WINDOW else []
         messages_content = "\n".join([
             f"{'사용자' if isinstance(msg, HumanMessage) else 'AI'}: {msg.content}" 
             for msg in messages_to_summarize
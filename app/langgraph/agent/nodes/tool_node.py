@@ -3,6 +3,7 @@ from typing import List, Dict, Set
 from langchain_core.messages import BaseMessage, FunctionMessage, AIMessage, ToolMessage
 from langchain_core.tools import BaseTool
 from app.langgraph.agent.agent_state import AgentState
+from app.utils.tool_cache import tool_result_cache
 
 import logging
 log = logging.getLogger("langgraph_debug")
@@ -129,15 +130,22 @@ def call_tool(state: AgentState, tools: List[BaseTool], mcp_tools: List[BaseTool
                 elif tool:
                     # 일반 도구도 동기적으로 실행
                     import asyncio
-                    try:
-                        loop = asyncio.get_event_loop()
-                        result = loop.run_until_complete(tool.ainvoke(arguments))
-                    except RuntimeError:
-                        # 새로운 이벤트 루프 생성
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        result = loop.run_until_complete(tool.ainvoke(arguments))
-                        loop.close()
+
+                    def run_tool():
+                        try:
+                            loop = asyncio.get_event_loop()
+                            return loop.run_until_complete(tool.ainvoke(arguments))
+                        except RuntimeError:
+                            # 새로운 이벤트 루프 생성
+                            loop = asyncio.new_event_loop()
+                            asyncio.set_event_loop(loop)
+                            try:
+                                return loop.run_until_complete(tool.ainvoke(arguments))
+                            finally:
+                                loop.close()
+
+                    # 검색 도구처럼 캐시 가능한 도구는 같은 입력의 결과를 재사용
+                    result = tool_result_cache.get_or_call(function_name, arguments, run_tool)
                     
                     # 도구 실행 결과를 state에 저장
                     state["tool_results"] = result
@@ -27,6 +27,7 @@ class TaskRuntime(TypedDict, total=False):
 
 class BGState(TypedDict):
     user_id: uuid.UUID                     # user_id
+    task_id: Optional[uuid.UUID]           # 실행할 AutoTask id (스케줄러가 지정, 없으면 다음 업무를 선택)
     task: Optional[TaskRuntime]
     last_completed_title: Optional[str]
     error: Optional[str]
@@ -1,4 +1,4 @@
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, Optional
 from .bg_state import BGState
 from .graph import build_background_graph
 import uuid
@@ -7,10 +7,11 @@ def create_background_executor() -> Callable:
     graph = build_background_graph()
     compiled_graph = graph.compile()
 
-    def invoke(user_id: uuid.UUID) -> Dict[str, Any]:
+    def invoke(user_id: uuid.UUID, task_id: Optional[uuid.UUID] = None) -> Dict[str, Any]:
 
         state = BGState(
             user_id=user_id,
+            task_id=task_id,
             task=None,
             last_completed_title=None,
             error=None,
@@ -0,0 +1,113 @@
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from typing import Callable, List, Optional
+from app.langgraph.background.bg_state import BGState, PlanStep, TaskRuntime
+from app.langgraph.background.nodes.run_tool import execute_step
+from app.langgraph.background.nodes.evaluate_step import evaluate_step_result
+from app.services.auto_task_service import AutoTaskService
+from app.utils.app_config import get_background_config
+from app.utils.auto_task_utils import get_current_step_message
+from app.utils.background_executor import BackgroundExecutor
+
+auto_task_service = AutoTaskService()
+
+_executor: Optional[BackgroundExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> BackgroundExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BackgroundExecutor(
+                    "plan-step", max_workers=get_background_config()['max_parallel_steps'])
+    return _executor
+
+
+def ready_step_ids(task: TaskRuntime) -> List[str]:
+    """depends_on이 모두 완료된 pending Step id를 ready_queue(위상 정렬) 순서대로 반환한다."""
+    plan = task.get("plan", {})
+    completed = set(task.get("completed_ids", []))
+    return [
+        step_id for step_id in task.get("ready_queue", [])
+        if plan[step_id].get("status") == "pending"
+        and all(dep in completed for dep in plan[step_id].get("depends_on", []))
+    ]
+
+
+def run_plan(task: TaskRuntime, submit: Callable[[str], Future], max_parallel: int,
+             on_status: Callable[[PlanStep], None] = lambda step: None) -> Optional[str]:
+    """
+    실행 가능한 Step을 최대 max_parallel개까지 동시에 실행하는 DAG 스케줄러.
+    - Step 하나가 끝날 때마다 평가(evaluate_step_result)하고, 그 결과로 새로 실행 가능해진 Step을 바로 실행한다.
+    - 재시도가 필요한 Step(pending)은 다시 실행하고, 실패한 Step이 생기면 새 Step은 시작하지 않고 실행 중인 Step만 기다린다.
+    실패한 경우 에러 메시지를, 아니면 None을 반환한다.
+    """
+    plan = task["plan"]
+    running = {}
+    error = None
+
+    while True:
+        if error is None:
+            for step_id in ready_step_ids(task):
+                if len(running) >= max_parallel:
+                    break
+                plan[step_id]["status"] = "running"
+                on_status(plan[step_id])
+                running[submit(step_id)] = step_id
+
+        if not running:
+            return error
+
+        done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+        for future in done:
+            step_id = running.pop(future)
+            try:
+                step = future.result()
+            except Exception as e:
+                step = plan[step_id]
+                step["status"] = "failed"
+                step["output"] = {"error": str(e)}
+            plan[step_id] = step
+
+            step_error = evaluate_step_result(task, step)
+            on_status(step)
+            if step_error and error is None:
+                error = step_error
+
+
+def run_ready_steps(state: BGState) -> BGState:
+    """
+    plan의 Step들을 의존 관계에 따라 병렬로 실행한다.
+    서로 의존하지 않는 Step은 동시에 실행되므로 Task 실행 시간은 가장 긴 의존 경로(critical path)에 가까워진다.
+    """
+    task = state.get("task")
+    if not task:
+        state["error"] = "No task initialized"
+        state["finished"] = True
+        state["step"] = None
+        return state
+
+    plan = task.get("plan", {})
+    history = state.get("current_step", [])
+    executor = _get_executor()
+
+    def submit(step_id: str) -> Future:
+        return executor.submit(execute_step, plan[step_id], plan)
+
+    def on_status(step: PlanStep):
+        history.append(get_current_step_message(step.get("tool"), step.get("status")))
+        print(f"[DEBUG][run_ready_steps] current_step update: history={history}")
+        # 평가가 끝난 상태(done/pending/failed)만 DB에 기록
+        if step.get("status") != "running":
+            auto_task_service.update(str(task["task_id"]), current_step=history)
+
+    error = run_plan(task, submit, get_background_config()['max_parallel_steps'], on_status)
+    if error:
+        state["error"] = error
+
+    state["current_step"] = history
+    state["task"] = task
+    state["step"] = None
+    return state
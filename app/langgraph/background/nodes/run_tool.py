@@ -1,31 +1,19 @@
-from typing import Tuple, Dict, Any
-from app.langgraph.background.bg_state import BGState, PlanStep
+from typing import Dict, Any
+from app.langgraph.background.bg_state import PlanStep
 from app.langgraph.background.planners.tool_registry import get_tool_by_name
 from app.langgraph.background.planners.format_tool_input import format_tool_input
 from app.utils.summarize_output import gpt_summarize_output
+from app.utils.tool_cache import tool_result_cache
 import re
 
 # auto_task_service = AutoTaskService()
 # auto_task_dao = AutoTaskDAO()
 
-def run_tool(state: BGState) -> BGState:
+def execute_step(step: PlanStep, plan: Dict[str, PlanStep]) -> PlanStep:
     """
-    주어진 PlanStep에 해당하는 tool을 실행하고 결과를 PlanStep에 저장한다.
-    실행 결과는 step["output"]에 저장하며, 성공 여부에 따라 status를 변경한다.
+    PlanStep 하나의 tool을 실행하고 결과를 step["output"]에 저장한다.
+    선행 Step의 output만 읽으므로, 의존 관계가 없는 Step끼리는 다른 스레드에서 동시에 실행할 수 있다.
     """
-    step = state.get("step")
-    task = state.get("task")
-
-    if not step:
-        state["error"] = "No step found"
-        state["finished"] = True
-        return state
-
-    if not task:
-        state["error"] = "No task found"
-        state["finished"] = True
-        return state
-
     try:
         tool_name = step.get("tool")
         if not tool_name:
@@ -37,7 +25,6 @@ def run_tool(state: BGState) -> BGState:
             raise ValueError(f"Tool '{tool_name}' is not allowed or not found")
 
         # 선행 Step의 output → prior_outputs
-        plan = task.get("plan", {})
         prior_outputs: Dict[str, Any] = {}
         for dep_id in step.get("depends_on", []):
             dep_step = plan.get(dep_id)
@@ -61,11 +48,13 @@ def run_tool(state: BGState) -> BGState:
         step["tool_input"] = tool_input
         print(f"[run_tool] tool: {tool_name}, input: {tool_input}")
 
-        # 도구 실행
+        # 도구 실행 (Step 재시도 등으로 같은 입력이 반복되면 캐시된 결과를 재사용)
         if hasattr(tool_fn, "invoke"):
-            result = tool_fn.invoke(tool_input)
+            result = tool_result_cache.get_or_call(
+                tool_name, tool_input, lambda: tool_fn.invoke(tool_input))
         else:
-            result = tool_fn(**tool_input)
+            result = tool_result_cache.get_or_call(
+                tool_name, tool_input, lambda: tool_fn(**tool_input))
 
         # 결과 요약 후 저장
         step["output"] = gpt_summarize_output(
@@ -79,13 +68,6 @@ def run_tool(state: BGState) -> BGState:
     except Exception as e:
         print(f"[run_tool] Error: {e}")
         step["status"] = "failed"
-
         step["output"] = {"error": str(e)}
-        state["error"] = f"[{step['step_id']}] {str(e)}"
-
-    # 상태 반영
-    task["plan"][step["step_id"]] = step
-    state["task"] = task
-    state["step"] = step
 
-    return state
+    return step
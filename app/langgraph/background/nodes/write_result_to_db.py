@@ -24,6 +24,17 @@ def write_result_to_db(state: BGState) -> BGState:
     finish_at = task.get("finish_at", datetime.now(timezone.utc))
     print(f"[DEBUG][write_result_to_db] task_id: {task_id}, title: {title}, result: {result}, finish_at: {finish_at}")
 
+    if not result:
+        # Step 실패 등으로 결과가 없으면 선점(doing)을 풀어 다음 실행 때 다시 시도
+        try:
+            auto_task_service.release_task(task_id)
+        except Exception as e:
+            print(f"[DEBUG][write_result_to_db] release_task 예외: {e}")
+        state["error"] = state.get("error") or f"Task {title} finished without result"
+        state["task"] = task
+        state["finished"] = True
+        return state
+
     result_str = json.dumps(result, ensure_ascii=False)
 
     # NOTE : DB에 저장 (테스트용), 변경 예정 (+ auto_task_service)
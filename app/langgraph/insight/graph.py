@@ -1,9 +1,13 @@
 """
 인사이트 생성용 LangGraph 전체 워크플로우 정의
 """
+import time
 from langgraph.graph import Graph, END, START
+from app.utils import metrics
+from .parallel import parallel_node
 from .nodes.keyword_extractor import extract_top_keywords
 from .nodes.web_search import search_web_for_keywords
+from .nodes.news_dedup import dedupe_news
 from .nodes.document_loader import load_documents
 from .nodes.relation_analyzer import analyze_relations
 from .nodes.related_news_search import search_related_news
@@ -11,11 +15,16 @@ from .nodes.insight_generator import generate_insight
 from .nodes.title_tags_generator import generate_title_tags
 from .nodes.tts_script_generator import generate_tts_script
 
-# 노드 실행 래퍼
+# 노드 실행 래퍼 (노드별 실행 시간을 insight.node.<name>_ms 메트릭으로 기록)
 def log_node(node_name, func):
     def wrapper(context):
-        result = func(context)
-        return result
+        started = time.perf_counter()
+        try:
+            return func(context)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            metrics.observe(f"insight.node.{node_name}_ms", elapsed_ms)
+            print(f"[InsightGraph] {node_name}: {elapsed_ms:.0f}ms")
     return wrapper
 
 def build_insight_graph():
@@ -30,17 +39,22 @@ def build_insight_graph():
 
     graph.add_node("extract_keywords", log_node("extract_keywords", start_node))
     graph.add_node("search_web", log_node("search_web", search_web_for_keywords))
+    graph.add_node("dedupe_news", log_node("dedupe_news", dedupe_news))
     graph.add_node("load_docs", log_node("load_docs", load_documents))
     graph.add_node("analyze_relations", log_node("analyze_relations", analyze_relations))
     graph.add_node("search_related_news", log_node("search_related_news", search_related_news))
     graph.add_node("generate_insight", log_node("generate_insight", generate_insight))
-    graph.add_node("generate_title_tags", log_node("generate_title_tags", generate_title_tags))
-    graph.add_node("generate_tts_script", log_node("generate_tts_script", generate_tts_script))
+    # 제목/태그와 TTS 스크립트는 모두 인사이트 본문만 입력으로 쓰므로 동시에 생성한 뒤 합침
+    graph.add_node("generate_title_tags_and_tts", log_node("generate_title_tags_and_tts", parallel_node(
+        log_node("generate_title_tags", generate_title_tags),
+        log_node("generate_tts_script", generate_tts_script)
+    )))
 
-    # 엣지 연결: 1 → 2 → 3 → 4 → (조건부) 2 or 5 → 6 → 7 → 8 → END
+    # 엣지 연결: 1 → 2 → (중복 제거) → 3 → 4 → (조건부) 2 or 5 → 6 → 7+8(동시 실행) → END
     graph.add_edge(START, "extract_keywords")
     graph.add_edge("extract_keywords", "search_web")
-    graph.add_edge("search_web", "load_docs")
+    graph.add_edge("search_web", "dedupe_news")
+    graph.add_edge("dedupe_news", "load_docs")
     graph.add_edge("load_docs", "analyze_relations")
 
     def analyze_conditional(context):
@@ -61,8 +75,7 @@ def build_insight_graph():
         }
     )
     graph.add_edge("search_related_news", "generate_insight")
-    graph.add_edge("generate_insight", "generate_title_tags")
-    graph.add_edge("generate_title_tags", "generate_tts_script")
-    graph.add_edge("generate_tts_script", END)
+    graph.add_edge("generate_insight", "generate_title_tags_and_tts")
+    graph.add_edge("generate_title_tags_and_tts", END)
 
     return graph
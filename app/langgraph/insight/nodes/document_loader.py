@@ -1,55 +1,61 @@
+import re
+from app.langgraph.insight.nodes.news_dedup import NEWS_BUCKETS, dedupe_news
+from app.utils import metrics
+from app.utils.document_fetcher import fetch_documents
+from app.utils.packing_summarizer import summarize_documents
+
+
+def clean_text(text):
+    # 연속된 공백 문자를 하나의 공백으로
+    text = re.sub(r'\s+', ' ', text)
+    # 연속된 줄바꿈을 하나의 줄바꿈으로
+    text = re.sub(r'\n\s*\n', '\n', text)
+    # 양쪽 공백 제거
+    text = text.strip()
+    return text
+
+
 def load_documents(context):
-    from langchain_community.document_loaders import WebBaseLoader
-    from app.utils.openai_client import get_completion
-    import re
     """
     최근 뉴스와 과거 뉴스 각각의 링크에서 본문을 로딩하고 요약
     context['recent_news'], context['past_news'] 필요
     context['recent_news_docs'], context['past_news_docs']에 결과 저장
+
+    dedupe_news가 묶어 둔 고유 문서(context['news_documents'])만 한 번에 비동기로 가져오고(URL 캐시/호스트별 동시 요청 제한),
+    요약은 여러 기사를 토큰 예산만큼 묶어 한 번에 요청하고(packing summarizer),
+    본문 해시 기준으로 캐시해 같은 기사를 여러 사용자가 공유해도 한 번만 요약한 뒤
+    context['news_refs']에 따라 각 버킷으로 나눠 담는다.
     """
-    def clean_text(text):
-        # 연속된 공백 문자를 하나의 공백으로
-        text = re.sub(r'\s+', ' ', text)
-        # 연속된 줄바꿈을 하나의 줄바꿈으로
-        text = re.sub(r'\n\s*\n', '\n', text)
-        # 양쪽 공백 제거
-        text = text.strip()
-        return text
-        
-    def load_news_docs(news_dict):
-        docs = []
-        for results in news_dict.values():
-            for r in results:
-                url = r.get('link')
-                if url:
-                    try:
-                        # 웹 페이지 로딩
-                        loader = WebBaseLoader(url)
-                        loaded = loader.load()
-                        
-                        # 본문 내용 정리 및 요약
-                        if loaded:
-                            # 불필요한 공백과 줄바꿈 정리
-                            news_text = clean_text(loaded[0].page_content)
-                            messages = [
-                                {"role": "system", "content": "아래 뉴스들을 간단히 요약해주세요."},
-                                {"role": "user", "content": news_text}
-                            ]
-                            summary = get_completion(messages)
-                            # 요약문도 정리
-                            summary = clean_text(summary)
-                            loaded[0].page_content = summary
-                            docs.extend(loaded)
-                    except Exception as e:
-                        print(f"Error processing URL {url}: {str(e)}")
-                        continue
-        return docs
-
-    context['recent_news_docs'] = load_news_docs(context.get('recent_news', {}))
-    context['past_news_docs'] = load_news_docs(context.get('past_news', {}))
-    
+    from langchain_core.documents import Document
+
+    if 'news_documents' not in context:
+        context = dedupe_news(context)
+    documents = context['news_documents']
+
+    with metrics.timer("insight.load_documents.fetch_ms"):
+        pages = fetch_documents([doc['url'] for doc in documents])
+    texts = {
+        url: clean_text(page['text'])
+        for url, page in pages.items() if page and page.get('text', '').strip()
+    }
+    with metrics.timer("insight.load_documents.summarize_ms"):
+        summaries = summarize_documents(list(texts.values()))
+
+    loaded = []
+    for doc in documents:
+        summary = summaries.get(texts.get(doc['url']))
+        loaded.append(Document(
+            page_content=summary,
+            metadata={"source": doc['url'], "title": pages[doc['url']].get('title') or doc['title']}
+        ) if summary else None)
+
+    for bucket in NEWS_BUCKETS:
+        context[f"{bucket}_docs"] = [
+            loaded[index] for index in context['news_refs'].get(bucket, []) if loaded[index] is not None
+        ]
+
     # 보조 안전장치: source가 없으면 빈 리스트로
     if 'source' not in context or context['source'] is None:
         context['source'] = []
-        
+
     return context
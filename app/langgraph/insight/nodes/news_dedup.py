@@ -0,0 +1,128 @@
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from app.utils import metrics
+
+NEWS_BUCKETS = ("recent_news", "past_news")
+
+# 기사 내용과 무관한 추적/공유용 쿼리 파라미터
+_TRACKING_PARAMS = {"fbclid", "gclid", "dclid", "msclkid", "igshid", "mc_cid", "mc_eid",
+                    "ref", "ref_src", "referrer", "cmpid", "ocid", "spm", "amp", "outputtype"}
+_TRACKING_PREFIXES = ("utm_",)
+# 모바일/AMP 전용 호스트 접두사 (m.news.example.com → news.example.com)
+_MOBILE_HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+_AMP_PATH = re.compile(r"(/amp)+/?$|/amp(?=/)", re.IGNORECASE)
+
+_TITLE_SUFFIX = re.compile(r"\s+[-|:｜]\s+[^-|:｜]{1,30}$")
+_TITLE_NOISE = re.compile(r"[\W_]+", re.UNICODE)
+# 정규화한 제목 유사도가 이 값 이상이면 같은 기사로 봄
+TITLE_SIMILARITY = 0.9
+
+
+def canonicalize_url(url: str) -> str:
+    """추적 파라미터, AMP/모바일 호스트, fragment를 제거해 같은 기사의 URL을 하나로 맞춘다."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    for prefix in _MOBILE_HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    path = _AMP_PATH.sub("", parts.path).rstrip("/") or "/"
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PREFIXES)
+    )
+    return urlunsplit(("https" if parts.scheme in ("http", "https") else parts.scheme,
+                       host, path, urlencode(query), ""))
+
+
+def _is_alternate(url: str) -> bool:
+    """AMP/모바일 버전 주소인지 확인한다."""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host.startswith(("m.", "mobile.", "amp.")) or bool(_AMP_PATH.search(parts.path))
+
+
+def normalize_title(title: str) -> str:
+    """언론사 접미사(' - 연합뉴스'), 특수문자, 공백, 대소문자 차이를 없앤다."""
+    title = unicodedata.normalize("NFC", title or "")
+    title = _TITLE_SUFFIX.sub("", title)
+    return _TITLE_NOISE.sub("", title).lower()
+
+
+def _same_title(a: str, b: str) -> bool:
+    if not a or not b:
+        return False
+    if a == b:
+        return True
+    matcher = SequenceMatcher(None, a, b)
+    # 덧붙거나 빠진 말('종합', '속보' 등)만 있으면 유사도로 판단하고, 바뀐 글자('인상'/'인하' 등)가 있으면 다른 기사로 봄
+    if any(tag == 'replace' for tag, *_ in matcher.get_opcodes()):
+        return False
+    return matcher.ratio() >= TITLE_SIMILARITY
+
+
+def dedupe_news_items(buckets: Dict[str, dict]) -> Tuple[List[dict], Dict[str, List[int]]]:
+    """
+    버킷({keyword: [news item]})별 뉴스를 고유 문서 목록으로 합친다.
+    반환: (고유 문서 목록, 버킷별로 참조하는 문서 index 목록 (처음 등장한 순서, 버킷 내 중복 없음))
+    """
+    documents: List[dict] = []
+    by_url: Dict[str, int] = {}
+    refs: Dict[str, List[int]] = {}
+
+    for bucket, news_dict in buckets.items():
+        refs[bucket] = []
+        for results in (news_dict or {}).values():
+            for item in results if isinstance(results, list) else []:
+                if not isinstance(item, dict) or not item.get('link'):
+                    continue
+                url = item['link']
+                canonical = canonicalize_url(url)
+                title = normalize_title(item.get('title', ''))
+
+                index = by_url.get(canonical)
+                if index is None:
+                    index = next((i for i, doc in enumerate(documents)
+                                  if _same_title(doc['normalized_title'], title)), None)
+                if index is None:
+                    index = len(documents)
+                    documents.append({"url": url, "canonical_url": canonical,
+                                      "title": item.get('title', ''), "normalized_title": title,
+                                      "links": []})
+                doc = documents[index]
+                by_url[canonical] = index
+                doc['links'].append(url)
+                # AMP/모바일 주소보다 원문 주소를 가져오도록 선택
+                if _is_alternate(doc['url']) and not _is_alternate(url):
+                    doc['url'] = url
+                if index not in refs[bucket]:
+                    refs[bucket].append(index)
+
+    return documents, refs
+
+
+def dedupe_news(context):
+    """
+    검색 결과(context['recent_news'], context['past_news'])의 기사를 URL 정규화와 제목 유사도로 묶어
+    context['news_documents'](고유 문서)와 context['news_refs'](버킷별 문서 index)에 저장한다.
+    load_documents는 고유 문서만 한 번씩 가져오고 요약한 뒤 각 버킷으로 다시 나눠 담는다.
+    """
+    documents, refs = dedupe_news_items({bucket: context.get(bucket, {}) for bucket in NEWS_BUCKETS})
+    references = sum(len(doc['links']) for doc in documents)
+    saved = references - len(documents)
+
+    metrics.increment("insight.dedup.references", references)
+    metrics.increment("insight.dedup.unique", len(documents))
+    # 중복 제거 전에는 참조마다 한 번씩 페이지를 가져오고 LLM으로 요약했음
+    metrics.increment("insight.dedup.fetches_saved", saved)
+    metrics.increment("insight.dedup.llm_calls_saved", saved)
+
+    context['news_documents'] = documents
+    context['news_refs'] = refs
+    context['dedup_stats'] = {"references": references, "unique": len(documents), "saved": saved}
+    print(f"[dedupe_news] references={references}, unique={len(documents)}, saved={saved}")
+    return context
@@ -1,6 +1,7 @@
 def search_related_news(context):
     from app.langgraph.tools import google_news
     from app.utils.openai_client import get_completion
+    from app.utils.tool_cache import tool_result_cache
     import re
     """
     연결 키워드로 추가 뉴스 검색 및 요약
@@ -42,7 +43,9 @@ def search_related_news(context):
     
     for keyword in related_keywords:
         try:
-            results = google_news.run(keyword, num_results=3, tbs=None)
+            results = tool_result_cache.get_or_call(
+                "google_news", {"query": keyword, "num_results": 3, "tbs": None},
+                lambda: google_news.run(keyword, num_results=3, tbs=None))
             if isinstance(results, dict) and 'news' in results:
                 news_items = results['news']
                 # 각 뉴스 아이템 정리
@@ -1,37 +1,76 @@
+import threading
+from typing import Optional
+from app.utils import metrics
+from app.utils.app_config import get_search_config
+from app.utils.background_executor import BackgroundExecutor
+
+# 최신 뉴스(recent_news), 과거 뉴스(past_news) 검색 기간
+NEWS_PERIODS = (("recent_news", "qdr:w"), ("past_news", "qdr:m6"))
+
+_executor: Optional[BackgroundExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> BackgroundExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BackgroundExecutor(
+                    "insight-search", max_workers=get_search_config()['insight_workers'])
+    return _executor
+
+
+def _search_news(keyword, tbs):
+    from app.langgraph.tools import google_news
+    from app.utils.tool_cache import tool_result_cache
+    # 같은 키워드는 다른 사용자의 인사이트 생성에서도 반복되므로 캐시를 거쳐 검색
+    return tool_result_cache.get_or_call(
+        "google_news", {"query": keyword, "num_results": 5, "tbs": tbs},
+        lambda: google_news.run(keyword, num_results=5, tbs=tbs))
+
+
 def search_web_for_keywords(context):
-    from app.langgraph.tools import google_news, google_search
     """
     각 키워드별로 최신 뉴스(tbs='qdr:w')와 과거 뉴스(tbs='qdr:m6')를 각각 google_news로 검색
     context['keywords'] 필요, context['recent_news'], context['past_news']에 결과 저장
     추가: 모든 뉴스 링크를 context['source']에 리스트로 저장
+
+    (키워드, 기간) 조합별 검색은 서로 독립적이므로 동시에 실행하고(호출 빈도는 제공자별 레이트 리미터가 제한),
+    결과는 완료 순서와 관계없이 키워드 → 기간 순서로 합친다.
     """
     keywords = context.get('keywords', [])
-    recent_news = {}
-    past_news = {}
+    results = {name: {} for name, _ in NEWS_PERIODS}
     all_links = []
-    for keyword in keywords:
-        try:
-            recent = google_news.run(keyword, num_results=5, tbs="qdr:w")
-            past = google_news.run(keyword, num_results=5, tbs="qdr:m6")
-            # 반환값 구조 로그
+
+    with metrics.timer("insight.search_web_ms"):
+        executor = _get_executor()
+        futures = [
+            (keyword, name, executor.submit(_search_news, keyword, tbs))
+            for keyword in keywords
+            for name, tbs in NEWS_PERIODS
+        ]
+        for keyword, name, future in futures:
+            try:
+                news = future.result()
+            except Exception as e:
+                results[name][keyword] = [{"error": str(e)}]
+                continue
             # news 필드에서 link만 추출
-            if isinstance(recent, dict) and 'news' in recent:
-                all_links.extend([item.get('link') for item in recent['news'] if item.get('link')])
-                recent_news[keyword] = recent['news']
+            if isinstance(news, dict) and 'news' in news:
+                all_links.extend([item.get('link') for item in news['news'] if item.get('link')])
+                results[name][keyword] = news['news']
             else:
-                recent_news[keyword] = recent
-            if isinstance(past, dict) and 'news' in past:
-                all_links.extend([item.get('link') for item in past['news'] if item.get('link')])
-                past_news[keyword] = past['news']
-            else:
-                past_news[keyword] = past
-        except Exception as e:
-            recent_news[keyword] = [{"error": str(e)}]
-            past_news[keyword] = [{"error": str(e)}]
-    # source 누적 방식(중복 제거)
-    prev_links = set(context.get('source', []))
-    all_links = prev_links.union(all_links)
-    context['recent_news'] = recent_news
-    context['past_news'] = past_news
-    context['source'] = list(all_links)
+                results[name][keyword] = news
+
+    # source 누적 방식(중복 제거, 기존 순서 유지)
+    source = list(context.get('source', []))
+    seen = set(source)
+    for link in all_links:
+        if link not in seen:
+            seen.add(link)
+            source.append(link)
+    context['recent_news'] = results['recent_news']
+    context['past_news'] = results['past_news']
+    context['source'] = source
     return context
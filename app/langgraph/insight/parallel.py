@@ -0,0 +1,29 @@
+"""
+인사이트 그래프에서 서로 독립적인 LLM 호출/노드를 동시에 실행하기 위한 헬퍼
+"""
+from typing import Callable, List
+from app.utils.background_executor import BackgroundExecutor
+
+_executor = BackgroundExecutor("insight-llm", max_workers=4)
+
+
+def run_concurrently(*calls: Callable[[], object]) -> List[object]:
+    """인자 없는 함수들을 동시에 실행하고, 모두 끝나면 입력 순서대로 결과를 반환한다. (하나라도 실패하면 예외 전파)"""
+    futures = [_executor.submit(call) for call in calls]
+    return [future.result() for future in futures]
+
+
+def parallel_node(*funcs: Callable[[dict], dict]) -> Callable[[dict], dict]:
+    """
+    같은 context를 입력으로 받는 노드들을 동시에 실행하고 결과를 하나의 context로 합치는(fan-in) 노드를 만든다.
+    각 노드는 context의 얕은 복사본을 받으며, 노드가 추가하거나 바꾼 키만 funcs 순서대로 반영한다.
+    """
+    def node(context):
+        results = run_concurrently(*[(lambda func=func: func(dict(context))) for func in funcs])
+        merged = dict(context)
+        for result in results:
+            for key, value in result.items():
+                if key not in context or context[key] is not value:
+                    merged[key] = value
+        return merged
+    return node
@@ -7,6 +7,7 @@ import os
 from bs4 import BeautifulSoup
 import os
 import requests
+from app.utils import rate_limiter
 
 
 @tool
@@ -16,6 +17,7 @@ def search_web(query: str) -> str:
     print(f"Query: {query}")
     try:
         search = TavilySearchResults(api_key=os.environ["TAVILY_API_KEY"])
+        rate_limiter.acquire("tavily")
         results = search.invoke(query)
         return str(results)
     except Exception as e:
@@ -47,6 +49,7 @@ def google_search(query: str, num_results: int = 3) -> List[Dict[str, str]]:
             google_api_key=api_key,
             google_cse_id=cse_id
         )
+        rate_limiter.acquire("google_cse")
         results = search.results(query, num_results=num_results)
         return results
 
@@ -79,6 +82,7 @@ def google_search_expansion(query: str, num_results: int = 3) -> List[Dict[str,
             google_api_key=api_key,
             google_cse_id=cse_id
         )
+        rate_limiter.acquire("google_cse")
         raw_results = search.results(query, num_results=num_results)
 
         enhanced_results = []
@@ -113,5 +117,6 @@ def google_news(query: str, num_results: int = 5, tbs: str = None) -> list:
         serper_api_key=serper_api_key, type="news", tbs=tbs)
     print(
         f"[DEBUG] google_news called with query={query}, num_results={num_results}, tbs={tbs}")
+    rate_limiter.acquire("serper")
     results = search.results(query, num_results=num_results)
     return results
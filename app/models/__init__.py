@@ -10,4 +10,5 @@ from .insight_article import InsightArticle
 from .interest import Interest
 from .auto_task import AutoTask
 from .briefing import Briefing
-from .auto_task_step import AutoTaskStep
\ No newline at end of file
+from .auto_task_step import AutoTaskStep
+from .background_job import BackgroundJob
\ No newline at end of file
@@ -25,4 +25,11 @@ class AutoTask(db.Model):
 
     # 관계 설정
     auto_task_steps = db.relationship('AutoTaskStep', back_populates='auto_task', cascade='all, delete-orphan', lazy="select")
-    user = db.relationship('User', back_populates='auto_tasks')
\ No newline at end of file
+    user = db.relationship('User', back_populates='auto_tasks')
+
+    __table_args__ = (
+        # claim_next_task: 사용자별 undone 업무를 최신순으로 조회
+        db.Index('ix_auto_task_user_id_status_created_at', 'user_id', 'status', 'created_at'),
+        # claim_next_task: 서브 업무의 선행 업무(제목)가 done인지 확인
+        db.Index('ix_auto_task_user_id_title', 'user_id', 'title'),
+    )
\ No newline at end of file
@@ -0,0 +1,29 @@
+from app.models.db import db
+import uuid
+from sqlalchemy.dialects.postgresql import UUID, ENUM
+from datetime import datetime, timezone
+
+
+class BackgroundJob(db.Model):
+    """세션 종료 후처리 등 백그라운드 작업 큐 (재시작 후에도 남아 있는 작업을 이어서 처리)"""
+    __tablename__ = 'background_job'
+    id = db.Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    job_type = db.Column(db.String(64), nullable=False)
+    # 같은 작업을 중복으로 넣지 않기 위한 키 (예: session.cleanup:<session_id>)
+    dedup_key = db.Column(db.String(255), nullable=True)
+    payload = db.Column(db.JSON, nullable=True)
+    status = db.Column(ENUM('queued', 'running', 'done', 'failed', name='background_job_status'),
+                       nullable=False, default='queued')
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    max_attempts = db.Column(db.Integer, nullable=False, default=3)
+    last_error = db.Column(db.Text, nullable=True)
+    created_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    available_at = db.Column(db.DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    started_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    finished_at = db.Column(db.DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('dedup_key', name='uq_background_job_dedup_key'),
+        # 워커가 실행 가능한 작업을 찾는 조건 (status='queued' AND available_at <= now)
+        db.Index('ix_background_job_status_available_at', 'status', 'available_at'),
+    )
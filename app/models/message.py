@@ -21,6 +21,19 @@ class Message(db.Model):
     keyword_text = db.Column(db.Text, nullable=True)
     keyword_vector = db.Column(Vector(1536), nullable=True)
     message_metadata = db.Column(db.JSON, nullable=True)  # metadata 대신 message_metadata 사용
+    # 한 턴의 메시지를 재저장해도 중복되지 않도록 하는 키 (turn_id 기반, 수동 생성 메시지는 NULL)
+    idempotency_key = db.Column(db.String(128), nullable=True)
+
+    __table_args__ = (
+        db.UniqueConstraint('session_id', 'idempotency_key',
+                            name='uq_message_session_idempotency_key'),
+        db.Index('ix_message_user_id_timestamp', 'user_id', 'timestamp'),
+        # 유사도 검색용 HNSW 인덱스 (l2_distance 기준, 마이그레이션 b7e2d4f8a913과 같은 값을 유지해야 함)
+        db.Index('ix_message_vector_hnsw', 'vector',
+                 postgresql_using='hnsw',
+                 postgresql_with={'m': 16, 'ef_construction': 64},
+                 postgresql_ops={'vector': 'vector_l2_ops'}),
+    )
 
     # Relationships
     session = db.relationship('Session', back_populates='messages')
@@ -4,6 +4,8 @@ from flask_restx import Resource, Namespace
 from app.services.insight_article_service import InsightArticleService
 from app.schemas.insight_schema import register_models  # insight용 schema 필요
 from app.utils.auth_middleware import require_auth
+from app.utils.document_fetcher import document_fetcher
+from app.utils.summary_cache import summary_cache
 from app import api
 import uuid
 
@@ -83,5 +85,17 @@ class InsightGenerate(Resource):
             ns.abort(500, f"Insight 생성 중 오류: {str(e)}")
 
 
+
+@ns.route('/document-cache')
+class InsightDocumentCache(Resource):
+    @ns.doc('insight_document_cache_stats', description='뉴스 본문 캐시와 기사 요약 캐시의 크기/적중률을 조회합니다.')
+    @require_auth
+    def get(self):
+        return {
+            "documents": document_fetcher.stats(),
+            "summaries": summary_cache.stats()
+        }, 200
+
+
 # Register the namespace
 api.add_namespace(ns)
@@ -4,6 +4,8 @@ from flask_restx import Resource, Namespace, fields
 from app.services.message_service import MessageService
 from app.schemas.message_schema import register_models
 from app.utils.auth_middleware import require_auth
+from app.utils.embedding_cache import embedding_cache
+from app.utils.tool_cache import tool_result_cache
 from app import api
 import uuid
 import json
@@ -146,6 +148,7 @@ class MessageVectorUpdate(Resource):
     @ns.doc('update_message_vectors',
             description='Update vectors for existing messages')
     @ns.param('user_id', 'Optional: Update vectors only for specific user')
+    @ns.param('page_size', 'Optional: Number of messages embedded per page (default 500)')
     @require_auth
     def post(self):
         """기존 메시지들의 벡터를 업데이트합니다."""
@@ -154,13 +157,42 @@ class MessageVectorUpdate(Resource):
             if user_id:
                 user_id = uuid.UUID(user_id)
             
+            page_size = request.args.get('page_size', 500, type=int)
+
             message_service = MessageService()
-            result = message_service.update_message_vectors(user_id)
+            result = message_service.update_message_vectors(user_id, page_size=page_size)
             return result, 200
             
         except Exception as e:
             return {'error': str(e)}, 500
 
 
+@ns.route('/embedding-cache')
+class EmbeddingCacheStats(Resource):
+    @ns.doc('embedding_cache_stats',
+            description='Get embedding cache size and hit/miss counters')
+    @require_auth
+    def get(self):
+        """임베딩 캐시 통계를 반환합니다."""
+        return embedding_cache.stats(), 200
+
+
+@ns.route('/tool-cache')
+class ToolCacheStats(Resource):
+    @ns.doc('tool_cache_stats',
+            description='Get tool result cache size and per-tool hit rates')
+    @require_auth
+    def get(self):
+        """도구 실행 결과 캐시 통계를 반환합니다."""
+        return tool_result_cache.stats(), 200
+
+    @ns.doc('clear_tool_cache', description='Clear the tool result cache')
+    @require_auth
+    def delete(self):
+        """도구 실행 결과 캐시를 비웁니다."""
+        tool_result_cache.clear()
+        return {'cleared': True}, 200
+
+
 # Register the namespace
 api.add_namespace(ns)
\ No newline at end of file
@@ -0,0 +1,21 @@
+from flask_restx import Namespace, Resource
+from app.utils.auth_middleware import require_auth
+from app.utils import metrics
+
+ns = Namespace('metrics', description='프로세스 내 성능 메트릭 조회')
+
+
+@ns.route('/')
+class Metrics(Resource):
+    @ns.doc('get_metrics', description='카운터와 측정값(p50/p95 등) 요약을 조회합니다.')
+    @require_auth
+    def get(self):
+        """현재 프로세스의 메트릭 스냅샷을 반환합니다."""
+        return metrics.snapshot(), 200
+
+    @ns.doc('reset_metrics', description='모든 메트릭을 초기화합니다.')
+    @require_auth
+    def delete(self):
+        """메트릭을 초기화합니다."""
+        metrics.reset()
+        return {'reset': True}, 200
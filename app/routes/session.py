@@ -2,22 +2,16 @@
 import uuid
 import json
 import logging
-import time
-import threading
 from datetime import datetime
 from flask import request, Response, stream_with_context
 from flask_restx import Resource, Namespace, fields
 
-from app.services.auto_task_service import AutoTaskService
-from app.services.background_service import BackgroundService
-from app.services.cleanup_service import CleanupService
-from app.services.interest_service import InterestService
 from app.services.message_service import MessageService
 from app.services.session_service import SessionService
+from app.services.session_job_service import session_job_service
 from app.services.user_service import UserService
 from app.utils.auth_middleware import require_auth
 from app.utils.agent_state_store import AgentStateStore
-from app.utils.auto_task_utils import safe_background_response
 from app.utils.app_config import is_dev_mode
 from app.utils.map import get_address_from_tmap
 from app.utils.prompt.service_prompts import (
@@ -84,11 +78,7 @@ session_message_response = ns.model('SessionMessage', {
 # Initialize services
 session_service = SessionService()
 message_service = MessageService()
-interest_service = InterestService()
 user_service = UserService()
-cleanup_service = CleanupService()
-auto_task_service = AutoTaskService()
-background_service = BackgroundService()
 
 
 @ns.route('/open')
@@ -179,156 +169,14 @@ class SessionClose(Resource):
                 errors.append(
                     {"step": "summary_generation", "error": error_msg})
 
-            # 1-2. 관심사 추출
-            log.info(f"[{datetime.now()}] 관심사 추출 시작")
-
-            def run_interest_extraction():
-                try:
-                    log.info(f"[{datetime.now()}] 관심사 추출 백그라운드 스레드 시작")
-                    start_time = time.time()
-                    from app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        interest_service.extract_interests_keywords(session_id)
-                    end_time = time.time()
-                    log.info(
-                        f"[{datetime.now()}] 관심사 추출 백그라운드 완료 - 소요시간: {end_time - start_time:.2f}초")
-                except Exception as e:
-                    error_msg = f"Failed to extract interests: {str(e)}"
-                    log.error(error_msg)
-                    errors.append(
-                        {"step": "interest_extraction", "error": error_msg})
-
-            interest_thread = threading.Thread(target=run_interest_extraction)
-            interest_thread.daemon = True
-            interest_thread.start()
-
-            log.info(f"[{datetime.now()}] 관심사 추출 백그라운드 시작됨 - API 응답 즉시 반환")
-
-            user_id = str(session["user_id"])
-
-            # 1-3. 세션 cleanup 실행
-            log.info(f"[{datetime.now()}] Cleanup 시작")
-
-            def run_cleanup():
-                try:
-                    log.info(f"[{datetime.now()}] Cleanup 백그라운드 스레드 시작")
-                    start_time = time.time()
-
-                    from app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        cleanup_result = cleanup_service.cleanup_session(
-                            session_id)
-
-                    end_time = time.time()
-                    log.info(
-                        f"[{datetime.now()}] Cleanup 백그라운드 완료 - 소요시간: {end_time - start_time:.2f}초")
-
-                    # cleanup 완료 후 auto task 생성도 백그라운드에서 실행
-                    if cleanup_result and not cleanup_result.get("error") and cleanup_result.get("generated_tasks"):
-                        run_auto_task_creation(cleanup_result)
-                        run_background_auto_task(user_id)
-
-                except Exception as e:
-                    log.error(f"[{datetime.now()}] Cleanup 백그라운드 에러: {str(e)}")
-
-            def run_auto_task_creation(cleanup_result):
-                try:
-                    log.info(f"[{datetime.now()}] Auto task 백그라운드 스레드 시작")
-                    start_time = time.time()
-
-                    from app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        session = session_service.get_session(session_id)
-                        if session:
-                            auto_task_service.create_from_cleanup_result(
-                                session["user_id"],
-                                cleanup_result
-                            )
-
-                    end_time = time.time()
-                    log.info(
-                        f"[{datetime.now()}] Auto task 백그라운드 완료 - 소요시간: {end_time - start_time:.2f}초")
-                except Exception as e:
-                    log.error(
-                        f"[{datetime.now()}] Auto task 백그라운드 에러: {str(e)}")
-
-                    # 1.4 백그라운드 자동 업무 실행
-            def run_background_auto_task(user_id):
-                try:
-                    log.info(
-                        f"[{datetime.now()}] Background Auto task 백그라운드 스레드 시작")
-                    start_time = time.time()
-
-                    from app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        background_result = background_service.background_auto_task(
-                            str(user_id))
-                        background_result = safe_background_response(
-                            background_result)
-                        print("[DEBUG] background_result:", background_result)
-                        log.info(
-                            f"[{datetime.now()}] Background auto task 결과: {background_result}")
-
-                    end_time = time.time()
-                    log.info(
-                        f"[{datetime.now()}] Background auto task 백그라운드 완료 - 소요시간: {end_time - start_time:.2f}초")
-                except Exception as e:
-                    log.error(
-                        f"[{datetime.now()}] Background auto task 백그라운드 에러: {str(e)}")
-
-            # 백그라운드에서 cleanup 실행 (join 없이)
-            cleanup_thread = threading.Thread(target=run_cleanup)
-            cleanup_thread.daemon = True  # 메인 프로세스 종료 시 함께 종료
-            cleanup_thread.start()
-
-            log.info(f"[{datetime.now()}] Cleanup 백그라운드 시작됨 - API 응답 즉시 반환")
-
-            # 세션 종료 시 AgentState에서 user_memory 업데이트
-            def run_user_memory_update():
-                try:
-                    log.info(
-                        f"[{datetime.now()}] User memory 업데이트 백그라운드 스레드 시작")
-                    start_time = time.time()
-
-                    from app import create_app
-                    app = create_app()
-                    with app.app_context():
-                        agent_state = AgentStateStore.get(user_id)
-                        if agent_state:
-                            messages = agent_state.get('messages', [])
-                            summary = agent_state.get('summary')
-                            user_service.save_user_memory_from_state(
-                                user_id, agent_state)
-
-                            AgentStateStore.set(user_id, {
-                                'messages': messages,
-                                'summary': summary
-                            })
-
-                            log.info(f"[{datetime.now()}] User memory 업데이트 완료")
-                        else:
-                            log.warning(
-                                f"AgentState not found for user {user_id} during session close")
-
-                    end_time = time.time()
-                    log.info(
-                        f"[{datetime.now()}] User memory 업데이트 백그라운드 완료 - 소요시간: {end_time - start_time:.2f}초")
-
-                except Exception as e:
-                    log.error(
-                        f"[{datetime.now()}] User memory 업데이트 백그라운드 에러: {str(e)}")
-
-            # 백그라운드에서 user memory 업데이트 실행 (join 없이)
-            memory_thread = threading.Thread(target=run_user_memory_update)
-            memory_thread.daemon = True
-            memory_thread.start()
-
-            log.info(
-                f"[{datetime.now()}] User memory 업데이트 백그라운드 시작됨 - API 응답 즉시 반환")
+            # 1-2. 관심사 추출 / cleanup → 자동 업무 생성·실행 / user memory 업데이트는 작업 큐에서 처리
+            try:
+                jobs = session_job_service.enqueue_close_jobs(session_id, session["user_id"])
+                log.info(f"[{datetime.now()}] 세션 종료 후처리 작업 등록: {jobs}")
+            except Exception as e:
+                error_msg = f"Failed to enqueue session close jobs: {str(e)}"
+                log.error(error_msg)
+                errors.append({"step": "enqueue_jobs", "error": error_msg})
 
             response = {
                 'id': str(session["id"]),
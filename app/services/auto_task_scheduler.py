@@ -0,0 +1,256 @@
+"""AutoTask.repeat / preferred_at에 따라 모든 사용자의 활성 업무를 정해진 시각에 실행하는 스케줄러입니다."""
+import heapq
+import logging
+import random
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import pytz
+
+from app.utils import metrics
+from app.utils.app_config import get_auto_task_scheduler_config
+from app.utils.cron import next_fire_time
+
+log = logging.getLogger(__name__)
+
+
+class AutoTaskScheduler:
+    """
+    활성 AutoTask의 다음 실행 시각을 min-heap으로 관리하고, 시각이 된 업무를 워커 풀로 넘깁니다.
+
+    - 업무가 생성/수정/삭제되면 on_task_changed / on_task_removed로 해당 업무만 다시 계산합니다.
+      (이전 heap 항목은 버전으로 무효화하고 꺼낼 때 건너뜀)
+    - 같은 시각에 몰리는 업무(예: 매일 07:00)는 0~jitter초 사이로 흩어서 실행합니다.
+    - 동시에 실행 중인 dispatch는 max_workers개로 제한하며, 넘치면 다음 tick으로 미룹니다.
+    - clock(초 단위 epoch)과 submit을 주입하면 실제 시간/스레드 없이 테스트할 수 있습니다.
+    """
+
+    def __init__(self, dispatch: Callable[[str, str, datetime], None] = None,
+                 clock: Callable[[], float] = time.time, submit: Callable = None,
+                 max_workers: int = None, jitter_seconds: float = None,
+                 timezone_name: str = None, rng: random.Random = None):
+        # 설정값은 init_config 이후에 읽도록 처음 사용할 때 채움
+        self.dispatch = dispatch or dispatch_auto_task
+        self.clock = clock
+        self._max_workers = max_workers
+        self._jitter_seconds = jitter_seconds
+        self._timezone_name = timezone_name
+        self._tz = None
+        self.rng = rng or random.Random()
+        self._submit = submit
+        self._executor = None
+
+        self._heap: List[tuple] = []
+        self._tasks: Dict[str, dict] = {}
+        self._seq = 0
+        self._inflight = 0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers or get_auto_task_scheduler_config()['workers']
+
+    @property
+    def jitter_seconds(self) -> float:
+        if self._jitter_seconds is None:
+            return get_auto_task_scheduler_config()['jitter_seconds']
+        return self._jitter_seconds
+
+    @property
+    def tz(self):
+        if self._tz is None:
+            self._tz = pytz.timezone(self._timezone_name or get_auto_task_scheduler_config()['timezone'])
+        return self._tz
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    # 업무 등록/변경
+    def load(self, tasks: List[dict]) -> None:
+        """직렬화된 AutoTask 목록으로 heap을 다시 만듭니다."""
+        with self._lock:
+            self._heap, self._tasks = [], {}
+        for task in tasks:
+            self.on_task_changed(task)
+
+    def on_task_changed(self, task: dict) -> Optional[datetime]:
+        """업무 하나의 다음 실행 시각을 다시 계산하고 반환합니다. 실행할 일이 없으면 None."""
+        task_id = str(task["id"])
+        if not task.get("active", True):
+            self.on_task_removed(task_id)
+            return None
+
+        preferred_at = task.get("preferred_at")
+        if isinstance(preferred_at, str):
+            preferred_at = datetime.fromisoformat(preferred_at)
+        spec = {"user_id": str(task["user_id"]), "repeat": task.get("repeat"), "preferred_at": preferred_at}
+        return self._schedule(task_id, spec, self._now())
+
+    def on_task_removed(self, task_id) -> None:
+        with self._lock:
+            self._tasks.pop(str(task_id), None)
+
+    def _now(self) -> datetime:
+        return datetime.fromtimestamp(self.clock(), tz=timezone.utc)
+
+    def _schedule(self, task_id: str, spec: dict, after: datetime) -> Optional[datetime]:
+        try:
+            fire_at = next_fire_time(spec["repeat"], spec["preferred_at"], after, self.tz)
+        except ValueError as e:
+            log.warning("[AutoTaskScheduler] invalid repeat for task %s: %s", task_id, e)
+            fire_at = None
+
+        with self._lock:
+            if fire_at is None:
+                self._tasks.pop(task_id, None)
+                return None
+            self._seq += 1
+            spec = dict(spec, version=self._seq, fire_at=fire_at)
+            self._tasks[task_id] = spec
+            jitter = self.rng.uniform(0, self.jitter_seconds) if self.jitter_seconds else 0
+            heapq.heappush(self._heap, (fire_at.timestamp() + jitter, self._seq, task_id))
+        self._wakeup.set()
+        return fire_at
+
+    # 실행
+    def run_pending(self) -> int:
+        """실행 시각이 지난 업무를 dispatch하고 넘긴 개수를 반환합니다."""
+        now = self.clock()
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now and self._inflight + len(due) < self.max_workers:
+                _, version, task_id = heapq.heappop(self._heap)
+                spec = self._tasks.get(task_id)
+                if spec is None or spec["version"] != version:
+                    continue  # 삭제되었거나 다시 계산된 업무
+                due.append((task_id, spec))
+            self._inflight += len(due)
+
+        for task_id, spec in due:
+            metrics.observe("auto_task_scheduler.lag_ms", (now - spec["fire_at"].timestamp()) * 1000)
+            self._submit_dispatch(task_id, spec)
+            # 반복 업무는 이번 실행 예정 시각 기준으로 다음 시각을 계산 (실행 지연이 누적되지 않도록)
+            self._schedule(task_id, {k: spec[k] for k in ("user_id", "repeat", "preferred_at")}, spec["fire_at"])
+
+        if due:
+            metrics.increment("auto_task_scheduler.dispatched", len(due))
+        return len(due)
+
+    def _submit_dispatch(self, task_id: str, spec: dict):
+        submit = self._submit or self._get_executor().submit
+        try:
+            submit(self._run_dispatch, task_id, spec["user_id"], spec["fire_at"])
+        except Exception:
+            self._release()
+            raise
+
+    def _run_dispatch(self, task_id: str, user_id: str, fire_at: datetime):
+        try:
+            self.dispatch(task_id, user_id, fire_at)
+        except Exception as e:
+            metrics.increment("auto_task_scheduler.dispatch_failed")
+            log.error("[AutoTaskScheduler] failed to dispatch task %s: %s", task_id, e)
+        finally:
+            self._release()
+
+    def _release(self):
+        with self._lock:
+            self._inflight -= 1
+        self._wakeup.set()
+
+    def _get_executor(self):
+        if self._executor is None:
+            from app.utils.background_executor import BackgroundExecutor
+            self._executor = BackgroundExecutor("auto-task-scheduler", max_workers=self.max_workers)
+        return self._executor
+
+    def seconds_until_next(self) -> Optional[float]:
+        with self._lock:
+            if not self._heap:
+                return None
+            return max(0.0, self._heap[0][0] - self.clock())
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._tasks)
+
+    # 백그라운드 스레드
+    def start(self, app) -> None:
+        """DB의 활성 업무를 읽어 heap을 만들고, 스케줄러 스레드를 시작합니다."""
+        if self._thread is not None:
+            return
+        from app.dao.auto_task_dao import AutoTaskDAO
+        from app.services.auto_task_service import AutoTaskService
+
+        with app.app_context():
+            service = AutoTaskService()
+            self.load([service._serialize_auto_task(task) for task in AutoTaskDAO().get_schedulable_tasks()])
+        log.info("[AutoTaskScheduler] loaded %d scheduled tasks", self.pending())
+
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._loop, args=(app,), name="auto-task-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _loop(self, app):
+        # dispatch가 BackgroundExecutor로 실행되도록 스케줄러 스레드에서도 앱 컨텍스트를 유지
+        with app.app_context():
+            while not self._stopping.is_set():
+                try:
+                    self.run_pending()
+                except Exception as e:
+                    log.error("[AutoTaskScheduler] tick failed: %s", e)
+                wait = self.seconds_until_next()
+                if wait is None or self._inflight >= self.max_workers:
+                    # 실행할 업무가 없거나 워커가 모두 사용 중이면 변경/완료 알림(wakeup)까지 대기
+                    wait = 60
+                self._wakeup.wait(min(wait, 60))
+                self._wakeup.clear()
+
+
+def is_fire_time(repeat: Optional[str], preferred_at: Optional[datetime], fire_at: datetime, tz) -> bool:
+    """fire_at이 업무의 현재 repeat/preferred_at 기준 실행 시각인지 확인합니다."""
+    try:
+        return next_fire_time(repeat, preferred_at, fire_at - timedelta(seconds=1), tz) == fire_at
+    except ValueError:
+        return False
+
+
+def dispatch_auto_task(task_id: str, user_id: str, fire_at: datetime) -> None:
+    """
+    업무를 다시 실행 대기(undone) 상태로 만들고, 그 업무를 실행하는 백그라운드 작업을 큐에 넣습니다.
+    작업은 payload의 task_id로 이 업무만 선점하므로 같은 사용자의 다른 업무를 대신 실행하지 않습니다.
+
+    업무 변경은 요청을 처리한 프로세스의 heap에만 반영되므로, 다른 프로세스의 heap에 남은
+    이전 실행 시각이면 DB의 현재 repeat/preferred_at과 맞지 않아 건너뜁니다.
+    """
+    from app.dao.auto_task_dao import AutoTaskDAO
+    from app.services.session_job_service import JOB_BACKGROUND_AUTO_TASK
+    from app.utils.job_queue import job_queue
+
+    task = AutoTaskDAO().get(task_id)
+    if task is None or not task.active:
+        return
+    if not is_fire_time(task.repeat, task.preferred_at, fire_at, auto_task_scheduler.tz):
+        metrics.increment("auto_task_scheduler.stale_skipped")
+        log.info("[AutoTaskScheduler] skipped task %s: %s is no longer a scheduled time", task_id, fire_at)
+        return
+    if task.status != 'doing':
+        AutoTaskDAO().update_status(task.id, 'undone')
+    job_queue.enqueue(JOB_BACKGROUND_AUTO_TASK, {"user_id": user_id, "task_id": str(task_id)},
+                      dedup_key=f"{JOB_BACKGROUND_AUTO_TASK}:{task_id}:{fire_at.isoformat()}")
+
+
+auto_task_scheduler = AutoTaskScheduler()
@@ -1,12 +1,21 @@
 from app.dao.auto_task_dao import AutoTaskDAO
+from app.services.auto_task_scheduler import auto_task_scheduler
 from typing import List, Optional, Dict, Any
 import json
 from datetime import datetime, timezone, timedelta
 
+# 이 필드가 바뀌면 스케줄러의 다음 실행 시각을 다시 계산
+SCHEDULE_FIELDS = ('repeat', 'preferred_at', 'active')
+
+
 class AutoTaskService:
     def __init__(self):
         self.auto_task_dao = AutoTaskDAO()
 
+    def _notify_scheduler(self, auto_task: Dict) -> None:
+        if auto_task_scheduler.running:
+            auto_task_scheduler.on_task_changed(auto_task)
+
     def _calculate_remaining_time(self, auto_task: Any) -> Optional[timedelta]:
         """남은 수행 시간을 계산합니다."""
         if not auto_task.start_at:
@@ -91,14 +100,32 @@ class AutoTaskService:
         return [self._serialize_auto_task(auto_task) for auto_task in auto_tasks]
 
     def create(self, user_id, **data) -> Dict:
-        auto_task = self.auto_task_dao.create(user_id=user_id, **data)
+        auto_task = self._serialize_auto_task(self.auto_task_dao.create(user_id=user_id, **data))
+        self._notify_scheduler(auto_task)
+        return auto_task
+
+    def claim_next_task(self, user_id, stale_after=None, task_id=None) -> Optional[Dict]:
+        """
+        다음 실행할 업무를 선점(status='doing')하고 반환합니다. 실행할 업무가 없으면 None.
+        task_id가 주어지면 그 업무만 선점합니다.
+        """
+        auto_task = self.auto_task_dao.claim_next_task(user_id, stale_after=stale_after, task_id=task_id)
+        return self._serialize_auto_task(auto_task) if auto_task else None
+
+    def release_task(self, auto_task_id) -> Dict:
+        auto_task = self.auto_task_dao.release_task(auto_task_id)
+        if not auto_task:
+            raise ValueError('auto_task not found')
         return self._serialize_auto_task(auto_task)
 
     def update(self, auto_task_id, **kwargs) -> Dict:
         auto_task = self.auto_task_dao.update(auto_task_id, **kwargs)
         if not auto_task:
             raise ValueError('auto_task not found')
-        return self._serialize_auto_task(auto_task)
+        auto_task = self._serialize_auto_task(auto_task)
+        if any(field in kwargs for field in SCHEDULE_FIELDS):
+            self._notify_scheduler(auto_task)
+        return auto_task
 
     def update_active(self, auto_task_id, active) -> Dict:
         if active == 'True' or active == 'true':
@@ -111,7 +138,9 @@ class AutoTaskService:
         auto_task = self.auto_task_dao.update(auto_task_id, active=active)
         if not auto_task:
             raise ValueError('auto_task not found')
-        return self._serialize_auto_task(auto_task)
+        auto_task = self._serialize_auto_task(auto_task)
+        self._notify_scheduler(auto_task)
+        return auto_task
 
     # NOTE(juaa): `update` method를 써도 되지만 타입 안전성, 명확성, 유지보수성 등을 위해 사용
     def update_finish_time(self, auto_task_id, finish_time) -> Dict:
@@ -131,6 +160,7 @@ class AutoTaskService:
         result = self.auto_task_dao.delete(auto_task_id)
         if not result:
             raise ValueError('auto_task not found')
+        auto_task_scheduler.on_task_removed(auto_task_id)
         return result
 
     def create_from_cleanup_result(self, user_id: str, cleanup_result: Dict[str, Any]) -> List[Dict]:
@@ -27,9 +27,9 @@ class BackgroundService:
             self._background_executor = create_background_executor()
         return self._background_executor
 
-    def background_auto_task(self, user_id: str) -> Dict[str, Any]:
+    def background_auto_task(self, user_id: str, task_id: uuid.UUID = None) -> Dict[str, Any]:
         try:
-            result = self.background_executor(user_id = user_id)
+            result = self.background_executor(user_id = user_id, task_id = task_id)
             return self._serialize_background(result)
         
         except Exception as e:
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from app.dao.insight_article_dao import InsightArticleDAO
 from app.services.interest_service import InterestService
 from app.langgraph.insight.graph import build_insight_graph
+from app.utils import metrics
 
 class InsightArticleService:
     def __init__(self):
@@ -49,7 +50,8 @@ class InsightArticleService:
         """
         graph = build_insight_graph()
         context = {"user_id": user_id}
-        result = graph.compile().invoke(context)
+        with metrics.timer("insight.total_ms"):
+            result = graph.compile().invoke(context)
         content_json = {
             "text": result.get("text", ""),
             "script": result.get("script", "")
@@ -2,16 +2,21 @@ from app.dao.message_dao import MessageDAO
 from app.dao.session_dao import SessionDAO
 from app.utils.message.message_context import MessageContext
 
-from app.utils.openai_client import get_embedding, get_completion
+from app.utils.openai_client import get_embedding, get_embeddings, get_completion, invalidate_tool_bound_llms
+from app.utils.embedding_queue import embedding_queue, is_async_embedding_enabled
 from app.utils.message.processor import MessageProcessor
 from app.langgraph.agent.executor import create_agent_executor
 from app.langgraph.agent.graph import build_graph
 from app.utils.agent_state_store import AgentStateStore
+from app.utils import metrics
+from app.utils.app_config import is_token_streaming_enabled, get_vector_search_config
 
 from langchain.schema import HumanMessage, AIMessage
 from langchain_core.messages import ToolMessage
 from typing import List, Dict, Any, Generator
 import uuid
+import time
+import logging
 from datetime import datetime, timezone
 import json
 import numpy as np
@@ -21,6 +26,8 @@ import dotenv
 
 dotenv.load_dotenv()
 
+log = logging.getLogger(__name__)
+
 mcp_tools = None
 
 def get_mcp_tools_sync():
@@ -58,6 +65,8 @@ def get_mcp_tools_sync():
                 loop.close()
                 
             print(f"[MCP] {len(mcp_tools)}개의 MCP 도구를 로드했습니다.")
+            # 도구 목록이 바뀌었으므로 이전 도구 목록으로 바인딩된 모델은 버림
+            invalidate_tool_bound_llms()
             
         except Exception as e:
             print(f"[MCP] MCP 도구 로드 실패: {e}")
@@ -65,6 +74,27 @@ def get_mcp_tools_sync():
     
     return mcp_tools
 
+def distance_to_score(distance: float, metric: str) -> float:
+    """
+    pgvector 거리를 코사인 유사도 점수로 변환합니다.
+    Azure OpenAI 임베딩은 단위 벡터이므로 l2² = 2 - 2cos, 음의 내적 = -cos 관계를 사용합니다.
+    """
+    if metric == "l2":
+        return 1 - distance * distance / 2
+    if metric == "cosine":
+        return 1 - distance
+    return -distance
+
+
+def score_to_distance(score: float, metric: str) -> float:
+    """distance_to_score의 역변환. min_score를 DB 필터용 최대 거리로 바꿀 때 사용합니다."""
+    if metric == "l2":
+        return float(np.sqrt(max(0.0, 2 * (1 - score))))
+    if metric == "cosine":
+        return 1 - score
+    return -score
+
+
 class MessageService:
     def __init__(self):
         self.message_dao = MessageDAO()
@@ -145,10 +175,14 @@ class MessageService:
         if session.finish_at:
             raise ValueError('Cannot add message to finished session')
 
-        try:
-            vector = get_embedding(content)
-        except Exception:
-            vector = None
+        # 비동기 임베딩이 켜져 있으면 벡터 없이 먼저 저장하고 백그라운드 큐에서 채움
+        async_embedding = is_async_embedding_enabled()
+        vector = None
+        if not async_embedding:
+            try:
+                vector = get_embedding(content)
+            except Exception:
+                vector = None
 
         keyword_text = None
         keyword_vector = None
@@ -171,6 +205,8 @@ class MessageService:
             session_id, user_id, content, role, vector, metadata,
             keyword_text=keyword_text, keyword_vector=keyword_vector
         )
+        if async_embedding and content and content.strip():
+            embedding_queue.enqueue(message.id, content)
         return self._serialize_message(message)
 
     def update_message(self, message_id: uuid.UUID, **kwargs) -> Dict:
@@ -186,11 +222,17 @@ class MessageService:
 
     def create_langgraph_completion(self, session_id: uuid.UUID, user_id: uuid.UUID,
                                     content: str, user_location) -> Generator[Dict, None, None]:
-        """LangGraph를 통한 응답 생성."""
+        """
+        LangGraph를 통한 응답 생성.
+        STREAM_TOKENS가 켜져 있으면 tool_calls, tool 결과, AI 토큰을 도착 순서대로 즉시 전송하고,
+        꺼져 있으면 그래프 실행이 끝난 뒤 tool_calls → tool 결과 → AI 응답 순으로 한 번에 전송합니다.
+        """
         processor = MessageProcessor(str(session_id), str(user_id))
         context = self._get_or_create_context(str(session_id), str(user_id))
+        stream_tokens = is_token_streaming_enabled()
+        stream_timer = metrics.StreamTimer("chat")
 
-        # 메시지 버퍼
+        # 메시지 버퍼 (stream_tokens가 꺼진 경우에만 사용)
         tool_calls_buffer = []  # tool_calls가 있는 AI 메시지
         tool_results_buffer = []  # toolMessage 결과
         final_response_buffer = []  # 최종 AI 응답
@@ -200,6 +242,8 @@ class MessageService:
 
         agent_state["current_input"] = content
         agent_state["user_location"] = user_location
+        # 이전 턴의 사용자 정보/검색 결과 캐시는 새 턴에서 다시 조회
+        agent_state["turn_context"] = None
         agent_state["messages"].append(HumanMessage(content=content))
 
         # 메세지 컨텍스트에 사용자 메시지 추가
@@ -224,33 +268,47 @@ class MessageService:
                             
                         context.add_tool_result(processed)
                         if processed.get('content'):
-                            tool_results_buffer.append({
+                            tool_result = {
                                 'type': 'toolmessage',
                                 'content': processed.get('content'),
                                 'metadata': {
                                     **processed.get('metadata', {}),
                                     "tool_response": True
                                 }
-                            })
+                            }
+                            if stream_tokens:
+                                # 버퍼 모드와 같은 형태(리스트)로 결과를 하나씩 전송
+                                yield [tool_result]
+                            else:
+                                tool_results_buffer.append(tool_result)
 
                     elif isinstance(msg_chunk, AIMessage):
                         if hasattr(msg_chunk, "additional_kwargs") and msg_chunk.additional_kwargs.get("tool_calls"):
                             for tool_call in msg_chunk.additional_kwargs["tool_calls"]:
                                 context.add_tool_call_chunk(tool_call)
-                                tool_calls_buffer.append({
+                                tool_call_chunk = {
                                     'type': 'tool_calls',
                                     'tool_calls': [tool_call],
                                     'metadata': {
                                         'tool_call_id': tool_call.get('id', '')
                                     }
-                                })
+                                }
+                                if stream_tokens:
+                                    yield tool_call_chunk
+                                else:
+                                    tool_calls_buffer.append(tool_call_chunk)
                         elif msg_chunk.content:
                             context.append_assistant_content(msg_chunk.content)
-                            final_response_buffer.append({
+                            chunk = {
                                 'type': 'chunk',
                                 'content': msg_chunk.content,
                                 'metadata': metadata
-                            })
+                            }
+                            if stream_tokens:
+                                stream_timer.mark_token()
+                                yield chunk
+                            else:
+                                final_response_buffer.append(chunk)
 
                     elif isinstance(msg_chunk, dict):
                         if "agent" in msg_chunk:
@@ -272,6 +330,7 @@ class MessageService:
 
                         context.append_assistant_content(processed["content"])
 
+                        stream_timer.mark_token()
                         yield {
                             'type': 'chunk',
                             'content': processed["content"],
@@ -296,6 +355,7 @@ class MessageService:
 
             # 4. 마지막으로 AI 응답 전송
             for chunk in final_response_buffer:
+                stream_timer.mark_token()
                 yield chunk
             final_response_buffer.clear()
 
@@ -308,7 +368,8 @@ class MessageService:
 
             yield {
                 'type': 'end',
-                'context_saved': True
+                'context_saved': True,
+                'metrics': stream_timer.finish()
             }
 
         except Exception as e:
@@ -336,72 +397,127 @@ class MessageService:
         return self.active_contexts[context_key]
 
     def _save_context_messages(self, context: MessageContext) -> None:
-        """컨텍스트의 모든 메시지를 DB에 저장합니다."""
+        """컨텍스트의 모든 메시지를 한 번의 bulk INSERT로 DB에 저장합니다."""
         try:
             session_id = uuid.UUID(context.session_id)
             user_id = uuid.UUID(context.user_id)
             messages = context.get_messages_for_storage()
-            for msg in messages:
-                content = msg["content"]
-                role = msg["role"]
-                metadata = msg.get("metadata")
-
-                self.create_message(
-                    session_id=session_id,
-                    user_id=user_id,
-                    content=content,
-                    role=role,
-                    metadata=metadata
-                )
+            if not messages:
+                return
+
+            async_embedding = is_async_embedding_enabled()
+            if not async_embedding:
+                try:
+                    vectors = get_embeddings([msg["content"] for msg in messages])
+                except Exception:
+                    vectors = [None] * len(messages)
+                for msg, vector in zip(messages, vectors):
+                    msg["vector"] = vector
+
+            created = self.message_dao.bulk_create(session_id, user_id, messages)
+            if len(created) < len(messages):
+                metrics.increment("messages.duplicates_dropped", len(messages) - len(created))
+
+            if async_embedding:
+                for message in created:
+                    if message.content and message.content.strip():
+                        embedding_queue.enqueue(message.id, message.content)
         except Exception as e:
             print(f"[Error] Failed to save context messages: {e}")
             raise ValueError(f"Failed to save messages: {str(e)}")
 
-    def search_similar_messages_pgvector(self, user_id: str, query: str, top_k: int = 5) -> list[dict]:
+    def search_similar_messages_pgvector(self, user_id: str, query: str, top_k: int = 5,
+                                         min_score: float = None, metric: str = None,
+                                         wait_for_vectors: bool = False,
+                                         wait_timeout: float = 10.0) -> list[dict]:
         """
         [PGVECTOR] user_id의 메시지 중 쿼리 임베딩과 가장 유사한 top_k 메시지 반환 (DB에서 벡터 연산)
+        similarity는 코사인 유사도 기준 점수(1에 가까울수록 유사)이며, min_score보다 낮은 메시지는 DB에서 제외합니다.
+        wait_for_vectors가 True면 백그라운드 임베딩 큐가 비워질 때까지 기다린 뒤 검색합니다.
         """
+        if wait_for_vectors:
+            embedding_queue.flush(timeout=wait_timeout)
+
+        search_config = get_vector_search_config()
+        metric = metric or search_config['metric']
         query_vec = np.array(get_embedding(query))
 
-        messages = self.message_dao.get_similar_pgvector(user_id, query_vec, top_k)
+        max_distance = score_to_distance(min_score, metric) if min_score is not None else None
+        rows = self.message_dao.get_similar_pgvector(
+            user_id, query_vec, top_k,
+            ef_search=search_config['ef_search'],
+            iterative_scan=search_config['iterative_scan'],
+            metric=metric,
+            max_distance=max_distance)
         results = [
             {
                 "id": str(msg.id),
                 "content": msg.content,
-                "similarity": None,  # 필요시 SQL에서 select로 유사도 값도 받을 수 있음
+                "similarity": round(distance_to_score(distance, metric), 4),
                 "timestamp": msg.timestamp.isoformat() if msg.timestamp else None
             }
-            for msg in messages
+            for msg, distance in rows
         ]
         return results
 
-    def update_message_vectors(self, user_id: uuid.UUID = None) -> Dict[str, Any]:
-        """기존 메시지들의 벡터를 업데이트합니다."""
-        try:
-            messages = self.message_dao.get_all_by_user_id(user_id)
-
-            total = len(messages)
-            updated = 0
-            errors = 0
-
-            for msg in messages:
-                if msg.vector:
-                    continue
-                
-                try:
-                    vector = get_embedding(msg.content)
-                    self.message_dao.update(str(msg.id), vector=vector)
-                    updated += 1
-                except Exception:
-                    errors += 1
-
-            result = {
-                "total": total,
-                "updated": updated,
-                "errors": errors,
-                "skipped": total - updated - errors
-            }
-            return result
+    def update_message_vectors(self, user_id: uuid.UUID = None,
+                               page_size: int = 500) -> Dict[str, Any]:
+        """
+        벡터가 비어 있는 메시지들을 페이지 단위로 읽어 배치 임베딩 후 bulk UPDATE로 저장합니다.
+        user_id가 없으면 전체 사용자의 메시지를 대상으로 합니다.
+        """
+        started = time.perf_counter()
+        total = self.message_dao.count_by_user_id(user_id)
+        pending = self.message_dao.count_missing_vectors(user_id)
+
+        updated = 0
+        errors = 0
+        processed = 0
+        after_id = None
+
+        while True:
+            rows = self.message_dao.get_missing_vector_page(
+                user_id=user_id, after_id=after_id, limit=page_size)
+            if not rows:
+                break
+            after_id = rows[-1][0]
+
+            vectors = self._embed_rows(rows)
+            errors += sum(1 for message_id, content in rows
+                          if content and content.strip() and message_id not in vectors)
+            updated += self.message_dao.bulk_update_vectors(vectors)
+            processed += len(rows)
+
+            elapsed = time.perf_counter() - started
+            log.info(
+                "[VectorBackfill] %d/%d processed, %d updated, %d errors (%.1f msg/s)",
+                processed, pending, updated, errors, processed / elapsed if elapsed else 0.0)
+
+        elapsed = time.perf_counter() - started
+        return {
+            "total": total,
+            "updated": updated,
+            "errors": errors,
+            "skipped": total - updated - errors,
+            "elapsed_seconds": round(elapsed, 3),
+            "messages_per_second": round(processed / elapsed, 1) if elapsed else 0.0
+        }
 
+    def _embed_rows(self, rows) -> Dict[uuid.UUID, list]:
+        """(id, content) 목록을 배치 임베딩합니다. 배치가 실패하면 건별로 다시 시도해 실패 행만 제외합니다."""
+        try:
+            embeddings = get_embeddings([content for _, content in rows])
+            return {message_id: vector
+                    for (message_id, _), vector in zip(rows, embeddings) if vector is not None}
         except Exception as e:
-            raise
+            log.warning("[VectorBackfill] batch embedding failed, retrying one by one: %s", e)
+
+        vectors = {}
+        for message_id, content in rows:
+            if not content or not content.strip():
+                continue
+            try:
+                vectors[message_id] = get_embedding(content)
+            except Exception:
+                pass
+        return vectors
@@ -0,0 +1,94 @@
+"""세션 종료 후처리 작업(관심사 추출, cleanup → 자동 업무 생성/실행, user memory 갱신)을 정의합니다."""
+import logging
+import uuid
+
+from app.services.auto_task_service import AutoTaskService
+from app.services.background_service import BackgroundService
+from app.services.cleanup_service import CleanupService
+from app.services.interest_service import InterestService
+from app.services.user_service import UserService
+from app.utils.agent_state_store import AgentStateStore
+from app.utils.auto_task_utils import safe_background_response
+from app.utils.job_queue import job_queue
+
+log = logging.getLogger("langgraph_debug")
+
+JOB_EXTRACT_INTERESTS = "session.extract_interests"
+JOB_CLEANUP = "session.cleanup"
+JOB_CREATE_AUTO_TASKS = "session.create_auto_tasks"
+JOB_UPDATE_USER_MEMORY = "session.update_user_memory"
+JOB_BACKGROUND_AUTO_TASK = "user.background_auto_task"
+
+
+class SessionJobService:
+    def __init__(self):
+        self.auto_task_service = AutoTaskService()
+        self.background_service = BackgroundService()
+        self.cleanup_service = CleanupService()
+        self.interest_service = InterestService()
+        self.user_service = UserService()
+
+    def enqueue_close_jobs(self, session_id, user_id: str) -> dict:
+        """세션 종료 후처리 작업을 큐에 넣습니다. 같은 세션을 여러 번 닫아도 작업은 한 번만 들어갑니다."""
+        payload = {"session_id": str(session_id), "user_id": str(user_id)}
+        return {
+            job_type: job_queue.enqueue(job_type, payload, dedup_key=f"{job_type}:{session_id}")
+            for job_type in (JOB_EXTRACT_INTERESTS, JOB_CLEANUP, JOB_UPDATE_USER_MEMORY)
+        }
+
+    def extract_interests(self, payload: dict) -> None:
+        self.interest_service.extract_interests_keywords(uuid.UUID(payload["session_id"]))
+
+    def cleanup(self, payload: dict) -> None:
+        """
+        세션 cleanup 후 생성된 업무가 있으면 자동 업무 생성 작업을 추가합니다.
+        업무 생성은 별도 작업(세션당 한 번)으로 처리하므로 cleanup이 재시도되어도 업무가 중복 생성되지 않습니다.
+        """
+        session_id = uuid.UUID(payload["session_id"])
+        cleanup_result = self.cleanup_service.cleanup_session(session_id)
+        if not cleanup_result or cleanup_result.get("error"):
+            raise RuntimeError(f"cleanup failed: {(cleanup_result or {}).get('error')}")
+        if not cleanup_result.get("generated_tasks"):
+            return
+
+        job_queue.enqueue(JOB_CREATE_AUTO_TASKS,
+                          dict(payload, generated_tasks=cleanup_result["generated_tasks"]),
+                          dedup_key=f"{JOB_CREATE_AUTO_TASKS}:{payload['session_id']}")
+
+    def create_auto_tasks(self, payload: dict) -> None:
+        """cleanup이 만든 업무를 자동 업무로 저장하고 백그라운드 실행 작업을 추가합니다."""
+        self.auto_task_service.create_from_cleanup_result(
+            payload["user_id"], {"generated_tasks": payload["generated_tasks"]})
+        try:
+            job_queue.enqueue(JOB_BACKGROUND_AUTO_TASK, {"user_id": payload["user_id"]},
+                              dedup_key=f"{JOB_BACKGROUND_AUTO_TASK}:{payload['session_id']}")
+        except Exception as e:
+            # 재시도하면 업무가 중복 생성되므로 실패로 처리하지 않음 (undone 업무는 다음 백그라운드 실행에서 처리됨)
+            log.warning(f"Failed to enqueue background auto task for session {payload['session_id']}: {e}")
+
+    def background_auto_task(self, payload: dict) -> None:
+        # 스케줄러가 넣은 작업은 task_id로 실행할 업무가 정해져 있음
+        task_id = uuid.UUID(payload["task_id"]) if payload.get("task_id") else None
+        background_result = self.background_service.background_auto_task(payload["user_id"], task_id=task_id)
+        log.info(f"Background auto task 결과: {safe_background_response(background_result)}")
+
+    def update_user_memory(self, payload: dict) -> None:
+        """AgentState의 summary/messages로 user_memory를 갱신하고 state에는 대화 내용만 남깁니다."""
+        user_id = payload["user_id"]
+        agent_state = AgentStateStore.get(user_id)
+        if not agent_state:
+            log.warning(f"AgentState not found for user {user_id} during session close")
+            return
+        self.user_service.save_user_memory_from_state(user_id, agent_state)
+        AgentStateStore.set(user_id, {
+            'messages': agent_state.get('messages', []),
+            'summary': agent_state.get('summary')
+        })
+
+
+session_job_service = SessionJobService()
+job_queue.register(JOB_EXTRACT_INTERESTS)(session_job_service.extract_interests)
+job_queue.register(JOB_CLEANUP)(session_job_service.cleanup)
+job_queue.register(JOB_CREATE_AUTO_TASKS)(session_job_service.create_auto_tasks)
+job_queue.register(JOB_BACKGROUND_AUTO_TASK)(session_job_service.background_auto_task)
+job_queue.register(JOB_UPDATE_USER_MEMORY)(session_job_service.update_user_memory)
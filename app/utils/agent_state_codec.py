@@ -0,0 +1,131 @@
+"""AgentState를 Redis에 저장하기 위한 버전 관리되는 직렬화 포맷입니다.
+
+포맷: MAGIC(2바이트) + 스키마 버전(1바이트) + 플래그(1바이트) + 본문
+- 본문은 orjson으로 인코딩한 JSON이며, FLAG_ZSTD가 켜져 있으면 zstd로 압축되어 있습니다.
+- LangChain 메시지는 messages_to_dict 결과에서 기본값 필드를 뺀 [type, data] 형태로 저장합니다.
+- MAGIC이 없는 값은 이전 버전의 pickle 데이터로 보고 decode_state에서 그대로 읽습니다.
+
+AgentStateStore는 메시지/필드를 하나씩 encode_value로 인코딩(AGENT_STATE_COMPRESS면 큰 값은 zstd 압축)해
+Redis list/hash에 나눠 저장하며,
+encode_state/decode_state는 단일 키에 저장된 이전 데이터를 읽을 때 사용합니다.
+"""
+import pickle
+from typing import Any, Tuple
+
+import orjson
+from langchain_core.messages import BaseMessage, message_to_dict, messages_from_dict
+
+try:
+    import zstandard
+except ImportError:  # zstd는 선택 사항
+    zstandard = None
+
+MAGIC = b"AS"
+SCHEMA_VERSION = 1
+FLAG_ZSTD = 0x01
+ZSTD_FRAME_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# 이 크기보다 작은 본문은 압축 이득이 거의 없어 그대로 저장
+COMPRESS_MIN_BYTES = 1024
+_MESSAGE_KEY = "__lc_msg__"
+
+
+def _compact_message(message: BaseMessage) -> list:
+    """메시지를 [type, data]로 변환하고 비어 있는 기본값 필드는 제거합니다."""
+    converted = message_to_dict(message)
+    data = {
+        key: value for key, value in converted["data"].items()
+        if key == "content" or value not in (None, "", [], {})
+    }
+    return [converted["type"], data]
+
+
+def _restore_message(compact: list) -> BaseMessage:
+    message_type, data = compact
+    return messages_from_dict([{"type": message_type, "data": data}])[0]
+
+
+def _to_primitive(value: Any) -> Any:
+    if isinstance(value, BaseMessage):
+        return {_MESSAGE_KEY: _compact_message(value)}
+    if isinstance(value, dict):
+        return {key: _to_primitive(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set)):
+        return [_to_primitive(item) for item in value]
+    return value
+
+
+def _from_primitive(value: Any) -> Any:
+    if isinstance(value, dict):
+        if len(value) == 1 and _MESSAGE_KEY in value:
+            return _restore_message(value[_MESSAGE_KEY])
+        return {key: _from_primitive(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_from_primitive(item) for item in value]
+    return value
+
+
+def _default(value: Any) -> Any:
+    """
+    orjson이 직접 처리하지 못하는 값(pydantic 모델)을 변환합니다.
+    그 밖의 타입은 문자열로 바꿔 저장하면 다른 타입으로 읽히므로 TypeError를 냅니다.
+    """
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    raise TypeError(f"Cannot encode {type(value).__name__} in agent state")
+
+
+def encode_state(state: dict, compress: bool = True) -> bytes:
+    """state dict를 저장용 바이트로 인코딩합니다."""
+    body = encode_value(state)
+    flags = 0
+    if compress and zstandard is not None and len(body) >= COMPRESS_MIN_BYTES:
+        body = zstandard.ZstdCompressor(level=3).compress(body)
+        flags |= FLAG_ZSTD
+    return MAGIC + bytes([SCHEMA_VERSION, flags]) + body
+
+
+def decode_state(data: bytes) -> Tuple[dict, bool]:
+    """
+    저장된 바이트를 state dict로 디코딩합니다.
+    (state, legacy)를 반환하며, legacy가 True면 이전 pickle 포맷이므로 다시 저장하면 새 포맷으로 바뀝니다.
+    """
+    if not data.startswith(MAGIC):
+        # NOTE: 이 포맷 도입 이전에 저장된 pickle 데이터 (자체 Redis에 쓴 값만 읽음)
+        return pickle.loads(data), True
+
+    version, flags = data[2], data[3]
+    if version > SCHEMA_VERSION:
+        raise ValueError(f"Unsupported agent state schema version: {version}")
+
+    body = data[4:]
+    if flags & FLAG_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to decode compressed agent state")
+        body = zstandard.ZstdDecompressor().decompress(body)
+    return _from_primitive(orjson.loads(body)), False
+
+
+def encode_value(value: Any, compress: bool = False) -> bytes:
+    """
+    state의 개별 필드/메시지 하나를 orjson 바이트로 인코딩합니다. (헤더 없음)
+    compress가 켜져 있고 COMPRESS_MIN_BYTES 이상이면 zstd 프레임으로 압축합니다.
+    """
+    body = orjson.dumps(
+        _to_primitive(value),
+        default=_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+    if compress and zstandard is not None and len(body) >= COMPRESS_MIN_BYTES:
+        return zstandard.ZstdCompressor(level=3).compress(body)
+    return body
+
+
+def decode_value(data: bytes) -> Any:
+    """encode_value로 인코딩한 값을 되돌립니다. (zstd 프레임이면 먼저 압축 해제)"""
+    # JSON은 zstd 프레임 매직 넘버로 시작할 수 없으므로 헤더 없이 구분 가능
+    if data[:4] == ZSTD_FRAME_MAGIC:
+        if zstandard is None:
+            raise RuntimeError("zstandard is required to decode compressed agent state")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    return _from_primitive(orjson.loads(data))
@@ -1,32 +1,161 @@
-from config import Config
-import redis
-import pickle
+import hashlib
+import logging
 
-_redis = redis.Redis(host=Config.REDIS_URL, port=Config.REDIS_PORT,
-                     db=0, password=Config.REDIS_KEY, ssl=True)
+from app.utils.agent_state_codec import decode_state, decode_value, encode_value
+from app.utils.app_config import get_redis_config
+from app.utils.redis_client import get_redis
+from app.utils import metrics
+
+log = logging.getLogger(__name__)
+
+# summarize_node가 요약 후 남기는 최근 메시지 수와 같게 유지
+AGENT_MESSAGE_WINDOW = 6
+
+# get()으로 읽은 시점의 저장 상태. set()에서 바뀐 부분만 쓰기 위해 state에 함께 보관함
+_BASELINE_KEY = "_persisted"
+# 턴마다 새로 채우는 필드 ('_'로 시작하는 키와 함께 저장하지 않음)
+TRANSIENT_FIELDS = frozenset({"turn_context"})
+
+
+def _messages_key(user_id: str) -> str:
+    return f"agent_state:{user_id}:messages"
+
+
+def _fields_key(user_id: str) -> str:
+    return f"agent_state:{user_id}:fields"
+
+
+def _legacy_key(user_id: str) -> str:
+    return f"agent_state:{user_id}"
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _default_state(user_id: str) -> dict:
+    return {
+        "messages": [],
+        "summary": "",
+        "user_id": user_id,
+        "current_input": "",
+        "scratchpad": [],
+        "step_count": 0,
+        "next_step": "agent"
+    }
+
+
+def _find_overlap(baseline: list, current: list) -> int:
+    """
+    current가 baseline의 앞부분 offset개를 버리고 이어 붙인 형태라면 offset을, 아니면 -1을 반환합니다.
+    (턴 중 메시지 추가 → 0, summarize_node가 앞부분을 잘라낸 경우 → 잘라낸 개수)
+    """
+    for offset in range(len(baseline) + 1):
+        kept = baseline[offset:]
+        if current[:len(kept)] == kept:
+            return offset
+    return -1
 
 
 class AgentStateStore:
+    """
+    사용자별 AgentState를 Redis에 저장합니다.
+
+    - messages: Redis list (메시지 하나당 원소 하나, 최근 AGENT_MESSAGE_WINDOW개만 유지)
+    - 나머지 필드: Redis hash (필드 하나당 값 하나)
+    저장소는 AGENT_STATE_BACKEND에 따라 공유 Redis 커넥션 풀 또는 프로세스 내 LocalRedis를 사용합니다.
+    get()으로 읽은 state를 set()하면 추가/잘린 메시지와 바뀐 필드만 기록하고,
+    읽기/쓰기는 각각 하나의 파이프라인(1 round-trip)으로 처리합니다.
+    """
+
     @staticmethod
-    def set(user_id: str, state: dict):
-        _redis.set(f"agent_state:{user_id}", pickle.dumps(state))
+    def set(user_id: str, state: dict) -> int:
+        """state를 저장하고 이번에 Redis로 보낸 바이트 수를 반환합니다."""
+        baseline = state.get(_BASELINE_KEY) or {}
+        compress = get_redis_config()['compress']
+        messages = list(state.get("messages") or [])[-AGENT_MESSAGE_WINDOW:]
+        encoded_messages = [encode_value(msg, compress) for msg in messages]
+        message_digests = [_digest(data) for data in encoded_messages]
+
+        encoded_fields = {
+            key: encode_value(value, compress) for key, value in state.items()
+            if key != "messages" and not key.startswith("_") and key not in TRANSIENT_FIELDS
+        }
+        field_digests = {key: _digest(data) for key, data in encoded_fields.items()}
+
+        messages_key, fields_key = _messages_key(user_id), _fields_key(user_id)
+        pipe = get_redis().pipeline(transaction=True)
+        bytes_written = 0
+
+        # 메시지: 앞부분 잘라내기(LTRIM) + 새 메시지 추가(RPUSH), 이어지지 않으면 전체 다시 쓰기
+        offset = _find_overlap(baseline.get("messages"), message_digests) \
+            if "messages" in baseline else -1
+        if offset < 0:
+            pipe.delete(messages_key)
+            new_messages = encoded_messages
+        else:
+            if offset:
+                pipe.ltrim(messages_key, offset, -1)
+            new_messages = encoded_messages[len(baseline["messages"]) - offset:]
+        if new_messages:
+            pipe.rpush(messages_key, *new_messages)
+            pipe.ltrim(messages_key, -AGENT_MESSAGE_WINDOW, -1)
+            bytes_written += sum(len(data) for data in new_messages)
+
+        # 필드: 바뀐 값만 HSET, 없어진 필드는 HDEL
+        previous_fields = baseline.get("fields")
+        if previous_fields is None:
+            pipe.delete(fields_key)
+            changed = encoded_fields
+        else:
+            changed = {key: data for key, data in encoded_fields.items()
+                       if previous_fields.get(key) != field_digests[key]}
+            removed = [key for key in previous_fields if key not in encoded_fields]
+            if removed:
+                pipe.hdel(fields_key, *removed)
+        if changed:
+            pipe.hset(fields_key, mapping=changed)
+            bytes_written += sum(len(key) + len(data) for key, data in changed.items())
+
+        pipe.execute()
+
+        # 같은 state 객체로 다시 set()해도 변경분만 쓰도록 기준값 갱신
+        state[_BASELINE_KEY] = {"messages": message_digests, "fields": field_digests}
+        metrics.observe("agent_state.bytes_written", bytes_written)
+        log.debug(f"[AgentStateStore] user={user_id} wrote {bytes_written} bytes")
+        return bytes_written
 
     @staticmethod
     def get(user_id: str) -> dict:
-        data = _redis.get(f"agent_state:{user_id}")
-        if data:
-            return pickle.loads(data)
-        else:
-            return {
-                "messages": [],
-                "summary": "",
-                "user_id": user_id,
-                "current_input": "",
-                "scratchpad": [],
-                "step_count": 0,
-                "next_step": "agent"
+        pipe = get_redis().pipeline(transaction=False)
+        pipe.lrange(_messages_key(user_id), 0, -1)
+        pipe.hgetall(_fields_key(user_id))
+        pipe.get(_legacy_key(user_id))
+        raw_messages, raw_fields, legacy = pipe.execute()
+
+        if not raw_messages and not raw_fields:
+            if not legacy:
+                return _default_state(user_id)
+            # 단일 키(pickle/이전 포맷)에 저장된 상태는 새 구조로 옮기고 기존 키 삭제
+            state, _ = decode_state(legacy)
+            AgentStateStore.set(user_id, state)
+            get_redis().delete(_legacy_key(user_id))
+            return state
+
+        state = {
+            (key.decode() if isinstance(key, bytes) else key): decode_value(data)
+            for key, data in raw_fields.items()
+        }
+        state["messages"] = [decode_value(data) for data in raw_messages]
+        state[_BASELINE_KEY] = {
+            "messages": [_digest(data) for data in raw_messages],
+            "fields": {
+                (key.decode() if isinstance(key, bytes) else key): _digest(data)
+                for key, data in raw_fields.items()
             }
+        }
+        return state
 
     @staticmethod
     def delete(user_id: str):
-        _redis.delete(f"agent_state:{user_id}")
+        get_redis().delete(_messages_key(user_id), _fields_key(user_id), _legacy_key(user_id))
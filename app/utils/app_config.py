@@ -12,9 +12,69 @@ _config = {
     'AZURE_OPENAI_API_KEY': None,
     'AZURE_OPENAI_API_VERSION': None,
     'AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME': None,
+    'OPENAI_MAX_CONNECTIONS': 20,
+    'OPENAI_MAX_KEEPALIVE_CONNECTIONS': 10,
+    'OPENAI_KEEPALIVE_EXPIRY': 30.0,
+    'OPENAI_TIMEOUT': 60.0,
+    'OPENAI_CONNECT_TIMEOUT': 5.0,
+    'OPENAI_MAX_RETRIES': 2,
+    'EMBEDDING_BATCH_SIZE': 64,
+    'EMBEDDING_BATCH_MAX_TOKENS': 32000,
+    'EMBEDDING_ASYNC': True,
+    'EMBEDDING_QUEUE_WORKERS': 2,
+    'EMBEDDING_QUEUE_MAX_WAIT_MS': 50,
+    'JOB_QUEUE_WORKERS': 2,
+    'JOB_QUEUE_POLL_INTERVAL': 5.0,
+    'JOB_QUEUE_MAX_ATTEMPTS': 3,
+    'JOB_QUEUE_RETRY_BACKOFF': 10.0,
+    'JOB_QUEUE_STALE_SECONDS': 1800,
+    'JOB_QUEUE_AUTOSTART': True,
+    'BACKGROUND_MAX_PARALLEL_STEPS': 4,
+    'BACKGROUND_TASK_STALE_SECONDS': 3600,
+    'AUTO_TASK_SCHEDULER_ENABLED': False,
+    'AUTO_TASK_SCHEDULER_WORKERS': 4,
+    'AUTO_TASK_SCHEDULER_JITTER_SECONDS': 30.0,
+    'AUTO_TASK_SCHEDULER_TIMEZONE': 'Asia/Seoul',
+    'EMBEDDING_CACHE_SIZE': 4096,
+    'EMBEDDING_CACHE_TTL': 86400,
+    'EMBEDDING_CACHE_REDIS': False,
+    'TOOL_CACHE_ENABLED': True,
+    'TOOL_CACHE_SIZE': 2048,
+    'TOOL_CACHE_STALE_SECONDS': 600,
+    'TOOL_CACHE_REFRESH_WORKERS': 2,
+    'TOOL_CACHE_TTLS': '',
+    'SEARCH_RATE_LIMITS': 'serper=5,google_cse=5,tavily=5',
+    'INSIGHT_SEARCH_WORKERS': 10,
+    'INSIGHT_FETCH_MAX_CONNECTIONS': 20,
+    'INSIGHT_FETCH_PER_HOST': 4,
+    'INSIGHT_FETCH_TIMEOUT': 10.0,
+    'DOCUMENT_CACHE_SIZE': 1024,
+    'DOCUMENT_CACHE_FRESH_SECONDS': 3600,
+    'DOCUMENT_CACHE_MAX_AGE': 86400,
+    'INSIGHT_SUMMARY_WORKERS': 4,
+    'INSIGHT_SUMMARY_BUDGET': 60.0,
+    'INSIGHT_SUMMARY_BATCH_SIZE': 8,
+    'INSIGHT_SUMMARY_BATCH_TOKENS': 12000,
+    'INSIGHT_SUMMARY_DOC_CHARS': 6000,
+    'SUMMARY_CACHE_SIZE': 2048,
+    'SUMMARY_CACHE_TTL': 604800,
+    'STREAM_TOKENS': True,
+    'VECTOR_SEARCH_EF_SEARCH': None,
+    'VECTOR_SEARCH_ITERATIVE_SCAN': 'relaxed_order',
+    'VECTOR_SEARCH_METRIC': 'l2',
+    'VECTOR_SEARCH_MIN_SCORE': 0.35,
     'REDIS_URL': None,
     'REDIS_KEY': None,
-    'REDIS_PORT': None
+    'REDIS_PORT': None,
+    'REDIS_SSL': True,
+    'REDIS_MAX_CONNECTIONS': 50,
+    'REDIS_SOCKET_TIMEOUT': 2.0,
+    'REDIS_CONNECT_TIMEOUT': 2.0,
+    'REDIS_HEALTH_CHECK_INTERVAL': 30,
+    'REDIS_RETRIES': 3,
+    'AGENT_STATE_BACKEND': 'redis',
+    'LOCAL_STATE_MAX_KEYS': 10000,
+    'AGENT_STATE_COMPRESS': True
 }
 
 
@@ -30,7 +90,70 @@ def init_config(app):
         'AZURE_OPENAI_ENDPOINT': app.config.get('AZURE_OPENAI_ENDPOINT'),
         'AZURE_OPENAI_API_KEY': app.config.get('AZURE_OPENAI_API_KEY'),
         'AZURE_OPENAI_API_VERSION': app.config.get('AZURE_OPENAI_API_VERSION'),
-        'AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME': app.config.get('AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME')
+        'AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME': app.config.get('AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME'),
+        'OPENAI_MAX_CONNECTIONS': app.config.get('OPENAI_MAX_CONNECTIONS', 20),
+        'OPENAI_MAX_KEEPALIVE_CONNECTIONS': app.config.get('OPENAI_MAX_KEEPALIVE_CONNECTIONS', 10),
+        'OPENAI_KEEPALIVE_EXPIRY': app.config.get('OPENAI_KEEPALIVE_EXPIRY', 30.0),
+        'OPENAI_TIMEOUT': app.config.get('OPENAI_TIMEOUT', 60.0),
+        'OPENAI_CONNECT_TIMEOUT': app.config.get('OPENAI_CONNECT_TIMEOUT', 5.0),
+        'OPENAI_MAX_RETRIES': app.config.get('OPENAI_MAX_RETRIES', 2),
+        'EMBEDDING_BATCH_SIZE': app.config.get('EMBEDDING_BATCH_SIZE', 64),
+        'EMBEDDING_BATCH_MAX_TOKENS': app.config.get('EMBEDDING_BATCH_MAX_TOKENS', 32000),
+        'EMBEDDING_ASYNC': app.config.get('EMBEDDING_ASYNC', True),
+        'EMBEDDING_QUEUE_WORKERS': app.config.get('EMBEDDING_QUEUE_WORKERS', 2),
+        'EMBEDDING_QUEUE_MAX_WAIT_MS': app.config.get('EMBEDDING_QUEUE_MAX_WAIT_MS', 50),
+        'JOB_QUEUE_WORKERS': app.config.get('JOB_QUEUE_WORKERS', 2),
+        'JOB_QUEUE_POLL_INTERVAL': app.config.get('JOB_QUEUE_POLL_INTERVAL', 5.0),
+        'JOB_QUEUE_MAX_ATTEMPTS': app.config.get('JOB_QUEUE_MAX_ATTEMPTS', 3),
+        'JOB_QUEUE_RETRY_BACKOFF': app.config.get('JOB_QUEUE_RETRY_BACKOFF', 10.0),
+        'JOB_QUEUE_STALE_SECONDS': app.config.get('JOB_QUEUE_STALE_SECONDS', 1800),
+        'JOB_QUEUE_AUTOSTART': app.config.get('JOB_QUEUE_AUTOSTART', True),
+        'BACKGROUND_MAX_PARALLEL_STEPS': app.config.get('BACKGROUND_MAX_PARALLEL_STEPS', 4),
+        'BACKGROUND_TASK_STALE_SECONDS': app.config.get('BACKGROUND_TASK_STALE_SECONDS', 3600),
+        'AUTO_TASK_SCHEDULER_ENABLED': app.config.get('AUTO_TASK_SCHEDULER_ENABLED', False),
+        'AUTO_TASK_SCHEDULER_WORKERS': app.config.get('AUTO_TASK_SCHEDULER_WORKERS', 4),
+        'AUTO_TASK_SCHEDULER_JITTER_SECONDS': app.config.get('AUTO_TASK_SCHEDULER_JITTER_SECONDS', 30.0),
+        'AUTO_TASK_SCHEDULER_TIMEZONE': app.config.get('AUTO_TASK_SCHEDULER_TIMEZONE', 'Asia/Seoul'),
+        'EMBEDDING_CACHE_SIZE': app.config.get('EMBEDDING_CACHE_SIZE', 4096),
+        'EMBEDDING_CACHE_TTL': app.config.get('EMBEDDING_CACHE_TTL', 86400),
+        'EMBEDDING_CACHE_REDIS': app.config.get('EMBEDDING_CACHE_REDIS', False),
+        'TOOL_CACHE_ENABLED': app.config.get('TOOL_CACHE_ENABLED', True),
+        'TOOL_CACHE_SIZE': app.config.get('TOOL_CACHE_SIZE', 2048),
+        'TOOL_CACHE_STALE_SECONDS': app.config.get('TOOL_CACHE_STALE_SECONDS', 600),
+        'TOOL_CACHE_REFRESH_WORKERS': app.config.get('TOOL_CACHE_REFRESH_WORKERS', 2),
+        'TOOL_CACHE_TTLS': app.config.get('TOOL_CACHE_TTLS', ''),
+        'SEARCH_RATE_LIMITS': app.config.get('SEARCH_RATE_LIMITS', 'serper=5,google_cse=5,tavily=5'),
+        'INSIGHT_SEARCH_WORKERS': app.config.get('INSIGHT_SEARCH_WORKERS', 10),
+        'INSIGHT_FETCH_MAX_CONNECTIONS': app.config.get('INSIGHT_FETCH_MAX_CONNECTIONS', 20),
+        'INSIGHT_FETCH_PER_HOST': app.config.get('INSIGHT_FETCH_PER_HOST', 4),
+        'INSIGHT_FETCH_TIMEOUT': app.config.get('INSIGHT_FETCH_TIMEOUT', 10.0),
+        'DOCUMENT_CACHE_SIZE': app.config.get('DOCUMENT_CACHE_SIZE', 1024),
+        'DOCUMENT_CACHE_FRESH_SECONDS': app.config.get('DOCUMENT_CACHE_FRESH_SECONDS', 3600),
+        'DOCUMENT_CACHE_MAX_AGE': app.config.get('DOCUMENT_CACHE_MAX_AGE', 86400),
+        'INSIGHT_SUMMARY_WORKERS': app.config.get('INSIGHT_SUMMARY_WORKERS', 4),
+        'INSIGHT_SUMMARY_BUDGET': app.config.get('INSIGHT_SUMMARY_BUDGET', 60.0),
+        'INSIGHT_SUMMARY_BATCH_SIZE': app.config.get('INSIGHT_SUMMARY_BATCH_SIZE', 8),
+        'INSIGHT_SUMMARY_BATCH_TOKENS': app.config.get('INSIGHT_SUMMARY_BATCH_TOKENS', 12000),
+        'INSIGHT_SUMMARY_DOC_CHARS': app.config.get('INSIGHT_SUMMARY_DOC_CHARS', 6000),
+        'SUMMARY_CACHE_SIZE': app.config.get('SUMMARY_CACHE_SIZE', 2048),
+        'SUMMARY_CACHE_TTL': app.config.get('SUMMARY_CACHE_TTL', 604800),
+        'STREAM_TOKENS': app.config.get('STREAM_TOKENS', True),
+        'VECTOR_SEARCH_EF_SEARCH': app.config.get('VECTOR_SEARCH_EF_SEARCH'),
+        'VECTOR_SEARCH_ITERATIVE_SCAN': app.config.get('VECTOR_SEARCH_ITERATIVE_SCAN', 'relaxed_order'),
+        'VECTOR_SEARCH_METRIC': app.config.get('VECTOR_SEARCH_METRIC', 'l2'),
+        'VECTOR_SEARCH_MIN_SCORE': app.config.get('VECTOR_SEARCH_MIN_SCORE', 0.35),
+        'REDIS_URL': app.config.get('REDIS_URL'),
+        'REDIS_KEY': app.config.get('REDIS_KEY'),
+        'REDIS_PORT': app.config.get('REDIS_PORT'),
+        'REDIS_SSL': app.config.get('REDIS_SSL', True),
+        'REDIS_MAX_CONNECTIONS': app.config.get('REDIS_MAX_CONNECTIONS', 50),
+        'REDIS_SOCKET_TIMEOUT': app.config.get('REDIS_SOCKET_TIMEOUT', 2.0),
+        'REDIS_CONNECT_TIMEOUT': app.config.get('REDIS_CONNECT_TIMEOUT', 2.0),
+        'REDIS_HEALTH_CHECK_INTERVAL': app.config.get('REDIS_HEALTH_CHECK_INTERVAL', 30),
+        'REDIS_RETRIES': app.config.get('REDIS_RETRIES', 3),
+        'AGENT_STATE_BACKEND': app.config.get('AGENT_STATE_BACKEND', 'redis'),
+        'LOCAL_STATE_MAX_KEYS': app.config.get('LOCAL_STATE_MAX_KEYS', 10000),
+        'AGENT_STATE_COMPRESS': app.config.get('AGENT_STATE_COMPRESS', True)
     })
 
 
@@ -55,6 +178,149 @@ def get_openai_config():
     }
 
 
+@lru_cache(maxsize=1)
+def get_openai_pool_config():
+    """OpenAI HTTP 커넥션 풀 관련 설정을 반환합니다."""
+    return {
+        'max_connections': _config['OPENAI_MAX_CONNECTIONS'],
+        'max_keepalive_connections': _config['OPENAI_MAX_KEEPALIVE_CONNECTIONS'],
+        'keepalive_expiry': _config['OPENAI_KEEPALIVE_EXPIRY'],
+        'timeout': _config['OPENAI_TIMEOUT'],
+        'connect_timeout': _config['OPENAI_CONNECT_TIMEOUT'],
+        'max_retries': _config['OPENAI_MAX_RETRIES']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_embedding_batch_config():
+    """임베딩 배치 요청 관련 설정을 반환합니다."""
+    return {
+        'batch_size': _config['EMBEDDING_BATCH_SIZE'],
+        'max_tokens': _config['EMBEDDING_BATCH_MAX_TOKENS']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_embedding_queue_config():
+    """백그라운드 임베딩 큐 관련 설정을 반환합니다."""
+    return {
+        'enabled': _config['EMBEDDING_ASYNC'],
+        'workers': _config['EMBEDDING_QUEUE_WORKERS'],
+        'batch_size': _config['EMBEDDING_BATCH_SIZE'],
+        'max_wait': _config['EMBEDDING_QUEUE_MAX_WAIT_MS'] / 1000
+    }
+
+
+@lru_cache(maxsize=1)
+def get_job_queue_config():
+    """백그라운드 작업 큐 관련 설정을 반환합니다."""
+    return {
+        'workers': _config['JOB_QUEUE_WORKERS'],
+        'poll_interval': _config['JOB_QUEUE_POLL_INTERVAL'],
+        'max_attempts': _config['JOB_QUEUE_MAX_ATTEMPTS'],
+        'retry_backoff': _config['JOB_QUEUE_RETRY_BACKOFF'],
+        'stale_seconds': _config['JOB_QUEUE_STALE_SECONDS'],
+        'autostart': _config['JOB_QUEUE_AUTOSTART']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_background_config():
+    """백그라운드 자동 업무 실행 관련 설정을 반환합니다."""
+    return {
+        'max_parallel_steps': max(1, _config['BACKGROUND_MAX_PARALLEL_STEPS']),
+        'task_stale_seconds': _config['BACKGROUND_TASK_STALE_SECONDS']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_auto_task_scheduler_config():
+    """AutoTask 스케줄러 관련 설정을 반환합니다."""
+    return {
+        'enabled': _config['AUTO_TASK_SCHEDULER_ENABLED'],
+        'workers': max(1, _config['AUTO_TASK_SCHEDULER_WORKERS']),
+        'jitter_seconds': _config['AUTO_TASK_SCHEDULER_JITTER_SECONDS'],
+        'timezone': _config['AUTO_TASK_SCHEDULER_TIMEZONE']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_embedding_cache_config():
+    """임베딩 캐시 관련 설정을 반환합니다."""
+    return {
+        'size': _config['EMBEDDING_CACHE_SIZE'],
+        'ttl': _config['EMBEDDING_CACHE_TTL'],
+        'redis': _config['EMBEDDING_CACHE_REDIS']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_tool_cache_config():
+    """도구 실행 결과 캐시 관련 설정을 반환합니다."""
+    ttls = {}
+    for item in (_config['TOOL_CACHE_TTLS'] or '').split(','):
+        name, sep, value = item.partition('=')
+        if sep and name.strip():
+            ttls[name.strip()] = float(value)
+    return {
+        'enabled': _config['TOOL_CACHE_ENABLED'],
+        'size': _config['TOOL_CACHE_SIZE'],
+        'stale_seconds': _config['TOOL_CACHE_STALE_SECONDS'],
+        'refresh_workers': max(1, _config['TOOL_CACHE_REFRESH_WORKERS']),
+        'ttls': ttls
+    }
+
+
+@lru_cache(maxsize=1)
+def get_search_config():
+    """외부 검색 API 호출 관련 설정을 반환합니다."""
+    rate_limits = {}
+    for item in (_config['SEARCH_RATE_LIMITS'] or '').split(','):
+        name, sep, value = item.partition('=')
+        if sep and name.strip():
+            rate_limits[name.strip()] = float(value)
+    return {
+        'rate_limits': rate_limits,
+        'insight_workers': max(1, _config['INSIGHT_SEARCH_WORKERS'])
+    }
+
+
+@lru_cache(maxsize=1)
+def get_insight_document_config():
+    """인사이트 뉴스 본문 수집/요약 관련 설정을 반환합니다."""
+    return {
+        'max_connections': max(1, _config['INSIGHT_FETCH_MAX_CONNECTIONS']),
+        'per_host': max(1, _config['INSIGHT_FETCH_PER_HOST']),
+        'timeout': _config['INSIGHT_FETCH_TIMEOUT'],
+        'cache_size': _config['DOCUMENT_CACHE_SIZE'],
+        'fresh_seconds': _config['DOCUMENT_CACHE_FRESH_SECONDS'],
+        'cache_max_age': _config['DOCUMENT_CACHE_MAX_AGE'],
+        'summary_workers': max(1, _config['INSIGHT_SUMMARY_WORKERS']),
+        'summary_budget': _config['INSIGHT_SUMMARY_BUDGET'],
+        'summary_batch_size': max(1, _config['INSIGHT_SUMMARY_BATCH_SIZE']),
+        'summary_batch_tokens': _config['INSIGHT_SUMMARY_BATCH_TOKENS'],
+        'summary_doc_chars': _config['INSIGHT_SUMMARY_DOC_CHARS'],
+        'summary_cache_size': _config['SUMMARY_CACHE_SIZE'],
+        'summary_cache_ttl': _config['SUMMARY_CACHE_TTL']
+    }
+
+
+@lru_cache(maxsize=1)
+def get_vector_search_config():
+    """벡터 유사도 검색 관련 설정을 반환합니다."""
+    return {
+        'ef_search': _config['VECTOR_SEARCH_EF_SEARCH'],
+        'iterative_scan': _config['VECTOR_SEARCH_ITERATIVE_SCAN'],
+        'metric': _config['VECTOR_SEARCH_METRIC'],
+        'min_score': _config['VECTOR_SEARCH_MIN_SCORE']
+    }
+
+
+def is_token_streaming_enabled():
+    """어시스턴트 토큰을 도착 즉시 스트리밍할지 여부를 반환합니다."""
+    return _config['STREAM_TOKENS']
+
+
 @lru_cache(maxsize=1)
 def get_auth_config():
     """인증 관련 설정을 반환합니다."""
@@ -71,7 +337,16 @@ def get_redis_config():
     return {
         'redis_url': _config['REDIS_URL'],
         'redis_key': _config['REDIS_KEY'],
-        'redis_port': _config['REDIS_PORT']
+        'redis_port': _config['REDIS_PORT'],
+        'ssl': _config['REDIS_SSL'],
+        'max_connections': _config['REDIS_MAX_CONNECTIONS'],
+        'socket_timeout': _config['REDIS_SOCKET_TIMEOUT'],
+        'connect_timeout': _config['REDIS_CONNECT_TIMEOUT'],
+        'health_check_interval': _config['REDIS_HEALTH_CHECK_INTERVAL'],
+        'retries': _config['REDIS_RETRIES'],
+        'backend': _config['AGENT_STATE_BACKEND'],
+        'local_max_keys': _config['LOCAL_STATE_MAX_KEYS'],
+        'compress': _config['AGENT_STATE_COMPRESS']
     }
 
 
@@ -0,0 +1,55 @@
+"""현재 앱 컨텍스트를 워커 스레드로 넘겨 실행하는 공용 스레드 풀입니다."""
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from flask import current_app
+
+from app.models.db import db
+
+
+class BackgroundExecutor:
+    """
+    submit() 시점의 Flask 앱을 워커 스레드에서 그대로 사용합니다.
+
+    작업마다 create_app()을 호출하면 로깅 핸들러, SQLAlchemy 엔진/커넥션 풀, 라우트 등록이
+    매번 새로 만들어지므로, 이미 만들어진 앱의 컨텍스트만 push해서 같은 엔진을 공유합니다.
+    작업이 끝나면 해당 스레드의 DB 세션을 정리해 커넥션을 풀로 돌려줍니다.
+    """
+
+    def __init__(self, name: str, max_workers: int = 4):
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        # fork된 자식 프로세스에는 부모의 워커 스레드가 없으므로 새로 만듦
+        if self._executor is None or self._pid != os.getpid():
+            with self._lock:
+                if self._executor is None or self._pid != os.getpid():
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers, thread_name_prefix=self.name)
+                    self._pid = os.getpid()
+        return self._executor
+
+    def submit(self, fn, *args, **kwargs) -> Future:
+        """fn을 현재 앱 컨텍스트 안에서 실행하도록 제출합니다. 앱 컨텍스트 안에서 호출해야 합니다."""
+        app = current_app._get_current_object()
+        return self.executor.submit(self._run, app, fn, args, kwargs)
+
+    @staticmethod
+    def _run(app, fn, args, kwargs):
+        with app.app_context():
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                db.session.remove()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
@@ -0,0 +1,136 @@
+"""AutoTask.repeat에 저장된 반복 조건(cron 표현식/한국어 주기)으로 다음 실행 시각을 계산합니다."""
+from datetime import date, datetime, time, timedelta
+from typing import List, Optional, Set
+
+import pytz
+
+_ALIASES = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+}
+
+# 한국어 주기는 preferred_at을 기준 시각으로 사용
+_KOREAN_PERIODS = {
+    "매일": timedelta(days=1),
+    "매주": timedelta(weeks=1),
+    "격주": timedelta(weeks=2),
+}
+
+# 다음 실행 시각을 찾을 최대 탐색 기간 (2월 29일 같은 조건도 찾을 수 있도록 몇 년)
+_MAX_SEARCH_DAYS = 366 * 5
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> Set[int]:
+    values = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+            if step <= 0:
+                raise ValueError(f"Invalid cron step: {field}")
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            start, end = (int(value) for value in part.split("-", 1))
+        else:
+            start = int(part)
+            end = maximum if step != 1 else start
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(f"Cron field out of range: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronExpression:
+    """
+    5필드 cron 표현식 (분 시 일 월 요일)
+    - *, 목록(1,2), 범위(1-5), 간격(*/15) 지원, 요일은 0/7=일요일
+    - 일/요일이 모두 지정되면 둘 중 하나만 맞아도 실행 (표준 cron 동작)
+    """
+
+    def __init__(self, expression: str):
+        expression = _ALIASES.get(expression.strip(), expression.strip())
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression must have 5 fields: {expression}")
+        self.expression = expression
+        self.minutes = sorted(_parse_field(fields[0], 0, 59))
+        self.hours = sorted(_parse_field(fields[1], 0, 23))
+        self.days = _parse_field(fields[2], 1, 31)
+        self.months = _parse_field(fields[3], 1, 12)
+        self.weekdays = {value % 7 for value in _parse_field(fields[4], 0, 7)}
+        self._any_day = fields[2] == "*"
+        self._any_weekday = fields[4] == "*"
+
+    def _day_matches(self, day: date) -> bool:
+        if day.month not in self.months:
+            return False
+        day_match = day.day in self.days
+        weekday_match = (day.weekday() + 1) % 7 in self.weekdays
+        if self._any_day or self._any_weekday:
+            return day_match and weekday_match
+        return day_match or weekday_match
+
+    def next_after(self, after: datetime, tz=pytz.utc) -> Optional[datetime]:
+        """after 이후(초과) 첫 실행 시각을 UTC aware datetime으로 반환합니다. 시각 계산은 tz 기준."""
+        local = after.astimezone(tz).replace(tzinfo=None)
+        start = local.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        day = start.date()
+        for _ in range(_MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for hour in self.hours:
+                    for minute in self.minutes:
+                        candidate = datetime.combine(day, time(hour, minute))
+                        if candidate >= start:
+                            return tz.localize(candidate).astimezone(pytz.utc)
+            day += timedelta(days=1)
+        return None
+
+
+def _add_months(value: datetime, months: int) -> datetime:
+    month_index = value.month - 1 + months
+    year, month = value.year + month_index // 12, month_index % 12 + 1
+    # 31일 → 30일까지인 달처럼 없는 날짜는 그 달의 마지막 날로 맞춤
+    for day in range(value.day, 27, -1):
+        try:
+            return value.replace(year=year, month=month, day=day)
+        except ValueError:
+            continue
+    return value.replace(year=year, month=month, day=28)
+
+
+def next_fire_time(repeat: Optional[str], preferred_at: Optional[datetime], after: datetime,
+                   tz=pytz.utc) -> Optional[datetime]:
+    """
+    AutoTask의 다음 실행 시각을 계산합니다. 실행할 시각이 없으면 None.
+    - repeat이 cron 표현식이면 cron 기준
+    - repeat이 매일/매주/격주/매월/격월이면 preferred_at부터 해당 주기로 반복
+    - repeat이 없으면 preferred_at이 after 이후일 때 한 번만 실행
+    """
+    repeat = (repeat or "").strip()
+    if repeat and (repeat.startswith("@") or len(repeat.split()) == 5):
+        return CronExpression(repeat).next_after(after, tz)
+
+    if preferred_at is None:
+        return None
+    if preferred_at.tzinfo is None:
+        preferred_at = pytz.utc.localize(preferred_at)
+
+    if repeat in _KOREAN_PERIODS:
+        period = _KOREAN_PERIODS[repeat]
+        if preferred_at > after:
+            return preferred_at
+        periods = (after - preferred_at) // period + 1
+        return preferred_at + period * periods
+    if repeat in ("매월", "격월"):
+        months = 1 if repeat == "매월" else 2
+        candidate, count = preferred_at, 0
+        while candidate <= after:
+            count += months
+            candidate = _add_months(preferred_at, count)
+        return candidate
+
+    return preferred_at if preferred_at > after else None
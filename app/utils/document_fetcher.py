@@ -0,0 +1,142 @@
+"""웹 문서 본문을 비동기로 가져오는 fetcher와 URL 단위 본문 캐시입니다."""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+import httpx
+from bs4 import BeautifulSoup
+
+from app.utils import metrics
+from app.utils.app_config import get_insight_document_config
+from app.utils.cache import LRUCache
+
+log = logging.getLogger(__name__)
+
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (compatible; SeobiBot/1.0)",
+    "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+}
+
+
+def extract_text(html: str) -> Dict[str, str]:
+    """HTML에서 제목과 본문 텍스트를 추출합니다. (WebBaseLoader와 같은 방식)"""
+    soup = BeautifulSoup(html, "html.parser")
+    title = soup.title.get_text(strip=True) if soup.title else ""
+    return {"title": title, "text": soup.get_text()}
+
+
+class DocumentFetcher:
+    """
+    여러 URL의 본문을 동시에 가져옵니다.
+
+    - 커넥션 풀을 가진 httpx.AsyncClient 하나로 요청하고, 호스트별 동시 요청 수를 제한합니다.
+    - 가져온 본문은 URL을 키로 캐시합니다. fresh_seconds 이내면 요청하지 않고,
+      그 이후에는 ETag/Last-Modified로 조건부 요청을 보내 304면 캐시된 본문을 재사용합니다.
+    - 실패한 URL은 결과에서 None으로 반환합니다.
+    """
+
+    def __init__(self, clock=time.time):
+        self._clock = clock
+        self._cache: Optional[LRUCache] = None
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> dict:
+        return get_insight_document_config()
+
+    @property
+    def cache(self) -> LRUCache:
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    self._cache = LRUCache(maxsize=self.config['cache_size'], ttl=self.config['cache_max_age'])
+        return self._cache
+
+    def _conditional_headers(self, entry: Optional[dict]) -> Dict[str, str]:
+        headers = dict(_HEADERS)
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    async def _fetch_one(self, client: httpx.AsyncClient, url: str,
+                         host_limits: Dict[str, asyncio.Semaphore]) -> Optional[dict]:
+        entry = self.cache.get(url)
+        if entry and self._clock() - entry["fetched_at"] < self.config['fresh_seconds']:
+            metrics.increment("document_cache.hit")
+            return entry
+
+        host = urlsplit(url).netloc
+        semaphore = host_limits.setdefault(host, asyncio.Semaphore(self.config['per_host']))
+        try:
+            async with semaphore:
+                with metrics.timer("document_fetch.request_ms"):
+                    response = await client.get(url, headers=self._conditional_headers(entry))
+        except Exception as e:
+            metrics.increment("document_fetch.error")
+            log.warning("[DocumentFetcher] %s: %s", url, e)
+            # 요청이 실패해도 만료 전 캐시가 있으면 그대로 사용
+            return entry
+
+        if response.status_code == 304 and entry:
+            metrics.increment("document_cache.revalidated")
+            entry = {**entry, "fetched_at": self._clock()}
+            self.cache.set(url, entry)
+            return entry
+        if response.status_code >= 400:
+            metrics.increment("document_fetch.error")
+            log.warning("[DocumentFetcher] %s: HTTP %s", url, response.status_code)
+            return entry
+
+        metrics.increment("document_cache.miss")
+        entry = {
+            **extract_text(response.text),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "fetched_at": self._clock(),
+        }
+        self.cache.set(url, entry)
+        return entry
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """URL별 {title, text, ...}를 반환합니다. 같은 URL은 한 번만 요청합니다."""
+        urls = list(dict.fromkeys(url for url in urls if url))
+        if not urls:
+            return {}
+        config = self.config
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        async with httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=config['max_connections'],
+                                max_keepalive_connections=config['max_connections']),
+            timeout=httpx.Timeout(config['timeout']),
+            follow_redirects=True
+        ) as client:
+            results = await asyncio.gather(*(self._fetch_one(client, url, host_limits) for url in urls))
+        return dict(zip(urls, results))
+
+    def fetch(self, urls: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """동기 코드(LangGraph 노드)에서 fetch_all을 실행합니다."""
+        urls = list(urls)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_all(urls))
+        # 이미 이벤트 루프가 돌고 있는 스레드에서는 별도 스레드의 새 루프에서 실행
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, self.fetch_all(urls)).result()
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+document_fetcher = DocumentFetcher()
+
+
+def fetch_documents(urls: List[str]) -> Dict[str, Optional[dict]]:
+    return document_fetcher.fetch(urls)
@@ -0,0 +1,129 @@
+"""(임베딩 배포 이름, 정규화된 텍스트 해시)를 키로 하는 임베딩 캐시입니다."""
+import hashlib
+import logging
+import re
+import threading
+import unicodedata
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from app.utils.app_config import get_embedding_cache_config
+from app.utils.cache import LRUCache
+from app.utils.redis_client import get_redis, is_local_backend
+
+log = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """캐시 키 계산용으로 유니코드(NFC)와 공백을 정규화합니다."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+def cache_key(deployment_name: str, text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+    return f"embedding:{deployment_name}:{digest}"
+
+
+class EmbeddingCache:
+    """
+    2단계 임베딩 캐시입니다.
+
+    1. 프로세스 내 LRU (항상 사용)
+    2. Redis (EMBEDDING_CACHE_REDIS가 켜진 경우, TTL 적용 / 여러 워커가 공유)
+
+    Redis 오류는 캐시 미스로 처리하므로 임베딩 생성 자체를 막지 않습니다.
+    """
+
+    def __init__(self):
+        self._local: Optional[LRUCache] = None
+        self._lock = threading.Lock()
+        self.remote_hits = 0
+        self.remote_misses = 0
+
+    @property
+    def local(self) -> LRUCache:
+        if self._local is None:
+            with self._lock:
+                if self._local is None:
+                    config = get_embedding_cache_config()
+                    self._local = LRUCache(maxsize=config['size'], ttl=config['ttl'])
+        return self._local
+
+    def _get_redis(self):
+        # local 백엔드는 프로세스 내 LRU와 역할이 겹치므로 원격 계층을 쓰지 않음
+        if not get_embedding_cache_config()['redis'] or is_local_backend():
+            return None
+        return get_redis()
+
+    def get_many(self, keys: List[str]) -> Dict[str, list]:
+        """캐시에 있는 키의 임베딩만 반환합니다."""
+        found = {}
+        remote_keys = []
+        for key in keys:
+            vector = self.local.get(key)
+            if vector is not None:
+                found[key] = vector
+            else:
+                remote_keys.append(key)
+
+        client = self._get_redis()
+        if client is None or not remote_keys:
+            return found
+
+        try:
+            values = client.mget(remote_keys)
+        except Exception as e:
+            log.warning("[EmbeddingCache] redis get failed: %s", e)
+            return found
+
+        for key, value in zip(remote_keys, values):
+            if value is None:
+                self.remote_misses += 1
+                continue
+            self.remote_hits += 1
+            vector = np.frombuffer(value, dtype=np.float32).tolist()
+            self.local.set(key, vector)
+            found[key] = vector
+        return found
+
+    def set_many(self, vectors: Dict[str, list]) -> None:
+        if not vectors:
+            return
+        for key, vector in vectors.items():
+            self.local.set(key, vector)
+
+        client = self._get_redis()
+        if client is None:
+            return
+        ttl = get_embedding_cache_config()['ttl']
+        try:
+            pipe = client.pipeline(transaction=False)
+            for key, vector in vectors.items():
+                data = np.asarray(vector, dtype=np.float32).tobytes()
+                if ttl:
+                    pipe.setex(key, int(ttl), data)
+                else:
+                    pipe.set(key, data)
+            pipe.execute()
+        except Exception as e:
+            log.warning("[EmbeddingCache] redis set failed: %s", e)
+
+    def stats(self) -> dict:
+        stats = self.local.stats()
+        stats.update({
+            "remote_enabled": get_embedding_cache_config()['redis'],
+            "remote_hits": self.remote_hits,
+            "remote_misses": self.remote_misses
+        })
+        return stats
+
+    def clear(self) -> None:
+        self.local.clear()
+        self.remote_hits = 0
+        self.remote_misses = 0
+
+
+embedding_cache = EmbeddingCache()
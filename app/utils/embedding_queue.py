@@ -0,0 +1,112 @@
+"""메시지 임베딩을 백그라운드에서 배치로 채우는 프로세스 내 작업 큐입니다."""
+import os
+import queue
+import logging
+import threading
+from typing import List, Optional
+
+from flask import current_app, has_app_context
+
+from app.utils.app_config import get_embedding_queue_config
+from app.utils.openai_client import get_embeddings
+
+log = logging.getLogger(__name__)
+
+
+class EmbeddingQueue:
+    """
+    저장된 메시지를 받아 워커 스레드에서 배치 임베딩 후 Message.vector를 채웁니다.
+
+    - 워커는 첫 enqueue 시점에 지연 시작됩니다.
+    - 대기 중인 항목을 batch_size개까지 모아서 한 번의 임베딩 요청으로 처리합니다.
+    - 임베딩에 실패한 메시지는 vector가 NULL로 남으며 update_message_vectors 백필로 복구됩니다.
+    """
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._queue = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._pid = os.getpid()
+
+    def _ensure_workers(self):
+        if self._pid != os.getpid():
+            self._reset()
+        if self._workers:
+            return
+        with self._lock:
+            if self._workers:
+                return
+            for i in range(max(1, get_embedding_queue_config()['workers'])):
+                worker = threading.Thread(
+                    target=self._run, name=f"embedding-worker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def enqueue(self, message_id, content: str) -> None:
+        """메시지를 임베딩 대기열에 추가합니다. 앱 컨텍스트 안에서 호출해야 합니다."""
+        app = current_app._get_current_object()
+        self._ensure_workers()
+        with self._lock:
+            self._pending += 1
+        self._queue.put((app, message_id, content))
+
+    def pending(self) -> int:
+        """아직 처리되지 않은 메시지 수를 반환합니다."""
+        with self._lock:
+            return self._pending
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """대기 중인 임베딩이 모두 저장될 때까지 기다립니다. timeout 안에 끝나면 True."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def _next_batch(self) -> list:
+        """첫 항목이 들어올 때까지 기다린 뒤 max_wait 동안 batch_size개까지 모읍니다."""
+        config = get_embedding_queue_config()
+        batch = [self._queue.get()]
+        while len(batch) < config['batch_size']:
+            try:
+                batch.append(self._queue.get(timeout=config['max_wait']))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            try:
+                self._process(batch)
+            except Exception as e:
+                log.warning("[EmbeddingQueue] failed to embed %d messages: %s", len(batch), e)
+            finally:
+                with self._idle:
+                    self._pending -= len(batch)
+                    self._idle.notify_all()
+
+    def _process(self, batch: list):
+        from app.dao.message_dao import MessageDAO
+
+        # 서로 다른 앱 인스턴스(테스트 등)에서 들어온 항목은 앱별로 나눠서 저장
+        by_app = {}
+        for app, message_id, content in batch:
+            by_app.setdefault(app, []).append((message_id, content))
+
+        for app, rows in by_app.items():
+            embeddings = get_embeddings([content for _, content in rows])
+            vectors = {message_id: vector
+                       for (message_id, _), vector in zip(rows, embeddings) if vector is not None}
+            with app.app_context():
+                MessageDAO().bulk_update_vectors(vectors)
+
+
+embedding_queue = EmbeddingQueue()
+
+
+def is_async_embedding_enabled() -> bool:
+    """백그라운드 임베딩을 사용할 수 있는지 여부를 반환합니다."""
+    return get_embedding_queue_config()['enabled'] and has_app_context()
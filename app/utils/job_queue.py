@@ -0,0 +1,166 @@
+"""DB(background_job 테이블)에 저장되는 백그라운드 작업 큐와 고정 크기 워커 풀입니다."""
+import os
+import logging
+import threading
+import traceback
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from flask import current_app
+
+from app.models.db import db
+from app.utils.app_config import get_job_queue_config
+from app.utils import metrics
+
+log = logging.getLogger(__name__)
+
+
+class JobQueue:
+    """
+    작업은 background_job 테이블에 저장되고, 고정된 수의 워커 스레드가 가져가 실행합니다.
+
+    - 워커는 daemon 스레드에서 앱 컨텍스트 하나를 계속 유지하며, 작업이 끝날 때마다 DB 세션만 정리합니다.
+      (daemon이므로 stop()을 호출하지 않아도 프로세스 종료를 막지 않습니다.)
+    - dedup_key가 같은 작업은 한 번만 들어갑니다. (세션별 후처리 중복 방지)
+    - 실패한 작업은 max_attempts까지 지수 백오프로 재시도됩니다.
+    - 재시작 시 queued 작업은 그대로 이어서, 오래된 running 작업은 다시 queued로 되돌려 처리합니다.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable[[dict], None]] = {}
+        self._reset()
+
+    def _reset(self):
+        self._app = None
+        self._workers: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._pid = os.getpid()
+
+    def register(self, job_type: str):
+        """job_type 작업을 처리할 함수를 등록하는 데코레이터입니다. 함수는 payload dict를 받습니다."""
+        def decorator(func):
+            self._handlers[job_type] = func
+            return func
+        return decorator
+
+    def start(self, app) -> None:
+        """워커 풀을 시작합니다. 이미 실행 중이면 아무것도 하지 않습니다."""
+        if self._pid != os.getpid():
+            self._reset()
+        if self._workers:
+            return
+        with self._lock:
+            if self._workers:
+                return
+            self._stopping.clear()
+            workers = max(1, get_job_queue_config()['workers'])
+            self._app = app
+            with app.app_context():
+                from app.dao.background_job_dao import BackgroundJobDAO
+                try:
+                    requeued = BackgroundJobDAO().requeue_stale(get_job_queue_config()['stale_seconds'])
+                    if requeued:
+                        log.info("[JobQueue] requeued %d stale jobs", requeued)
+                except Exception as e:
+                    log.warning("[JobQueue] failed to requeue stale jobs: %s", e)
+                finally:
+                    db.session.remove()
+            # 워커는 이 앱의 컨텍스트와 DB 엔진을 그대로 사용
+            for i in range(workers):
+                worker = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """워커에 종료를 알리고 실행 중인 작업이 끝날 때까지 기다립니다."""
+        self._stopping.set()
+        self._wakeup.set()
+        for worker in self._workers:
+            worker.join(timeout)
+        self._workers = []
+
+    def enqueue(self, job_type: str, payload: dict = None, dedup_key: str = None) -> Optional[str]:
+        """
+        작업을 큐에 추가하고 작업 ID를 반환합니다. 같은 dedup_key의 작업이 이미 있으면 None을 반환합니다.
+        앱 컨텍스트 안에서 호출해야 합니다.
+        """
+        from app.dao.background_job_dao import BackgroundJobDAO
+
+        if job_type not in self._handlers:
+            raise ValueError(f"Unknown job type: {job_type}")
+
+        config = get_job_queue_config()
+        dao = BackgroundJobDAO()
+        job = dao.enqueue(job_type, payload, dedup_key=dedup_key, max_attempts=config['max_attempts'])
+        if job is None:
+            metrics.increment("jobs.deduplicated")
+            log.info("[JobQueue] skipped duplicate job %s", dedup_key)
+            return None
+
+        metrics.increment("jobs.enqueued")
+        metrics.observe("jobs.queue_depth", dao.count_by_status().get('queued', 0))
+        if config['autostart']:
+            self.start(current_app._get_current_object())
+        self._wakeup.set()
+        return str(job.id)
+
+    def _run(self):
+        with self._app.app_context():
+            self._poll()
+
+    def _poll(self):
+        from app.dao.background_job_dao import BackgroundJobDAO
+
+        poll_interval = get_job_queue_config()['poll_interval']
+        dao = BackgroundJobDAO()
+        while not self._stopping.is_set():
+            try:
+                job = dao.claim_next()
+            except Exception as e:
+                log.warning("[JobQueue] failed to claim job: %s", e)
+                db.session.rollback()
+                job = None
+
+            if job is None:
+                db.session.remove()
+                self._wakeup.wait(poll_interval)
+                self._wakeup.clear()
+                continue
+
+            try:
+                self._execute(dao, job)
+            finally:
+                db.session.remove()
+
+    def _execute(self, dao, job):
+        job_id, job_type, payload, attempts = job.id, job.job_type, job.payload or {}, job.attempts
+        wait_ms = (datetime.now(timezone.utc) - job.created_at).total_seconds() * 1000
+        metrics.observe("jobs.wait_ms", wait_ms)
+
+        handler = self._handlers.get(job_type)
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for job type: {job_type}")
+            with metrics.timer(f"jobs.{job_type}.run_ms"):
+                handler(payload)
+        except Exception as e:
+            db.session.rollback()
+            retry_delay = get_job_queue_config()['retry_backoff'] * (2 ** (attempts - 1))
+            failed = dao.fail(job_id, f"{e}\n{traceback.format_exc()}", retry_delay=retry_delay)
+            if failed is not None and failed.status == 'failed':
+                metrics.increment("jobs.failed")
+                log.error("[JobQueue] %s %s failed after %d attempts: %s", job_type, job_id, attempts, e)
+            else:
+                metrics.increment("jobs.retried")
+                log.warning("[JobQueue] %s %s failed (attempt %d), retry in %.0fs: %s",
+                            job_type, job_id, attempts, retry_delay, e)
+            return
+
+        dao.complete(job_id)
+        metrics.increment("jobs.completed")
+        log.info("[JobQueue] %s %s done (waited %.0fms)", job_type, job_id, wait_ms)
+
+
+job_queue = JobQueue()
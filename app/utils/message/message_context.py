@@ -4,6 +4,9 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass, field
 import json
 import logging
+import uuid
+
+from app.utils import metrics
 
 log = logging.getLogger(__name__)
 
@@ -33,6 +36,7 @@ class MessageContext:
     final_content: str = ""
     current_tool_call_chunks: List[Dict[str, Any]] = field(default_factory=list)
     tool_call_ids: set[str] = field(default_factory=set)  # 도구 호출 ID 추적을 위한 세트
+    turn_id: str = field(default_factory=lambda: uuid.uuid4().hex)  # 멱등 키 생성을 위한 턴 식별자
 
     def _create_message(self, role: str, content: str, metadata: Optional[Dict] = None) -> Dict[str, Any]:
         """메시지 객체를 생성합니다."""
@@ -142,7 +146,10 @@ class MessageContext:
         self.messages.append(message)
 
     def get_messages_for_storage(self) -> List[Dict[str, Any]]:
-        """저장할 메시지 목록을 반환합니다."""
+        """
+        저장할 메시지 목록을 반환합니다.
+        각 메시지에는 턴 안에서 고유한 idempotency_key가 붙어, 같은 턴을 다시 저장해도 한 번만 기록됩니다.
+        """
 
         seen_tool_calls = set()  # 중복 제거를 위한 도구 호출 ID 추적
         formatted_messages = []
@@ -153,10 +160,12 @@ class MessageContext:
                 tool_call_id = msg.get("metadata", {}).get("tool_call_id")
                 if tool_call_id:
                     if tool_call_id in seen_tool_calls:
+                        metrics.increment("messages.duplicates_dropped")
                         continue
                     seen_tool_calls.add(tool_call_id)
             
             formatted_msg = msg.copy()
+            formatted_msg["idempotency_key"] = self._idempotency_key(msg, len(formatted_messages))
             # timestamp가 메타데이터에도 있고 메시지 루트에도 있으면 중복 제거
             if "timestamp" in formatted_msg and "metadata" in formatted_msg:
                 if "timestamp" in formatted_msg["metadata"]:
@@ -165,8 +174,16 @@ class MessageContext:
 
         return datetime_to_str(formatted_messages)
 
+    def _idempotency_key(self, msg: Dict[str, Any], position: int) -> str:
+        """도구 결과는 tool_call_id, 나머지는 턴 내 순서로 멱등 키를 만듭니다."""
+        tool_call_id = (msg.get("metadata") or {}).get("tool_call_id")
+        if msg.get("role") == "tool" and tool_call_id:
+            return f"{self.turn_id}:tool:{tool_call_id}"
+        return f"{self.turn_id}:{position}:{msg.get('role')}"
+
     def reset(self) -> None:
         """메시지 컨텍스트를 초기화합니다."""
+        self.turn_id = uuid.uuid4().hex
         self.messages.clear()
         self.final_content = ""
         self.current_tool_call_chunks.clear()
@@ -3,12 +3,16 @@ from typing import Dict, List, Any, Generator, Union, Set
 from langchain_core.messages import BaseMessage, AIMessage, ToolMessage, HumanMessage
 import json
 
-from app.dao.message_dao import MessageDAO
 from app.utils.message.formatter import format_message_content
+from app.utils import metrics
 
 class MessageProcessor:
+    """
+    스트리밍 중 메시지를 포맷/중복 제거만 합니다.
+    DB 저장은 MessageContext를 통해 턴 종료 시 한 번만 수행합니다. (MessageService._save_context_messages)
+    """
+
     def __init__(self, session_id: str, user_id: str):
-        self.dao = MessageDAO()
         self.session_info = {
             "session_id": session_id,
             "user_id": user_id
@@ -28,23 +32,25 @@ class MessageProcessor:
                 continue
                 
             formatted_msg = self._format_message(msg_content, msg_metadata, msg.get("role", "assistant"))
-            yield from self._save_and_yield_message(formatted_msg)
+            yield from self._yield_once(formatted_msg)
 
     def process_tool_message(self, chunk: Union[AIMessage, ToolMessage]) -> Generator[str, None, None]:
         """AI 또는 Tool 메시지 처리."""
         formatted_msg = format_message_content(chunk, **self.session_info)
         msg_key = self._get_message_key(formatted_msg)
         
-        if msg_key not in self.seen_messages:
-            self.seen_messages.add(msg_key)
-            yield formatted_msg
+        if msg_key in self.seen_messages:
+            metrics.increment("messages.duplicates_dropped")
+            return
+        self.seen_messages.add(msg_key)
+        yield formatted_msg
 
     def process_dict_message(self, chunk: Dict) -> Generator[str, None, None]:
         """Dict 형태의 메시지 처리."""
         content = chunk.get("content", "").strip()
         metadata = chunk.get("metadata", {}) or {}
         formatted_msg = self._format_message(content, metadata, chunk.get("role", "assistant"))
-        yield from self._save_and_yield_message(formatted_msg)
+        yield from self._yield_once(formatted_msg)
 
     def process_error(self, error: Exception) -> Generator[str, None, None]:
         """에러 메시지 처리."""
@@ -54,7 +60,7 @@ class MessageProcessor:
             "metadata": {"error": str(error)},
             **self.session_info
         }
-        yield from self._save_and_yield_message(error_msg)
+        yield from self._yield_once(error_msg)
 
     def _format_message(self, content: str, metadata: Dict, default_role: str = "assistant") -> Dict:
         """메시지 포맷팅."""
@@ -73,21 +79,14 @@ class MessageProcessor:
             **self.session_info
         }
 
-    def _save_and_yield_message(self, formatted_msg: Dict) -> Generator[str, None, None]:
-        """메시지 저장 및 yield."""
+    def _yield_once(self, formatted_msg: Dict) -> Generator[str, None, None]:
+        """이미 처리한 메시지는 건너뛰고 처음 보는 메시지만 yield."""
         msg_key = self._get_message_key(formatted_msg)
         if msg_key in self.seen_messages:
+            metrics.increment("messages.duplicates_dropped")
             return
-            
+
         self.seen_messages.add(msg_key)
-        
-        saved_message = self.dao.create(
-            session_id=self.session_info["session_id"],
-            user_id=self.session_info["user_id"],
-            content=formatted_msg["content"],
-            role=formatted_msg["role"],
-            metadata=formatted_msg["metadata"]
-        )
         yield formatted_msg
 
     def _get_message_key(self, msg: Dict[str, Any]) -> str:
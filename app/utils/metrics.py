@@ -0,0 +1,117 @@
+"""프로세스 내 카운터/측정값을 집계하는 간단한 메트릭 레지스트리입니다."""
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict
+
+# 측정값별로 최근 샘플만 보관해 백분위수를 계산
+_SAMPLE_SIZE = 1024
+
+_lock = threading.Lock()
+_counters: Dict[str, float] = {}
+_observations: Dict[str, dict] = {}
+
+
+def increment(name: str, value: float = 1) -> None:
+    """카운터를 value만큼 증가시킵니다."""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + value
+
+
+def observe(name: str, value: float) -> None:
+    """측정값(지연 시간, 크기 등)을 기록합니다."""
+    with _lock:
+        entry = _observations.get(name)
+        if entry is None:
+            entry = {"count": 0, "sum": 0.0, "min": value, "max": value,
+                     "samples": deque(maxlen=_SAMPLE_SIZE)}
+            _observations[name] = entry
+        entry["count"] += 1
+        entry["sum"] += value
+        entry["min"] = min(entry["min"], value)
+        entry["max"] = max(entry["max"], value)
+        entry["samples"].append(value)
+
+
+@contextmanager
+def timer(name: str):
+    """블록 실행 시간을 밀리초 단위로 기록합니다."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(name, (time.perf_counter() - started) * 1000)
+
+
+def _percentile(samples: list, q: float) -> float:
+    index = min(len(samples) - 1, int(round(q * (len(samples) - 1))))
+    return samples[index]
+
+
+def snapshot() -> Dict[str, Any]:
+    """현재까지 집계된 카운터와 측정값 요약을 반환합니다."""
+    with _lock:
+        counters = dict(_counters)
+        observations = {}
+        for name, entry in _observations.items():
+            samples = sorted(entry["samples"])
+            observations[name] = {
+                "count": entry["count"],
+                "avg": round(entry["sum"] / entry["count"], 3),
+                "min": round(entry["min"], 3),
+                "max": round(entry["max"], 3),
+                "p50": round(_percentile(samples, 0.5), 3),
+                "p95": round(_percentile(samples, 0.95), 3)
+            }
+    return {"counters": counters, "observations": observations}
+
+
+def reset() -> None:
+    """모든 메트릭을 초기화합니다."""
+    with _lock:
+        _counters.clear()
+        _observations.clear()
+
+
+class StreamTimer:
+    """
+    스트리밍 응답 한 건의 time-to-first-token과 토큰 간 간격을 측정합니다.
+    측정값은 전역 메트릭(<prefix>.ttft_ms, <prefix>.inter_token_gap_ms, <prefix>.total_ms)에도 기록합니다.
+    """
+
+    def __init__(self, prefix: str):
+        self.prefix = prefix
+        self.started = time.perf_counter()
+        self.first_token_at = None
+        self.last_token_at = None
+        self.tokens = 0
+        self.max_gap_ms = 0.0
+        self._gap_sum_ms = 0.0
+
+    def mark_token(self) -> None:
+        now = time.perf_counter()
+        if self.first_token_at is None:
+            self.first_token_at = now
+            observe(f"{self.prefix}.ttft_ms", (now - self.started) * 1000)
+        else:
+            gap_ms = (now - self.last_token_at) * 1000
+            self._gap_sum_ms += gap_ms
+            self.max_gap_ms = max(self.max_gap_ms, gap_ms)
+            observe(f"{self.prefix}.inter_token_gap_ms", gap_ms)
+        self.last_token_at = now
+        self.tokens += 1
+
+    def finish(self) -> Dict[str, Any]:
+        """측정 결과 요약을 반환하고 전체 소요 시간을 기록합니다."""
+        total_ms = (time.perf_counter() - self.started) * 1000
+        observe(f"{self.prefix}.total_ms", total_ms)
+        gaps = self.tokens - 1
+        return {
+            "ttft_ms": round((self.first_token_at - self.started) * 1000, 1)
+            if self.first_token_at is not None else None,
+            "inter_token_gap_ms_avg": round(self._gap_sum_ms / gaps, 1) if gaps > 0 else None,
+            "inter_token_gap_ms_max": round(self.max_gap_ms, 1) if gaps > 0 else None,
+            "tokens": self.tokens,
+            "total_ms": round(total_ms, 1)
+        }
@@ -1,38 +1,147 @@
 import os
-from openai import AzureOpenAI
+import time
+import threading
+import httpx
+from openai import AzureOpenAI, DefaultHttpxClient
 from langchain.chat_models import init_chat_model
 from langchain_core.tools import BaseTool, tool
-from typing import List
-from app.utils.app_config import get_openai_config
+from typing import List, Optional
+from app.utils.app_config import (
+    get_openai_config, get_openai_pool_config, get_embedding_batch_config)
+from app.utils.embedding_cache import embedding_cache, cache_key
+from app.utils import metrics
+
+# 프로세스 단위로 재사용하는 클라이언트 레지스트리
+# NOTE: 매 호출마다 AzureOpenAI를 새로 만들면 커넥션 풀과 TLS 핸드셰이크가 매번 새로 생기므로
+#       (HTTP 클라이언트, AzureOpenAI, LangChain 채팅 모델)을 한 번만 만들고 keep-alive 커넥션을 재사용함.
+_registry = {}
+_registry_lock = threading.Lock()
+_registry_pid = os.getpid()
+
+
+def _reset_registry():
+    """fork된 자식 프로세스가 부모의 소켓을 공유하지 않도록 레지스트리를 초기화합니다."""
+    global _registry, _registry_lock, _registry_pid
+    _registry = {}
+    _registry_lock = threading.Lock()
+    _registry_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_registry)
+
+
+def _get_or_create(key, factory):
+    """레지스트리에서 key에 해당하는 객체를 반환하고, 없으면 한 번만 생성합니다."""
+    if _registry_pid != os.getpid():
+        _reset_registry()
+
+    instance = _registry.get(key)
+    if instance is not None:
+        return instance
+
+    with _registry_lock:
+        instance = _registry.get(key)
+        if instance is None:
+            instance = factory()
+            _registry[key] = instance
+    return instance
+
+
+def _get_http_client() -> httpx.Client:
+    """keep-alive 커넥션 풀을 가진 공유 HTTP 클라이언트를 반환합니다."""
+    pool = get_openai_pool_config()
+
+    def factory():
+        return DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=pool['max_connections'],
+                max_keepalive_connections=pool['max_keepalive_connections'],
+                keepalive_expiry=pool['keepalive_expiry']
+            ),
+            timeout=httpx.Timeout(pool['timeout'], connect=pool['connect_timeout'])
+        )
+
+    return _get_or_create(("http",), factory)
+
 
 def init_langchain_llm(tools: List[BaseTool] = None):
     """Initialize LangChain LLM with Azure OpenAI configuration"""
     config = get_openai_config()
+    pool = get_openai_pool_config()
     deployment_name = config['deployment_name']
-    llm = init_chat_model(
-        model=deployment_name,
-        model_provider="azure_openai",
-        azure_deployment=deployment_name,
-        azure_endpoint=config['endpoint'],
-        api_key=config['api_key'],
-        api_version=config['api_version'],
-        timeout=60,
-        streaming=True
-    )
+
+    def factory():
+        return init_chat_model(
+            model=deployment_name,
+            model_provider="azure_openai",
+            azure_deployment=deployment_name,
+            azure_endpoint=config['endpoint'],
+            api_key=config['api_key'],
+            api_version=config['api_version'],
+            timeout=pool['timeout'],
+            max_retries=pool['max_retries'],
+            http_client=_get_http_client(),
+            streaming=True
+        )
+
+    llm = _get_or_create(
+        ("chat", deployment_name, config['endpoint'], config['api_version']), factory)
 
     if tools:
-        return llm.bind_tools(tools)
+        return get_tool_bound_llm(llm, tools)
     return llm
 
+
+def get_tool_bound_llm(llm, tools: List[BaseTool]):
+    """
+    tools가 바인딩된 모델을 반환합니다.
+
+    bind_tools는 호출할 때마다 모든 도구의 JSON 스키마를 다시 만들기 때문에,
+    (모델, 도구 객체 목록) 조합별로 한 번만 바인딩해서 재사용합니다.
+    도구 목록이 바뀌면 키가 달라지므로 새로 바인딩되고, 이전 항목은 invalidate_tool_bound_llms()로 정리합니다.
+    """
+    started = time.perf_counter()
+    tools = tuple(tools)
+    key = ("bound", id(llm), tuple((tool.name, id(tool)) for tool in tools))
+
+    def factory():
+        bind_started = time.perf_counter()
+        bound = llm.bind_tools(list(tools))
+        metrics.observe("llm.bind_tools_ms", (time.perf_counter() - bind_started) * 1000)
+        metrics.increment("llm.bound_model_cache.miss")
+        # id 재사용을 막기 위해 도구 객체 참조를 함께 보관
+        return (tools, bound)
+
+    hit = key in _registry
+    _, bound = _get_or_create(key, factory)
+    if hit:
+        metrics.increment("llm.bound_model_cache.hit")
+    metrics.observe("llm.bound_model_lookup_ms", (time.perf_counter() - started) * 1000)
+    return bound
+
+
+def invalidate_tool_bound_llms() -> None:
+    """캐시된 도구 바인딩 모델을 모두 제거합니다. (MCP 도구 목록이 바뀌었을 때 호출)"""
+    with _registry_lock:
+        for key in [k for k in _registry if k[0] == "bound"]:
+            del _registry[key]
+
 def _get_openai_client():
     """Get configured Azure OpenAI client"""
     config = get_openai_config()
-    client = AzureOpenAI(
-        api_key=config['api_key'],
-        api_version=config['api_version'],
-        azure_endpoint=config['endpoint']
-    )
-    return client
+    pool = get_openai_pool_config()
+
+    def factory():
+        return AzureOpenAI(
+            api_key=config['api_key'],
+            api_version=config['api_version'],
+            azure_endpoint=config['endpoint'],
+            max_retries=pool['max_retries'],
+            http_client=_get_http_client()
+        )
+
+    return _get_or_create(("azure", config['endpoint'], config['api_version']), factory)
 
 def get_completion(messages, max_completion_tokens=3000):
     """Generate chat completion using Azure OpenAI."""
@@ -50,14 +159,100 @@ def get_completion(messages, max_completion_tokens=3000):
         raise RuntimeError(f"Error calling OpenAI API: {str(e)}")
 
 def get_embedding(text: str) -> list[float]:
-    """Generate embedding vector using Azure OpenAI."""
+    """Generate embedding vector using Azure OpenAI. (embedding_cache를 먼저 조회)"""
+    config = get_openai_config()
+    key = cache_key(config['embedding_deployment_name'], text)
+    cached = embedding_cache.get_many([key])
+    if key in cached:
+        return cached[key]
+
     client = _get_openai_client()
     try:
-        config = get_openai_config()
         response = client.embeddings.create(
             input=text,
             model=config['embedding_deployment_name']
         )
-        return response.data[0].embedding
+        vector = response.data[0].embedding
+    except Exception as e:
+        raise RuntimeError(f"Error calling OpenAI Embedding API: {str(e)}")
+    embedding_cache.set_many({key: vector})
+    return vector
+
+
+_tokenizer = None
+
+
+def count_tokens(text: str) -> int:
+    """배치 분할에 사용할 토큰 수를 계산합니다. (tiktoken을 쓸 수 없으면 글자 수로 근사)"""
+    global _tokenizer
+    if _tokenizer is None:
+        try:
+            import tiktoken
+            _tokenizer = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _tokenizer = False
+    if _tokenizer:
+        return len(_tokenizer.encode(text, disallowed_special=()))
+    return len(text)
+
+
+def chunk_by_token_budget(items: List[tuple], max_inputs: int, max_tokens: int):
+    """(key, text) 목록을 입력 개수/토큰 예산에 맞는 배치로 나눕니다."""
+    batch, batch_tokens = [], 0
+    for key, text in items:
+        tokens = count_tokens(text)
+        if batch and (len(batch) >= max_inputs or batch_tokens + tokens > max_tokens):
+            yield batch
+            batch, batch_tokens = [], 0
+        batch.append((key, text))
+        batch_tokens += tokens
+    if batch:
+        yield batch
+
+
+def get_embeddings(texts: List[str]) -> List[Optional[list[float]]]:
+    """여러 텍스트의 임베딩을 배치 요청으로 생성합니다.
+
+    결과는 입력 순서와 같고, 비어 있는 텍스트의 자리는 None입니다.
+    캐시에 있는 텍스트와 같은 배치 안의 중복 텍스트는 요청하지 않습니다.
+    """
+    results: List[Optional[list[float]]] = [None] * len(texts)
+    config = get_openai_config()
+    keys = {i: cache_key(config['embedding_deployment_name'], text)
+            for i, text in enumerate(texts) if text and text.strip()}
+    if not keys:
+        return results
+
+    cached = embedding_cache.get_many(list(set(keys.values())))
+    missing = {}
+    for i, key in keys.items():
+        if key in cached:
+            results[i] = cached[key]
+        else:
+            missing.setdefault(key, i)
+    if not missing:
+        return results
+
+    client = _get_openai_client()
+    batch_config = get_embedding_batch_config()
+    items = [(key, texts[i]) for key, i in missing.items()]
+    fetched = {}
+    try:
+        for batch in chunk_by_token_budget(
+                items, batch_config['batch_size'], batch_config['max_tokens']):
+            response = client.embeddings.create(
+                input=[text for _, text in batch],
+                model=config['embedding_deployment_name']
+            )
+            # 응답 순서가 보장되지 않으므로 data.index 기준으로 매핑
+            for data in response.data:
+                fetched[batch[data.index][0]] = data.embedding
     except Exception as e:
         raise RuntimeError(f"Error calling OpenAI Embedding API: {str(e)}")
+    finally:
+        embedding_cache.set_many(fetched)
+
+    for i, key in keys.items():
+        if results[i] is None:
+            results[i] = fetched.get(key)
+    return results
@@ -0,0 +1,160 @@
+"""여러 문서를 토큰 예산에 맞춰 한 번의 LLM 요청으로 요약하는 packing summarizer입니다."""
+import json
+import logging
+import re
+import threading
+from concurrent.futures import wait
+from typing import Dict, List, Optional
+
+from app.utils import metrics
+from app.utils.app_config import get_insight_document_config
+from app.utils.background_executor import BackgroundExecutor
+from app.utils.openai_client import chunk_by_token_budget, count_tokens, get_completion
+from app.utils.prompt.insight_prompts import BATCH_SUMMARY_PROMPT
+from app.utils.summary_cache import summary_cache
+
+log = logging.getLogger(__name__)
+
+SINGLE_SUMMARY_SYSTEM = "아래 뉴스들을 간단히 요약해주세요."
+BATCH_SUMMARY_SYSTEM = "여러 뉴스 기사를 기사별로 요약해 JSON으로만 답해주세요."
+# 요약 하나당 응답 토큰 여유분
+_SUMMARY_TOKENS = 400
+
+_WHITESPACE = re.compile(r'\s+')
+_executor: Optional[BackgroundExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> BackgroundExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = BackgroundExecutor(
+                    "insight-summary", max_workers=get_insight_document_config()['summary_workers'])
+    return _executor
+
+
+def _complete(messages, max_completion_tokens=3000) -> str:
+    """get_completion을 호출하고 요약 LLM 호출 수/토큰 수(추정)를 기록합니다."""
+    response = get_completion(messages, max_completion_tokens=max_completion_tokens)
+    metrics.increment("insight.summary.llm_calls")
+    metrics.increment("insight.summary.input_tokens", sum(count_tokens(m["content"]) for m in messages))
+    metrics.increment("insight.summary.output_tokens", count_tokens(response or ""))
+    return response
+
+
+def summarize_one(text: str) -> str:
+    """문서 하나를 요약합니다. (배치 응답을 해석하지 못했을 때의 fallback)"""
+    messages = [
+        {"role": "system", "content": SINGLE_SUMMARY_SYSTEM},
+        {"role": "user", "content": text}
+    ]
+    return _WHITESPACE.sub(' ', _complete(messages) or '').strip()
+
+
+def parse_batch_response(response: str, ids: List[str]) -> Dict[str, str]:
+    """{"summaries": [{"id", "summary"}]} 응답에서 요청한 id의 요약만 꺼냅니다. 형식이 틀리면 빈 dict."""
+    response = (response or '').strip()
+    # JSON 문자열이 코드블록(```json ... ```)으로 감싸져 있을 경우 처리
+    if response.startswith('```'):
+        response = response.strip('`').strip()
+        if response.startswith('json'):
+            response = response[4:]
+    try:
+        parsed = json.loads(response)
+    except (TypeError, ValueError):
+        return {}
+    items = parsed.get('summaries') if isinstance(parsed, dict) else parsed
+    if not isinstance(items, list):
+        return {}
+    wanted = set(ids)
+    summaries = {}
+    for item in items:
+        if isinstance(item, dict) and str(item.get('id')) in wanted and isinstance(item.get('summary'), str):
+            summary = _WHITESPACE.sub(' ', item['summary']).strip()
+            if summary:
+                summaries[str(item['id'])] = summary
+    return summaries
+
+
+def summarize_batch(batch: List[tuple]) -> Dict[str, str]:
+    """
+    (id, 본문) 목록을 한 번의 요청으로 요약합니다.
+    응답을 해석하지 못했거나 빠진 문서는 문서별 요청으로 다시 요약합니다.
+    """
+    if len(batch) == 1:
+        doc_id, text = batch[0]
+        return {doc_id: summarize_one(text)}
+
+    documents = json.dumps([{"id": doc_id, "text": text} for doc_id, text in batch], ensure_ascii=False)
+    messages = [
+        {"role": "system", "content": BATCH_SUMMARY_SYSTEM},
+        {"role": "user", "content": BATCH_SUMMARY_PROMPT.format(documents=documents)}
+    ]
+    try:
+        response = _complete(messages, max_completion_tokens=min(8000, 1000 + _SUMMARY_TOKENS * len(batch)))
+        summaries = parse_batch_response(response, [doc_id for doc_id, _ in batch])
+    except Exception as e:
+        log.warning("[PackingSummarizer] batch request failed: %s", e)
+        summaries = {}
+
+    texts = dict(batch)
+    missing = [doc_id for doc_id, _ in batch if doc_id not in summaries]
+    if missing:
+        metrics.increment("insight.summary.fallback", len(missing))
+        for doc_id in missing:
+            try:
+                summaries[doc_id] = summarize_one(texts[doc_id])
+            except Exception as e:
+                log.warning("[PackingSummarizer] summary failed for %s: %s", doc_id, e)
+    return summaries
+
+
+def pack(texts: List[str]) -> List[List[tuple]]:
+    """본문 목록을 요청당 문서 수/토큰 예산에 맞는 (id, 본문) 배치로 나눕니다. 긴 본문은 앞부분만 사용합니다."""
+    config = get_insight_document_config()
+    items = [(f"d{i}", text[:config['summary_doc_chars']]) for i, text in enumerate(texts)]
+    return list(chunk_by_token_budget(items, config['summary_batch_size'], config['summary_batch_tokens']))
+
+
+def summarize_documents(texts: List[str]) -> Dict[str, str]:
+    """
+    본문별 요약을 반환합니다. (key: 입력 본문)
+
+    - 캐시(본문 해시)에 있는 본문은 요청하지 않습니다.
+    - 나머지는 토큰 예산에 맞춰 묶은 배치 단위로 동시에 요청하고,
+      INSIGHT_SUMMARY_BUDGET(초) 안에 끝나지 않은 배치의 문서는 결과에서 제외합니다.
+    """
+    summaries = {}
+    missing = []
+    for text in dict.fromkeys(texts):
+        cached = summary_cache.get(text)
+        if cached is not None:
+            metrics.increment("insight.summary_cache.hit")
+            summaries[text] = cached
+        else:
+            metrics.increment("insight.summary_cache.miss")
+            missing.append(text)
+    if not missing:
+        return summaries
+
+    batches = pack(missing)
+    metrics.observe("insight.summary.batch_size", len(missing) / len(batches))
+    by_id = {f"d{i}": text for i, text in enumerate(missing)}
+    futures = [_get_executor().submit(summarize_batch, batch) for batch in batches]
+
+    done, not_done = wait(futures, timeout=get_insight_document_config()['summary_budget'])
+    for future in done:
+        try:
+            for doc_id, summary in future.result().items():
+                summaries[by_id[doc_id]] = summary
+                summary_cache.set(by_id[doc_id], summary)
+        except Exception as e:
+            log.warning("[PackingSummarizer] summary batch failed: %s", e)
+    for future in not_done:
+        future.cancel()
+    if not_done:
+        metrics.increment("insight.summary_timeout", len(not_done))
+        log.warning("[PackingSummarizer] %d summary batches exceeded the time budget", len(not_done))
+    return summaries
@@ -47,4 +47,15 @@ INSIGHT_COMPARE_PROMPT = """
 [출력 예시]
 분석 요약: ...
 related_keywords: ["키워드1", "키워드2", ...]
-"""
\ No newline at end of file
+"""
+BATCH_SUMMARY_PROMPT = """
+아래 뉴스 기사들을 각각 간단히 요약해줘.
+
+[출력 형식]
+- 반드시 아래 JSON 형태로만 답할 것 (코드블록, 설명 없이)
+- 기사마다 하나의 항목을 만들고, id는 입력 기사의 id를 그대로 사용할 것
+{{"summaries": [{{"id": "기사 id", "summary": "요약"}}]}}
+
+[기사 목록]
+{documents}
+"""
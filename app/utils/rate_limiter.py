@@ -0,0 +1,70 @@
+"""외부 API 제공자별 호출 빈도를 제한하는 토큰 버킷 레이트 리미터입니다."""
+import threading
+import time
+from typing import Dict, Optional
+
+from app.utils import metrics
+from app.utils.app_config import get_search_config
+
+
+class RateLimiter:
+    """
+    초당 rate개의 토큰을 채우는 토큰 버킷입니다.
+
+    - acquire()는 토큰이 생길 때까지 기다린 뒤 하나를 소비합니다. (스레드 안전)
+    - burst만큼은 기다리지 않고 연속으로 호출할 수 있습니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated_at = clock()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고, 사용 가능해질 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            # 토큰을 먼저 빼 두므로 대기 중인 호출끼리 같은 토큰을 두고 경쟁하지 않음
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """호출 가능해질 때까지 기다립니다. 기다린 시간(초)을 반환합니다."""
+        delay = self._reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+_limiters: Dict[str, Optional[RateLimiter]] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str) -> Optional[RateLimiter]:
+    """제공자별 리미터를 반환합니다. 설정된 제한이 없으면 None을 반환합니다."""
+    if provider not in _limiters:
+        with _limiters_lock:
+            if provider not in _limiters:
+                rate = get_search_config()['rate_limits'].get(provider)
+                _limiters[provider] = RateLimiter(rate) if rate else None
+    return _limiters[provider]
+
+
+def acquire(provider: str) -> None:
+    """provider의 호출 한도 안에서 실행되도록 필요한 만큼 기다립니다."""
+    limiter = get_rate_limiter(provider)
+    if limiter is None:
+        return
+    waited = limiter.acquire()
+    metrics.increment(f"rate_limit.{provider}.calls")
+    if waited > 0:
+        metrics.observe(f"rate_limit.{provider}.wait_ms", waited * 1000)
@@ -0,0 +1,229 @@
+"""공유 Redis 클라이언트와 테스트/단일 노드용 인프로세스 대체 구현을 제공합니다."""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+import redis
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
+from redis.exceptions import TimeoutError as RedisTimeoutError
+from redis.retry import Retry
+
+from app.utils.app_config import get_redis_config
+
+_client = None
+_client_lock = threading.Lock()
+_client_pid = os.getpid()
+
+
+def _create_redis_client(config: dict) -> redis.Redis:
+    """커넥션 풀 크기, 타임아웃, 헬스 체크, 지수 백오프 재시도를 설정한 Redis 클라이언트를 만듭니다."""
+    connection_kwargs = {
+        "host": config['redis_url'],
+        "port": config['redis_port'],
+        "db": 0,
+        "password": config['redis_key'],
+        "socket_timeout": config['socket_timeout'],
+        "socket_connect_timeout": config['connect_timeout'],
+        "socket_keepalive": True,
+        "health_check_interval": config['health_check_interval'],
+        "retry": Retry(ExponentialBackoff(cap=1.0, base=0.05), config['retries']),
+        "retry_on_error": [RedisConnectionError, RedisTimeoutError],
+    }
+    if config['ssl']:
+        connection_kwargs["connection_class"] = redis.SSLConnection
+    pool = redis.ConnectionPool(max_connections=config['max_connections'], **connection_kwargs)
+    return redis.Redis(connection_pool=pool)
+
+
+def get_redis():
+    """
+    설정된 백엔드의 공유 클라이언트를 반환합니다. (프로세스당 하나, 첫 사용 시 생성)
+
+    - AGENT_STATE_BACKEND=redis: 커넥션 풀을 쓰는 redis.Redis
+    - AGENT_STATE_BACKEND=local: 프로세스 내 LRU 저장소 (테스트/단일 노드용)
+    """
+    global _client, _client_lock, _client_pid
+    if _client_pid != os.getpid():
+        # fork된 자식은 부모의 소켓을 공유하지 않도록 새로 만듦
+        _client, _client_lock, _client_pid = None, threading.Lock(), os.getpid()
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                config = get_redis_config()
+                if config['backend'] == 'local':
+                    _client = LocalRedis(max_keys=config['local_max_keys'])
+                else:
+                    _client = _create_redis_client(config)
+    return _client
+
+
+def is_local_backend() -> bool:
+    return get_redis_config()['backend'] == 'local'
+
+
+class LocalRedis:
+    """
+    AgentStateStore/임베딩 캐시가 사용하는 Redis 명령만 구현한 인프로세스 저장소입니다.
+    키 개수가 max_keys를 넘으면 가장 오래 사용되지 않은 키부터 제거합니다.
+    """
+
+    def __init__(self, max_keys: int = 10000):
+        self.max_keys = max_keys
+        self._data: "OrderedDict[str, Any]" = OrderedDict()
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def _key(key) -> str:
+        return key.decode() if isinstance(key, bytes) else key
+
+    @staticmethod
+    def _bytes(value) -> bytes:
+        if isinstance(value, bytes):
+            return value
+        return str(value).encode()
+
+    def _get(self, key: str):
+        key = self._key(key)
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+            return None
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def _put(self, key: str, value, ex: Optional[float] = None):
+        key = self._key(key)
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if ex:
+            self._expires[key] = time.monotonic() + ex
+        else:
+            self._expires.pop(key, None)
+        while len(self._data) > self.max_keys:
+            evicted, _ = self._data.popitem(last=False)
+            self._expires.pop(evicted, None)
+
+    # String
+    def get(self, key):
+        with self._lock:
+            return self._get(key)
+
+    def mget(self, keys):
+        with self._lock:
+            return [self._get(key) for key in keys]
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._put(key, self._bytes(value), ex)
+            return True
+
+    def setex(self, key, time_seconds, value):
+        return self.set(key, value, ex=time_seconds)
+
+    def delete(self, *keys) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                key = self._key(key)
+                if self._data.pop(key, None) is not None:
+                    removed += 1
+                self._expires.pop(key, None)
+            return removed
+
+    # List
+    def rpush(self, key, *values) -> int:
+        with self._lock:
+            items = self._get(key) or []
+            items.extend(self._bytes(value) for value in values)
+            self._put(key, items)
+            return len(items)
+
+    def lrange(self, key, start, end) -> List[bytes]:
+        with self._lock:
+            items = self._get(key) or []
+            end = len(items) if end == -1 else end + 1
+            return list(items[start:end])
+
+    def ltrim(self, key, start, end) -> bool:
+        with self._lock:
+            items = self._get(key)
+            if items is None:
+                return True
+            end = len(items) if end == -1 else end + 1
+            trimmed = items[start:end]
+            if trimmed:
+                self._put(key, trimmed)
+            else:
+                self.delete(key)
+            return True
+
+    # Hash
+    def hset(self, key, field=None, value=None, mapping=None) -> int:
+        with self._lock:
+            fields = self._get(key) or {}
+            updates = dict(mapping or {})
+            if field is not None:
+                updates[field] = value
+            added = 0
+            for name, item in updates.items():
+                name = self._bytes(name)
+                added += name not in fields
+                fields[name] = self._bytes(item)
+            self._put(key, fields)
+            return added
+
+    def hgetall(self, key) -> Dict[bytes, bytes]:
+        with self._lock:
+            return dict(self._get(key) or {})
+
+    def hdel(self, key, *names) -> int:
+        with self._lock:
+            fields = self._get(key)
+            if not fields:
+                return 0
+            removed = sum(fields.pop(self._bytes(name), None) is not None for name in names)
+            if not fields:
+                self.delete(key)
+            return removed
+
+    def ping(self) -> bool:
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "_LocalPipeline":
+        return _LocalPipeline(self)
+
+
+class _LocalPipeline:
+    """명령을 모아 두었다가 execute()에서 락을 잡고 한 번에 실행합니다."""
+
+    def __init__(self, client: LocalRedis):
+        self._client = client
+        self._commands = []
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> list:
+        with self._client._lock:
+            results = [method(*args, **kwargs) for method, args, kwargs in self._commands]
+        self._commands = []
+        return results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
@@ -0,0 +1,47 @@
+"""본문 내용 해시를 키로 하는 요약 결과 캐시입니다."""
+import hashlib
+import threading
+from typing import Optional
+
+from app.utils.app_config import get_insight_document_config
+from app.utils.cache import LRUCache
+
+
+def content_key(text: str, kind: str = "news") -> str:
+    digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    return f"summary:{kind}:{digest}"
+
+
+class SummaryCache:
+    """
+    같은 기사 본문은 URL이나 사용자가 달라도 한 번만 요약하도록 (요약 종류, 본문 해시)로 캐시합니다.
+    """
+
+    def __init__(self):
+        self._cache: Optional[LRUCache] = None
+        self._lock = threading.Lock()
+
+    @property
+    def cache(self) -> LRUCache:
+        if self._cache is None:
+            with self._lock:
+                if self._cache is None:
+                    config = get_insight_document_config()
+                    self._cache = LRUCache(maxsize=config['summary_cache_size'], ttl=config['summary_cache_ttl'])
+        return self._cache
+
+    def get(self, text: str, kind: str = "news") -> Optional[str]:
+        return self.cache.get(content_key(text, kind))
+
+    def set(self, text: str, summary: str, kind: str = "news") -> None:
+        if summary:
+            self.cache.set(content_key(text, kind), summary)
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+    def clear(self) -> None:
+        self.cache.clear()
+
+
+summary_cache = SummaryCache()
@@ -0,0 +1,175 @@
+"""(도구 이름, 정규화된 입력)을 키로 하는 도구 실행 결과 캐시입니다."""
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from app.utils import metrics
+from app.utils.app_config import get_tool_cache_config
+from app.utils.cache import LRUCache
+
+log = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+# 사용자와 무관하게 같은 입력이면 같은 결과를 돌려주는 도구만 캐시 (도구별 TTL, 초)
+DEFAULT_TOOL_TTLS: Dict[str, float] = {
+    "search_web": 600,
+    "google_search": 3600,
+    "google_search_expansion": 3600,
+    "google_news": 900,
+}
+
+_ERROR_PREFIXES = ("검색 중 오류", "Error executing", "예외 발생")
+
+
+def normalize_input(value: Any) -> Any:
+    """캐시 키 계산용으로 문자열 공백/대소문자와 dict 키 순서를 정규화합니다."""
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", value)).strip().lower()
+    if isinstance(value, dict):
+        return {str(k).strip(): normalize_input(v) for k, v in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [normalize_input(v) for v in value]
+    return value
+
+
+def tool_cache_key(tool_name: str, tool_input: Any) -> str:
+    payload = json.dumps(normalize_input(tool_input), ensure_ascii=False, sort_keys=True, default=str)
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"tool:{tool_name}:{digest}"
+
+
+def is_error_result(result: Any) -> bool:
+    """오류 응답은 캐시하지 않도록 판별합니다."""
+    if result is None:
+        return True
+    if isinstance(result, str):
+        return result.startswith(_ERROR_PREFIXES)
+    if isinstance(result, dict):
+        return "error" in result
+    if isinstance(result, list):
+        return any(isinstance(item, dict) and "error" in item for item in result)
+    return False
+
+
+class ToolResultCache:
+    """
+    도구 실행 결과 캐시입니다.
+
+    - 도구별 TTL 동안은 캐시된 결과를 그대로 반환합니다. (fresh)
+    - TTL이 지난 뒤 stale_seconds 동안은 기존 결과를 바로 반환하고, 백그라운드에서 다시 실행해 갱신합니다. (stale-while-revalidate)
+    - 그 이후에는 만료되어 다시 실행합니다. 전체 항목 수는 LRU로 제한합니다.
+    - TTL이 정의되지 않은 도구나 오류 결과는 캐시하지 않습니다.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, clock=time.monotonic):
+        self._ttls = ttls
+        self._clock = clock
+        self._store: Optional[LRUCache] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing = set()
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def config(self) -> dict:
+        return get_tool_cache_config()
+
+    @property
+    def store(self) -> LRUCache:
+        if self._store is None:
+            with self._lock:
+                if self._store is None:
+                    self._store = LRUCache(maxsize=self.config['size'], clock=self._clock)
+        return self._store
+
+    def ttl_for(self, tool_name: str) -> Optional[float]:
+        ttls = self._ttls if self._ttls is not None else {**DEFAULT_TOOL_TTLS, **self.config['ttls']}
+        return ttls.get(tool_name)
+
+    def is_cacheable(self, tool_name: str) -> bool:
+        return self.config['enabled'] and bool(self.ttl_for(tool_name))
+
+    def _record(self, tool_name: str, outcome: str) -> None:
+        metrics.increment(f"tool_cache.{tool_name}.{outcome}")
+        with self._lock:
+            counts = self._stats.setdefault(tool_name, {"hits": 0, "stale_hits": 0, "misses": 0})
+            counts[outcome] += 1
+
+    def _store_result(self, key: str, tool_name: str, result: Any) -> None:
+        if is_error_result(result):
+            return
+        ttl = self.ttl_for(tool_name)
+        fresh_until = self._clock() + ttl
+        self.store.set(key, (result, fresh_until), ttl=ttl + self.config['stale_seconds'])
+
+    def _refresh(self, key: str, tool_name: str, fn: Callable[[], Any]) -> None:
+        try:
+            with metrics.timer(f"tool_cache.{tool_name}.refresh_ms"):
+                self._store_result(key, tool_name, fn())
+        except Exception as e:
+            log.warning("[ToolResultCache] refresh failed for %s: %s", tool_name, e)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _schedule_refresh(self, key: str, tool_name: str, fn: Callable[[], Any]) -> None:
+        with self._lock:
+            # 같은 키의 갱신이 이미 진행 중이면 중복 실행하지 않음
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.config['refresh_workers'], thread_name_prefix="tool-cache")
+            executor = self._executor
+        executor.submit(self._refresh, key, tool_name, fn)
+
+    def get_or_call(self, tool_name: str, tool_input: Any, fn: Callable[[], Any]) -> Any:
+        """캐시된 결과가 있으면 반환하고, 없으면 fn()을 실행해 결과를 저장합니다."""
+        if not self.is_cacheable(tool_name):
+            return fn()
+
+        key = tool_cache_key(tool_name, tool_input)
+        entry = self.store.get(key)
+        if entry is not None:
+            result, fresh_until = entry
+            if fresh_until > self._clock():
+                self._record(tool_name, "hits")
+            else:
+                self._record(tool_name, "stale_hits")
+                self._schedule_refresh(key, tool_name, fn)
+            return result
+
+        self._record(tool_name, "misses")
+        result = fn()
+        self._store_result(key, tool_name, result)
+        return result
+
+    def stats(self) -> dict:
+        """캐시 크기와 도구별 적중률을 반환합니다."""
+        stats = self.store.stats()
+        tools = {}
+        with self._lock:
+            for tool_name, counts in self._stats.items():
+                total = counts["hits"] + counts["stale_hits"] + counts["misses"]
+                tools[tool_name] = {
+                    **counts,
+                    "hit_rate": round((counts["hits"] + counts["stale_hits"]) / total, 4) if total else 0.0
+                }
+        stats.update({"enabled": self.config['enabled'], "tools": tools})
+        return stats
+
+    def clear(self) -> None:
+        self.store.clear()
+        with self._lock:
+            self._stats.clear()
+
+
+tool_result_cache = ToolResultCache()
@@ -0,0 +1,82 @@
+"""
+AgentState 직렬화 벤치마크: pickle vs agent_state_codec(orjson, orjson+zstd)
+
+대화 길이(메시지 수)별로 인코딩/디코딩 시간과 저장 크기를 비교합니다.
+
+사용 예:
+    python benchmarks/agent_state_codec_bench.py --sizes 10 100 1000
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils.agent_state_codec import decode_state, encode_state  # noqa: E402
+
+
+def build_state(size: int) -> dict:
+    """사용자 → 도구 호출 → 도구 결과 → 응답 패턴을 반복한 대화 상태를 만듭니다."""
+    messages = []
+    for i in range(size):
+        kind = i % 4
+        if kind == 0:
+            messages.append(HumanMessage(content=f"{i}번째 질문입니다. 내일 서울 날씨랑 일정 알려줘."))
+        elif kind == 1:
+            messages.append(AIMessage(content="", tool_calls=[{
+                "id": f"call_{i}", "name": "search_web", "args": {"query": f"서울 날씨 {i}"}}]))
+        elif kind == 2:
+            messages.append(ToolMessage(content="맑음, 최고 27도 최저 18도. " * 10,
+                                        tool_call_id=f"call_{i - 1}", name="search_web"))
+        else:
+            messages.append(AIMessage(content="내일 서울은 맑고 최고 27도입니다. 오후 3시에 회의 일정이 있어요. " * 3))
+    return {
+        "messages": messages,
+        "summary": "사용자는 서울에 살고 있으며 일정 관리를 자주 요청함.",
+        "user_id": "03823edc-9d2e-4040-b104-1d958bcf8013",
+        "current_input": "내일 날씨 알려줘",
+        "scratchpad": [],
+        "step_count": 3,
+        "next_step": "agent",
+    }
+
+
+def measure(encode, decode, state, repeat: int):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        data = encode(state)
+    encode_ms = (time.perf_counter() - started) * 1000 / repeat
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        decode(data)
+    decode_ms = (time.perf_counter() - started) * 1000 / repeat
+    return encode_ms, decode_ms, len(data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    codecs = {
+        "pickle": (pickle.dumps, pickle.loads),
+        "orjson": (lambda s: encode_state(s, compress=False), decode_state),
+        "orjson+zstd": (lambda s: encode_state(s, compress=True), decode_state),
+    }
+
+    print(f"{'messages':>8}  {'codec':<12} {'encode(ms)':>10} {'decode(ms)':>10} {'bytes':>10}")
+    for size in args.sizes:
+        state = build_state(size)
+        for name, (encode, decode) in codecs.items():
+            encode_ms, decode_ms, size_bytes = measure(encode, decode, state, args.repeat)
+            print(f"{size:>8}  {name:<12} {encode_ms:>10.3f} {decode_ms:>10.3f} {size_bytes:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+백그라운드 작업 시작 비용 벤치마크: 작업마다 create_app() vs BackgroundExecutor(공유 앱 컨텍스트)
+
+세션 종료 후처리처럼 작업 하나를 실행할 때 드는 준비 비용(앱 생성, 라우트 등록, 로깅 설정,
+DB 엔진/커넥션 생성)을 비교합니다. 각 작업은 SELECT 1 한 번만 실행합니다.
+
+사용 예:
+    python benchmarks/background_startup_bench.py --jobs 20
+    python benchmarks/background_startup_bench.py --jobs 20 --no-db   # DB 없이 앱 생성 비용만 측정
+
+접속 정보는 앱과 같은 PG* 환경 변수를 사용합니다.
+"""
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("JWT_ACCESS_TOKEN_EXPIRES", "3600")
+
+from sqlalchemy import text  # noqa: E402
+
+from app import create_app  # noqa: E402
+from app.models.db import db  # noqa: E402
+from app.utils.background_executor import BackgroundExecutor  # noqa: E402
+
+
+def job(use_db: bool):
+    if use_db:
+        db.session.execute(text("SELECT 1"))
+
+
+def per_job_create_app(jobs: int, use_db: bool) -> list:
+    """이전 방식: 작업마다 새 앱을 만들고 그 컨텍스트에서 실행"""
+    timings = []
+    for _ in range(jobs):
+        started = time.perf_counter()
+        app = create_app()
+        with app.app_context():
+            job(use_db)
+            db.session.remove()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def shared_executor(jobs: int, use_db: bool) -> list:
+    """현재 방식: 이미 만든 앱의 컨텍스트를 워커 스레드로 넘겨 실행"""
+    app = create_app()
+    executor = BackgroundExecutor("bench", max_workers=1)
+    timings = []
+    with app.app_context():
+        for _ in range(jobs):
+            started = time.perf_counter()
+            executor.submit(job, use_db).result()
+            timings.append((time.perf_counter() - started) * 1000)
+    executor.shutdown()
+    return timings
+
+
+def report(name: str, timings: list):
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    print(f"{name:<20} {statistics.mean(timings):>10.2f} {statistics.median(timings):>10.2f} {p95:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20)
+    parser.add_argument("--no-db", action="store_true", help="DB 쿼리 없이 실행")
+    args = parser.parse_args()
+    use_db = not args.no_db
+
+    # 벤치마크 출력에 SQL 로그가 섞이지 않도록 함
+    logging.disable(logging.INFO)
+
+    print(f"{'mode':<20} {'mean(ms)':>10} {'p50(ms)':>10} {'p95(ms)':>10}")
+    report("create_app per job", per_job_create_app(args.jobs, use_db))
+    report("shared executor", shared_executor(args.jobs, use_db))
+    print(f"\napp logger handlers after {args.jobs + 1} create_app() calls: "
+          f"{len(logging.getLogger('app').handlers)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+인사이트 뉴스 검색(search_web_for_keywords) 벤치마크: 순차 검색 vs 동시 검색
+
+google_news 호출을 sleep으로 대신해 키워드 수 x 기간(최신/과거)만큼의 검색 wall-clock을 측정합니다.
+동시 실행 시간은 가장 느린 호출 하나(+ 레이트 리미터 대기)에 가까워야 합니다.
+
+사용 예:
+    python benchmarks/insight_search_bench.py --keywords 5 --call-ms 300 --workers 1 10
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.langgraph.insight.nodes import web_search  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keywords", type=int, default=5)
+    parser.add_argument("--call-ms", type=int, default=300, help="검색 호출 한 번의 최대 지연")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 10])
+    args = parser.parse_args()
+
+    def fake_search(keyword, tbs):
+        time.sleep(random.uniform(0.5, 1.0) * args.call_ms / 1000)
+        return {"news": [{"title": f"{keyword} {tbs}", "link": f"https://news.example.com/{keyword}/{tbs}"}]}
+
+    web_search._search_news = fake_search
+    keywords = [f"keyword{i}" for i in range(args.keywords)]
+    calls = args.keywords * len(web_search.NEWS_PERIODS)
+    print(f"calls={calls}, call<={args.call_ms}ms")
+    print(f"{'workers':>8} {'wall(ms)':>10} {'/call':>8}")
+    for workers in args.workers:
+        # 앱 컨텍스트 없이 실행하기 위해 BackgroundExecutor 대신 일반 스레드 풀 사용
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            web_search._executor = pool
+            started = time.perf_counter()
+            context = web_search.search_web_for_keywords({"keywords": keywords})
+            wall_ms = (time.perf_counter() - started) * 1000
+        assert list(context["recent_news"]) == keywords and len(context["source"]) == calls
+        print(f"{workers:>8} {wall_ms:>10.0f} {wall_ms / args.call_ms:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
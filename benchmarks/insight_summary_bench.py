@@ -0,0 +1,87 @@
+"""
+인사이트 기사 요약 벤치마크: 기사별 요청(이전 방식) vs packing summarizer(기사 여러 개를 한 요청으로)
+
+get_completion을 가짜 LLM으로 바꿔, 인사이트 한 건에서 필요한 기사 요약의 LLM 호출 수와 입력/출력 토큰 수를 비교합니다.
+(토큰 수는 openai_client.count_tokens 기준 추정치)
+
+사용 예:
+    python benchmarks/insight_summary_bench.py --articles 20 --chars 3000
+"""
+import argparse
+import json
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.utils import packing_summarizer  # noqa: E402
+from app.utils.openai_client import count_tokens  # noqa: E402
+from app.utils.summary_cache import summary_cache  # noqa: E402
+
+_DOCUMENTS_MARKER = "[기사 목록]"
+
+
+class FakeLLM:
+    def __init__(self, summary_chars: int):
+        self.summary_chars = summary_chars
+        self.calls = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    def __call__(self, messages, max_completion_tokens=3000):
+        prompt = messages[-1]["content"]
+        if _DOCUMENTS_MARKER in prompt:
+            documents = json.loads(prompt.split(_DOCUMENTS_MARKER, 1)[1])
+            response = json.dumps({"summaries": [
+                {"id": doc["id"], "summary": doc["text"][:self.summary_chars]} for doc in documents
+            ]}, ensure_ascii=False)
+        else:
+            response = prompt[:self.summary_chars]
+        self.calls += 1
+        self.input_tokens += sum(count_tokens(m["content"]) for m in messages)
+        self.output_tokens += count_tokens(response)
+        return response
+
+
+def make_articles(count: int, chars: int):
+    words = ["인공지능", "반도체", "시장", "투자", "정책", "기업", "발표", "성장", "전망", "기술"]
+    return [" ".join(random.choice(words) for _ in range(chars // 4)) + f" #{i}" for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--articles", type=int, default=20, help="인사이트 한 건에서 요약할 기사 수")
+    parser.add_argument("--chars", type=int, default=3000, help="기사 본문 길이")
+    parser.add_argument("--summary-chars", type=int, default=300)
+    args = parser.parse_args()
+
+    articles = make_articles(args.articles, args.chars)
+    packing_summarizer._executor = ThreadPoolExecutor(max_workers=4)
+
+    results = {}
+    # 이전 방식: 기사마다 한 번씩 요약 요청
+    llm = FakeLLM(args.summary_chars)
+    packing_summarizer.get_completion = llm
+    for text in articles:
+        packing_summarizer.summarize_one(text)
+    results["per-article"] = llm
+
+    # packing summarizer
+    summary_cache.clear()
+    llm = FakeLLM(args.summary_chars)
+    packing_summarizer.get_completion = llm
+    summaries = packing_summarizer.summarize_documents(articles)
+    assert len(summaries) == len(articles)
+    results["packed"] = llm
+
+    print(f"articles={args.articles}, chars/article={args.chars}")
+    print(f"{'mode':>12} {'llm calls':>10} {'input tok':>10} {'output tok':>11}")
+    for mode, llm in results.items():
+        print(f"{mode:>12} {llm.calls:>10} {llm.input_tokens:>10} {llm.output_tokens:>11}")
+    packing_summarizer._executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+백그라운드 자동 업무 PlanStep 스케줄러 벤치마크: 순차 실행 vs 의존 관계 기반 병렬 실행
+
+도구 실행을 sleep으로 대신한 가짜 plan(fan-out 후 합치는 형태)으로 run_plan의 wall-clock을 측정합니다.
+병렬 실행 시간은 가장 긴 의존 경로(critical path) 길이에 가까워야 합니다.
+
+사용 예:
+    python benchmarks/plan_scheduler_bench.py --width 4 --step-ms 200 --parallel 1 2 4 8
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.langgraph.background.nodes import run_ready_steps as scheduler  # noqa: E402
+
+
+def build_task(width: int) -> dict:
+    """search_0..search_{width-1} (독립) → summarize (모두에 의존) → report (summarize에 의존)"""
+    plan = {}
+    search_ids = [f"search_{i}" for i in range(width)]
+    for step_id in search_ids:
+        plan[step_id] = {"step_id": step_id, "tool": "search_web", "depends_on": [],
+                         "status": "pending", "attempt": 0, "max_attempt": 2}
+    plan["summarize"] = {"step_id": "summarize", "tool": "summarize", "depends_on": search_ids,
+                         "status": "pending", "attempt": 0, "max_attempt": 2}
+    plan["report"] = {"step_id": "report", "tool": "report", "depends_on": ["summarize"],
+                      "status": "pending", "attempt": 0, "max_attempt": 2}
+    return {"task_id": "bench", "plan": plan, "ready_queue": list(plan), "completed_ids": []}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--width", type=int, default=4, help="서로 독립적인 Step 수")
+    parser.add_argument("--step-ms", type=int, default=200, help="Step 하나의 실행 시간")
+    parser.add_argument("--parallel", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    def fake_step(step):
+        time.sleep(args.step_ms / 1000)
+        step["status"] = "done"
+        step["output"] = {"quality_score": 1.0}
+        return step
+
+    critical_path_ms = 3 * args.step_ms
+    print(f"steps={args.width + 2}, step={args.step_ms}ms, critical path={critical_path_ms}ms")
+    print(f"{'parallel':>8} {'wall(ms)':>10} {'/critical':>10}")
+    for max_parallel in args.parallel:
+        task = build_task(args.width)
+        with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+            started = time.perf_counter()
+            error = scheduler.run_plan(
+                task, lambda step_id: pool.submit(fake_step, task["plan"][step_id]), max_parallel)
+            wall_ms = (time.perf_counter() - started) * 1000
+        assert error is None and len(task["completed_ids"]) == len(task["plan"])
+        print(f"{max_parallel:>8} {wall_ms:>10.0f} {wall_ms / critical_path_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+message.vector 유사도 검색 벤치마크: HNSW 인덱스 vs 정확한 전체 스캔
+
+별도 테이블(bench_message_vector)에 무작위 벡터를 채운 뒤 MessageDAO.get_similar_pgvector와 같은 형태의
+쿼리(user_id 필터 + 거리 정렬 + LIMIT)를 실행해 recall@k와 지연 시간(p50/p95)을 비교합니다.
+
+user_id 필터는 HNSW 탐색 후에 적용되므로 사용자가 많을수록 ef_search개 후보 중 해당 사용자의 행이 적어
+top_k를 채우지 못합니다(short). --users로 사용자 수를, --iterative-scan으로 hnsw.iterative_scan(pgvector 0.8+)을
+바꿔 가며 비교하세요.
+
+사용 예:
+    python benchmarks/vector_index_bench.py --sizes 10000 100000 1000000 --ef-search 40 100 200
+    python benchmarks/vector_index_bench.py --sizes 100000 --users 10 1000 10000 --iterative-scan off relaxed_order
+
+접속 정보는 앱과 같은 PG* 환경 변수(PGHOST, PGPORT, PGUSER, PGPASSWORD, PGDATABASE)를 사용합니다.
+1M x 1536차원은 약 6GB이므로 필요하면 --dim을 줄여서 실행하세요.
+"""
+import argparse
+import io
+import os
+import statistics
+import time
+
+import numpy as np
+import psycopg2
+
+TABLE = "bench_message_vector"
+OPERATORS = {"l2": ("<->", "vector_l2_ops"), "cosine": ("<=>", "vector_cosine_ops")}
+
+
+def connect():
+    conn = psycopg2.connect(
+        host=os.getenv("PGHOST"), port=os.getenv("PGPORT"), user=os.getenv("PGUSER"),
+        password=os.getenv("PGPASSWORD"), dbname=os.getenv("PGDATABASE"),
+        sslmode=os.getenv("PGSSLMODE", "prefer"))
+    conn.autocommit = True
+    return conn
+
+
+def vector_literal(vector) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+
+
+def load_rows(conn, size: int, dim: int, users: int, rng: np.random.Generator):
+    with conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.execute(f"CREATE TABLE {TABLE} (id bigserial PRIMARY KEY, user_id int NOT NULL, "
+                    f"vector vector({dim}) NOT NULL)")
+        chunk = 10000
+        for start in range(0, size, chunk):
+            n = min(chunk, size - start)
+            vectors = rng.standard_normal((n, dim)).astype(np.float32)
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+            user_ids = rng.integers(0, users, n)
+            buf = io.StringIO()
+            for user_id, vector in zip(user_ids, vectors):
+                buf.write(f"{user_id}\t{vector_literal(vector)}\n")
+            buf.seek(0)
+            cur.copy_expert(f"COPY {TABLE} (user_id, vector) FROM STDIN", buf)
+        cur.execute(f"CREATE INDEX ON {TABLE} (user_id)")
+        cur.execute(f"ANALYZE {TABLE}")
+
+
+def build_hnsw(conn, metric: str, m: int, ef_construction: int) -> float:
+    opclass = OPERATORS[metric][1]
+    started = time.perf_counter()
+    with conn.cursor() as cur:
+        cur.execute(f"CREATE INDEX {TABLE}_hnsw ON {TABLE} USING hnsw (vector {opclass}) "
+                    f"WITH (m = {m}, ef_construction = {ef_construction})")
+    return time.perf_counter() - started
+
+
+def run_queries(conn, queries, metric: str, top_k: int, exact: bool, ef_search=None, iterative_scan="off"):
+    operator = OPERATORS[metric][0]
+    results, latencies = [], []
+    with conn.cursor() as cur:
+        cur.execute("BEGIN")
+        if exact:
+            cur.execute("SET LOCAL enable_indexscan = off")
+        else:
+            if ef_search:
+                cur.execute(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+            if iterative_scan != "off":
+                cur.execute("SELECT set_config('hnsw.iterative_scan', %s, true)", (iterative_scan,))
+        for user_id, vector in queries:
+            started = time.perf_counter()
+            cur.execute(
+                f"SELECT id FROM {TABLE} WHERE user_id = %s "
+                f"ORDER BY vector {operator} %s::vector LIMIT %s",
+                (int(user_id), vector_literal(vector), top_k))
+            results.append([row[0] for row in cur.fetchall()])
+            latencies.append((time.perf_counter() - started) * 1000)
+        cur.execute("COMMIT")
+    return results, latencies
+
+
+def recall(expected, actual) -> float:
+    hits = sum(len(set(e) & set(a)) for e, a in zip(expected, actual))
+    total = sum(len(e) for e in expected)
+    return hits / total if total else 1.0
+
+
+def short_rate(expected, actual) -> float:
+    """정확한 결과보다 적은 행을 돌려준(top_k를 채우지 못한) 쿼리 비율"""
+    short = sum(len(a) < len(e) for e, a in zip(expected, actual))
+    return short / len(expected) if expected else 0.0
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    return statistics.median(latencies), p95
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000, 1000000])
+    parser.add_argument("--dim", type=int, default=1536)
+    parser.add_argument("--users", type=int, nargs="+", default=[100, 10000], help="user_id 필터에 쓸 사용자 수")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=5)
+    parser.add_argument("--metric", choices=OPERATORS.keys(), default="l2")
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200])
+    parser.add_argument("--iterative-scan", nargs="+", default=["off", "relaxed_order"],
+                        choices=["off", "relaxed_order", "strict_order"])
+    parser.add_argument("--m", type=int, default=16)
+    parser.add_argument("--ef-construction", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="벤치마크 테이블을 지우지 않음")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    conn = connect()
+    try:
+        for size in args.sizes:
+            for users in args.users:
+                print(f"\n== {size:,} rows, dim={args.dim}, users={users}, metric={args.metric} ==")
+                started = time.perf_counter()
+                load_rows(conn, size, args.dim, users, rng)
+                print(f"load: {time.perf_counter() - started:.1f}s")
+
+                queries = [(rng.integers(0, users), rng.standard_normal(args.dim))
+                           for _ in range(args.queries)]
+                expected, exact_latencies = run_queries(conn, queries, args.metric, args.top_k, exact=True)
+                p50, p95 = summarize(exact_latencies)
+                print(f"{'exact scan':<30} recall=1.000  short=0.00  p50={p50:8.2f}ms  p95={p95:8.2f}ms")
+
+                build_seconds = build_hnsw(conn, args.metric, args.m, args.ef_construction)
+                print(f"hnsw build: {build_seconds:.1f}s (m={args.m}, ef_construction={args.ef_construction})")
+
+                for iterative_scan in args.iterative_scan:
+                    for ef_search in args.ef_search:
+                        actual, latencies = run_queries(
+                            conn, queries, args.metric, args.top_k, exact=False,
+                            ef_search=ef_search, iterative_scan=iterative_scan)
+                        p50, p95 = summarize(latencies)
+                        label = f"hnsw ef={ef_search} iter={iterative_scan}"
+                        print(f"{label:<30} recall={recall(expected, actual):.3f}  "
+                              f"short={short_rate(expected, actual):.2f}  p50={p50:8.2f}ms  p95={p95:8.2f}ms")
+    finally:
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
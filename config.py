@@ -27,6 +27,103 @@ class Config:
     AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME = os.getenv(
         "AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME")
 
+    # Azure OpenAI HTTP connection pool configuration
+    OPENAI_MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+    OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(
+        os.getenv("OPENAI_MAX_KEEPALIVE_CONNECTIONS", "10"))
+    OPENAI_KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "30"))
+    OPENAI_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+    OPENAI_CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+    OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "2"))
+
+    # Embedding batch configuration
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    EMBEDDING_BATCH_MAX_TOKENS = int(
+        os.getenv("EMBEDDING_BATCH_MAX_TOKENS", "32000"))
+
+    # Background embedding queue configuration
+    EMBEDDING_ASYNC = os.getenv("EMBEDDING_ASYNC", "True").lower() == "true"
+    EMBEDDING_QUEUE_WORKERS = int(os.getenv("EMBEDDING_QUEUE_WORKERS", "2"))
+    EMBEDDING_QUEUE_MAX_WAIT_MS = int(
+        os.getenv("EMBEDDING_QUEUE_MAX_WAIT_MS", "50"))
+
+    # Embedding cache configuration
+    EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "4096"))
+    EMBEDDING_CACHE_TTL = int(os.getenv("EMBEDDING_CACHE_TTL", "86400"))
+    EMBEDDING_CACHE_REDIS = os.getenv(
+        "EMBEDDING_CACHE_REDIS", "False").lower() == "true"
+
+    # Tool result cache configuration (검색 도구 결과 재사용)
+    TOOL_CACHE_ENABLED = os.getenv("TOOL_CACHE_ENABLED", "True").lower() == "true"
+    TOOL_CACHE_SIZE = int(os.getenv("TOOL_CACHE_SIZE", "2048"))
+    # TTL이 지난 뒤에도 이 시간(초) 동안은 이전 결과를 반환하고 백그라운드에서 갱신
+    TOOL_CACHE_STALE_SECONDS = int(os.getenv("TOOL_CACHE_STALE_SECONDS", "600"))
+    TOOL_CACHE_REFRESH_WORKERS = int(os.getenv("TOOL_CACHE_REFRESH_WORKERS", "2"))
+    # 도구별 TTL 재정의 (예: "search_web=300,google_news=600", 0이면 캐시하지 않음)
+    TOOL_CACHE_TTLS = os.getenv("TOOL_CACHE_TTLS", "")
+
+    # External search configuration
+    # 제공자별 초당 최대 호출 수 (serper=google_news, google_cse=google_search*, tavily=search_web)
+    SEARCH_RATE_LIMITS = os.getenv("SEARCH_RATE_LIMITS", "serper=5,google_cse=5,tavily=5")
+    # 인사이트 생성 시 키워드별 뉴스 검색을 동시에 실행할 최대 개수
+    INSIGHT_SEARCH_WORKERS = int(os.getenv("INSIGHT_SEARCH_WORKERS", "10"))
+
+    # Insight document loading configuration (뉴스 본문 수집/요약)
+    INSIGHT_FETCH_MAX_CONNECTIONS = int(os.getenv("INSIGHT_FETCH_MAX_CONNECTIONS", "20"))
+    # 같은 언론사(호스트)에 동시에 보낼 최대 요청 수
+    INSIGHT_FETCH_PER_HOST = int(os.getenv("INSIGHT_FETCH_PER_HOST", "4"))
+    INSIGHT_FETCH_TIMEOUT = float(os.getenv("INSIGHT_FETCH_TIMEOUT", "10"))
+    DOCUMENT_CACHE_SIZE = int(os.getenv("DOCUMENT_CACHE_SIZE", "1024"))
+    # 이 시간(초) 이내에 가져온 본문은 재요청하지 않고, 이후에는 ETag/Last-Modified로 재검증
+    DOCUMENT_CACHE_FRESH_SECONDS = int(os.getenv("DOCUMENT_CACHE_FRESH_SECONDS", "3600"))
+    DOCUMENT_CACHE_MAX_AGE = int(os.getenv("DOCUMENT_CACHE_MAX_AGE", "86400"))
+    INSIGHT_SUMMARY_WORKERS = int(os.getenv("INSIGHT_SUMMARY_WORKERS", "4"))
+    # 기사 요약 전체에 쓸 수 있는 시간(초), 초과한 기사는 인사이트에서 제외
+    INSIGHT_SUMMARY_BUDGET = float(os.getenv("INSIGHT_SUMMARY_BUDGET", "60"))
+    # 요약 요청 하나에 묶을 최대 기사 수/본문 토큰 수, 기사 하나에서 사용할 최대 글자 수
+    INSIGHT_SUMMARY_BATCH_SIZE = int(os.getenv("INSIGHT_SUMMARY_BATCH_SIZE", "8"))
+    INSIGHT_SUMMARY_BATCH_TOKENS = int(os.getenv("INSIGHT_SUMMARY_BATCH_TOKENS", "12000"))
+    INSIGHT_SUMMARY_DOC_CHARS = int(os.getenv("INSIGHT_SUMMARY_DOC_CHARS", "6000"))
+    SUMMARY_CACHE_SIZE = int(os.getenv("SUMMARY_CACHE_SIZE", "2048"))
+    SUMMARY_CACHE_TTL = int(os.getenv("SUMMARY_CACHE_TTL", "604800"))
+
+    # Vector search configuration (비어 있으면 서버 기본값 hnsw.ef_search=40 사용)
+    VECTOR_SEARCH_EF_SEARCH = int(os.getenv("VECTOR_SEARCH_EF_SEARCH", "0")) or None
+    # user_id 필터로 HNSW 결과가 top_k보다 적으면 탐색을 이어서 진행 (pgvector 0.8 이상)
+    # relaxed_order | strict_order | off (pgvector 0.8 미만이면 off)
+    VECTOR_SEARCH_ITERATIVE_SCAN = os.getenv("VECTOR_SEARCH_ITERATIVE_SCAN", "relaxed_order")
+    # l2 | cosine | inner_product (HNSW 인덱스가 vector_l2_ops이므로 l2일 때만 인덱스를 사용)
+    VECTOR_SEARCH_METRIC = os.getenv("VECTOR_SEARCH_METRIC", "l2")
+    # 에이전트 프롬프트에 넣을 과거 대화의 최소 유사도 점수 (코사인 유사도 기준, 임베딩 모델에 따라 조정)
+    VECTOR_SEARCH_MIN_SCORE = float(os.getenv("VECTOR_SEARCH_MIN_SCORE", "0.35"))
+
+    # Background job queue configuration (세션 종료 후처리 등)
+    JOB_QUEUE_WORKERS = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+    JOB_QUEUE_POLL_INTERVAL = float(os.getenv("JOB_QUEUE_POLL_INTERVAL", "5"))
+    JOB_QUEUE_MAX_ATTEMPTS = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "3"))
+    JOB_QUEUE_RETRY_BACKOFF = float(os.getenv("JOB_QUEUE_RETRY_BACKOFF", "10"))
+    # 이 시간(초)보다 오래 running인 작업은 워커가 죽은 것으로 보고 다시 실행
+    JOB_QUEUE_STALE_SECONDS = int(os.getenv("JOB_QUEUE_STALE_SECONDS", "1800"))
+    JOB_QUEUE_AUTOSTART = os.getenv("JOB_QUEUE_AUTOSTART", "True").lower() == "true"
+
+    # Background auto task: 의존 관계가 없는 PlanStep을 동시에 실행할 최대 개수
+    BACKGROUND_MAX_PARALLEL_STEPS = int(os.getenv("BACKGROUND_MAX_PARALLEL_STEPS", "4"))
+    # 이 시간(초)보다 오래 doing 상태인 자동 업무는 실행이 중단된 것으로 보고 다시 가져감
+    BACKGROUND_TASK_STALE_SECONDS = int(os.getenv("BACKGROUND_TASK_STALE_SECONDS", "3600"))
+
+    # AutoTask scheduler (repeat/preferred_at 기반 자동 실행)
+    AUTO_TASK_SCHEDULER_ENABLED = os.getenv(
+        "AUTO_TASK_SCHEDULER_ENABLED", "False").lower() == "true"
+    AUTO_TASK_SCHEDULER_WORKERS = int(os.getenv("AUTO_TASK_SCHEDULER_WORKERS", "4"))
+    # 같은 시각에 몰린 업무를 0~N초 사이로 분산
+    AUTO_TASK_SCHEDULER_JITTER_SECONDS = float(
+        os.getenv("AUTO_TASK_SCHEDULER_JITTER_SECONDS", "30"))
+    # cron 표현식/선호 시각을 해석할 시간대
+    AUTO_TASK_SCHEDULER_TIMEZONE = os.getenv("AUTO_TASK_SCHEDULER_TIMEZONE", "Asia/Seoul")
+
+    # Chat streaming configuration (False면 턴이 끝난 뒤 응답을 한 번에 전송)
+    STREAM_TOKENS = os.getenv("STREAM_TOKENS", "True").lower() == "true"
+
     # Google Search API Configuration
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
     GOOGLE_CSE_ID = os.getenv("GOOGLE_CSE_ID")
@@ -40,7 +137,22 @@ class Config:
     # Redis Configuration
     REDIS_URL = os.getenv("REDIS_URL")
     REDIS_KEY = os.getenv("REDIS_KEY")
-    REDIS_PORT = int(os.getenv("REDIS_PORT"))
+    REDIS_PORT = int(os.getenv("REDIS_PORT", "6380"))
+    REDIS_SSL = os.getenv("REDIS_SSL", "True").lower() == "true"
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "2"))
+    REDIS_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "2"))
+    REDIS_HEALTH_CHECK_INTERVAL = int(
+        os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+    REDIS_RETRIES = int(os.getenv("REDIS_RETRIES", "3"))
+
+    # Agent state backend: redis | local (프로세스 내 LRU, 테스트/단일 노드용)
+    AGENT_STATE_BACKEND = os.getenv("AGENT_STATE_BACKEND", "redis")
+    LOCAL_STATE_MAX_KEYS = int(os.getenv("LOCAL_STATE_MAX_KEYS", "10000"))
+
+    # Agent state 저장 시 zstd 압축 사용 여부 (zstandard가 설치되어 있을 때만 적용)
+    AGENT_STATE_COMPRESS = os.getenv(
+        "AGENT_STATE_COMPRESS", "True").lower() == "true"
 
     # MCP Configuration
     ACCUWEATHER_API_KEY = os.getenv("ACCUWEATHER_API_KEY")
@@ -50,6 +162,8 @@ class Config:
 class TestConfig(Config):
     """Test configuration."""
     TESTING = True
+    AGENT_STATE_BACKEND = "local"
+    JOB_QUEUE_AUTOSTART = False
 
     # Override database URI for testing to disable SSL
     SQLALCHEMY_DATABASE_URI = (
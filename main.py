@@ -1,6 +1,17 @@
 from app import create_app
+from app.services.auto_task_scheduler import auto_task_scheduler
+from app.utils.app_config import get_auto_task_scheduler_config, get_job_queue_config
+from app.utils.job_queue import job_queue
 
 app = create_app()
 
+# 재시작 전에 남아 있던 백그라운드 작업을 이어서 처리
+if get_job_queue_config()['autostart']:
+    job_queue.start(app)
+
+# repeat/preferred_at이 있는 자동 업무를 정해진 시각에 실행
+if get_auto_task_scheduler_config()['enabled']:
+    auto_task_scheduler.start(app)
+
 if __name__ == '__main__':
     app.run(debug=True)
\ No newline at end of file
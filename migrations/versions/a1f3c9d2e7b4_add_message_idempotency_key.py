@@ -0,0 +1,29 @@
+"""add message idempotency key
+
+Revision ID: a1f3c9d2e7b4
+Revises: 803b182b2758
+Create Date: 2025-06-12 10:21:43.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1f3c9d2e7b4'
+down_revision = '803b182b2758'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('message', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('idempotency_key', sa.String(length=128), nullable=True))
+        batch_op.create_unique_constraint(
+            'uq_message_session_idempotency_key', ['session_id', 'idempotency_key'])
+
+
+def downgrade():
+    with op.batch_alter_table('message', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_message_session_idempotency_key', type_='unique')
+        batch_op.drop_column('idempotency_key')
@@ -0,0 +1,41 @@
+"""add message vector hnsw index and user timestamp index
+
+Revision ID: b7e2d4f8a913
+Revises: a1f3c9d2e7b4
+Create Date: 2025-06-12 16:02:11.734410
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7e2d4f8a913'
+down_revision = 'a1f3c9d2e7b4'
+branch_labels = None
+depends_on = None
+
+# HNSW opclass는 검색에 쓰는 거리 함수와 같아야 인덱스를 탐 (l2_distance ↔ vector_l2_ops)
+# 모델(app/models/message.py)의 ix_message_vector_hnsw 정의와 같은 값을 사용해야 autogenerate가 차이를 보고하지 않음
+OPCLASS = 'vector_l2_ops'
+HNSW_M = 16
+HNSW_EF_CONSTRUCTION = 64
+
+
+def upgrade():
+    # 운영 중인 테이블에 쓰기 잠금을 걸지 않도록 CONCURRENTLY로 생성 (트랜잭션 밖에서 실행해야 함)
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_vector_hnsw '
+            f'ON message USING hnsw (vector {OPCLASS}) '
+            f'WITH (m = {HNSW_M}, ef_construction = {HNSW_EF_CONSTRUCTION})'
+        )
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_message_user_id_timestamp '
+            'ON message (user_id, timestamp)'
+        )
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_message_user_id_timestamp')
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS ix_message_vector_hnsw')
@@ -0,0 +1,44 @@
+"""create background_job table
+
+Revision ID: c4d8a1e6f302
+Revises: b7e2d4f8a913
+Create Date: 2025-06-13 11:04:27.219874
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d8a1e6f302'
+down_revision = 'b7e2d4f8a913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('background_job',
+    sa.Column('id', sa.UUID(), nullable=False),
+    sa.Column('job_type', sa.String(length=64), nullable=False),
+    sa.Column('dedup_key', sa.String(length=255), nullable=True),
+    sa.Column('payload', sa.JSON(), nullable=True),
+    sa.Column('status', postgresql.ENUM('queued', 'running', 'done', 'failed', name='background_job_status'), nullable=False),
+    sa.Column('attempts', sa.Integer(), nullable=False),
+    sa.Column('max_attempts', sa.Integer(), nullable=False),
+    sa.Column('last_error', sa.Text(), nullable=True),
+    sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('available_at', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('dedup_key', name='uq_background_job_dedup_key')
+    )
+    op.create_index('ix_background_job_status_available_at', 'background_job',
+                    ['status', 'available_at'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_background_job_status_available_at', table_name='background_job')
+    op.drop_table('background_job')
+    postgresql.ENUM(name='background_job_status').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,28 @@
+"""add auto_task indexes for claim_next_task
+
+Revision ID: d9f2b7c4e815
+Revises: c4d8a1e6f302
+Create Date: 2025-06-13 17:42:09.601358
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'd9f2b7c4e815'
+down_revision = 'c4d8a1e6f302'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('auto_task', schema=None) as batch_op:
+        batch_op.create_index('ix_auto_task_user_id_status_created_at',
+                              ['user_id', 'status', 'created_at'], unique=False)
+        batch_op.create_index('ix_auto_task_user_id_title', ['user_id', 'title'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('auto_task', schema=None) as batch_op:
+        batch_op.drop_index('ix_auto_task_user_id_title')
+        batch_op.drop_index('ix_auto_task_user_id_status_created_at')
@@ -0,0 +1,172 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.dao.auto_task_dao import AutoTaskDAO
+from app.models import AutoTask, User
+from app.models.db import db
+
+@pytest.fixture(autouse=True)
+def setup_teardown(app):
+    """각 테스트 전후로 데이터베이스를 정리하는 fixture"""
+    with app.app_context():
+        yield
+        db.session.rollback()
+        AutoTask.query.delete()
+        User.query.delete()
+        db.session.commit()
+
+@pytest.fixture
+def auto_task_dao(app):
+    """AutoTaskDAO 인스턴스를 생성하는 fixture"""
+    with app.app_context():
+        return AutoTaskDAO()
+
+@pytest.fixture
+def sample_user(app):
+    """테스트용 사용자를 생성하는 fixture"""
+    from app.dao.user_dao import UserDAO
+    with app.app_context():
+        user = UserDAO().create(
+            username="testuser",
+            email="test@example.com"
+        )
+        db.session.refresh(user)
+        return user
+
+def create_task(auto_task_dao, user, title, task_list=None, status='undone', created_at=None):
+    return auto_task_dao.create(
+        user.id,
+        title=title,
+        task_list=task_list or [],
+        status=status,
+        created_at=created_at or datetime.now(timezone.utc)
+    )
+
+@pytest.mark.run(order=3)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestAutoTaskDAO:
+    """AutoTaskDAO 테스트 클래스"""
+
+    def test_claim_next_task_empty(self, auto_task_dao, sample_user):
+        """실행할 업무가 없을 때 None을 반환하는지 테스트"""
+        assert auto_task_dao.claim_next_task(sample_user.id) is None
+
+    def test_claim_next_task_latest_main_task(self, auto_task_dao, sample_user):
+        """메인 업무 중 가장 최근 업무를 doing으로 선점하는지 테스트"""
+        # Given
+        now = datetime.now(timezone.utc)
+        create_task(auto_task_dao, sample_user, "오래된 업무", created_at=now - timedelta(hours=1))
+        latest = create_task(auto_task_dao, sample_user, "최근 업무", created_at=now)
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id)
+
+        # Then
+        assert claimed.id == latest.id
+        assert claimed.status == 'doing'
+        assert claimed.start_at is not None
+
+    def test_claim_next_task_does_not_claim_twice(self, auto_task_dao, sample_user):
+        """이미 선점한 업무는 다시 가져가지 않는지 테스트"""
+        # Given
+        create_task(auto_task_dao, sample_user, "업무 1")
+        create_task(auto_task_dao, sample_user, "업무 2")
+
+        # When
+        first = auto_task_dao.claim_next_task(sample_user.id)
+        second = auto_task_dao.claim_next_task(sample_user.id)
+        third = auto_task_dao.claim_next_task(sample_user.id)
+
+        # Then
+        assert first.id != second.id
+        assert third is None
+
+    def test_claim_next_task_sub_task_first(self, auto_task_dao, sample_user):
+        """선행 업무가 done인 서브 업무를 메인 업무보다 먼저 선택하는지 테스트"""
+        # Given
+        now = datetime.now(timezone.utc)
+        create_task(auto_task_dao, sample_user, "선행 업무", status='done', created_at=now - timedelta(hours=2))
+        sub = create_task(auto_task_dao, sample_user, "서브 업무", task_list=["선행 업무"],
+                          created_at=now - timedelta(hours=1))
+        create_task(auto_task_dao, sample_user, "메인 업무", created_at=now)
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id)
+
+        # Then
+        assert claimed.id == sub.id
+
+    def test_claim_next_task_skips_blocked_sub_task(self, auto_task_dao, sample_user):
+        """선행 업무가 끝나지 않은 서브 업무는 선택하지 않는지 테스트"""
+        # Given
+        create_task(auto_task_dao, sample_user, "선행 업무", status='doing')
+        create_task(auto_task_dao, sample_user, "서브 업무", task_list=["선행 업무"])
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id)
+
+        # Then
+        assert claimed is None
+
+    def test_claim_next_task_stale(self, auto_task_dao, sample_user):
+        """오래 doing에 머문 업무를 stale_after 기준으로 다시 가져가는지 테스트"""
+        # Given
+        task = create_task(auto_task_dao, sample_user, "중단된 업무", status='doing')
+        task.start_at = datetime.now(timezone.utc) - timedelta(hours=2)
+        db.session.commit()
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id, stale_after=3600)
+
+        # Then
+        assert claimed.id == task.id
+
+    def test_release_task(self, auto_task_dao, sample_user):
+        """선점한 업무를 undone으로 되돌리는지 테스트"""
+        # Given
+        create_task(auto_task_dao, sample_user, "업무")
+        claimed = auto_task_dao.claim_next_task(sample_user.id)
+
+        # When
+        released = auto_task_dao.release_task(claimed.id)
+
+        # Then
+        assert released.status == 'undone'
+        assert auto_task_dao.claim_next_task(sample_user.id).id == claimed.id
+
+    def test_claim_next_task_by_id_with_newer_task(self, auto_task_dao, sample_user):
+        """task_id를 주면 더 최근의 다른 undone 업무가 있어도 지정한 업무를 선점하는지 테스트"""
+        # Given
+        now = datetime.now(timezone.utc)
+        scheduled = create_task(auto_task_dao, sample_user, "예약 업무", created_at=now - timedelta(hours=1))
+        newer = create_task(auto_task_dao, sample_user, "새 업무", created_at=now)
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id, task_id=scheduled.id)
+
+        # Then
+        assert claimed.id == scheduled.id
+        assert claimed.status == 'doing'
+        assert auto_task_dao.get(newer.id).status == 'undone'
+
+    def test_claim_next_task_by_id_sub_task(self, auto_task_dao, sample_user):
+        """task_id로 지정한 서브 업무는 선행 업무가 끝나지 않았어도 선점하는지 테스트"""
+        # Given
+        create_task(auto_task_dao, sample_user, "선행 업무")
+        sub = create_task(auto_task_dao, sample_user, "서브 업무", task_list=["선행 업무"])
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id, task_id=sub.id)
+
+        # Then
+        assert claimed.id == sub.id
+
+    def test_claim_next_task_by_id_already_doing(self, auto_task_dao, sample_user):
+        """task_id로 지정한 업무가 이미 실행 중이면 None을 반환하는지 테스트"""
+        # Given
+        task = create_task(auto_task_dao, sample_user, "실행 중인 업무", status='doing')
+        create_task(auto_task_dao, sample_user, "다른 업무")
+
+        # When
+        claimed = auto_task_dao.claim_next_task(sample_user.id, task_id=task.id)
+
+        # Then
+        assert claimed is None
@@ -0,0 +1,127 @@
+import pytest
+from app.dao.background_job_dao import BackgroundJobDAO
+from app.models.background_job import BackgroundJob
+from app.models.db import db
+from datetime import datetime, timezone, timedelta
+
+@pytest.fixture(autouse=True)
+def setup_teardown(app):
+    """각 테스트 전후로 데이터베이스를 정리하는 fixture"""
+    with app.app_context():
+        yield
+        db.session.rollback()
+        BackgroundJob.query.delete()
+        db.session.commit()
+
+@pytest.fixture
+def job_dao(app):
+    """BackgroundJobDAO 인스턴스를 생성하는 fixture"""
+    with app.app_context():
+        return BackgroundJobDAO()
+
+@pytest.mark.run(order=3)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestBackgroundJobDAO:
+    """BackgroundJobDAO 테스트 클래스"""
+
+    def test_enqueue(self, job_dao):
+        """작업 추가 테스트"""
+        # When
+        job = job_dao.enqueue("session.cleanup", {"session_id": "s1"}, dedup_key="session.cleanup:s1")
+
+        # Then
+        assert job is not None
+        assert job.status == 'queued'
+        assert job.attempts == 0
+        assert job.payload == {"session_id": "s1"}
+
+    def test_enqueue_duplicate_dedup_key(self, job_dao):
+        """같은 dedup_key로 다시 추가하면 무시되는지 테스트"""
+        # Given
+        job_dao.enqueue("session.cleanup", {"session_id": "s1"}, dedup_key="session.cleanup:s1")
+
+        # When
+        duplicate = job_dao.enqueue("session.cleanup", {"session_id": "s1"}, dedup_key="session.cleanup:s1")
+
+        # Then
+        assert duplicate is None
+        assert BackgroundJob.query.count() == 1
+
+    def test_claim_next(self, job_dao):
+        """가장 오래된 작업을 running으로 가져오는지 테스트"""
+        # Given
+        first = job_dao.enqueue("session.cleanup", {"order": 1})
+        job_dao.enqueue("session.cleanup", {"order": 2})
+
+        # When
+        claimed = job_dao.claim_next()
+
+        # Then
+        assert claimed.id == first.id
+        assert claimed.status == 'running'
+        assert claimed.attempts == 1
+        assert claimed.started_at is not None
+
+    def test_claim_next_empty(self, job_dao):
+        """실행 가능한 작업이 없을 때 None을 반환하는지 테스트"""
+        assert job_dao.claim_next() is None
+
+    def test_complete(self, job_dao):
+        """작업 완료 처리 테스트"""
+        # Given
+        job_dao.enqueue("session.cleanup")
+        job = job_dao.claim_next()
+
+        # When
+        completed = job_dao.complete(job.id)
+
+        # Then
+        assert completed.status == 'done'
+        assert completed.finished_at is not None
+
+    def test_fail_retries_then_fails(self, job_dao):
+        """재시도 횟수가 남아 있으면 queued, 모두 쓰면 failed가 되는지 테스트"""
+        # Given
+        job_dao.enqueue("session.cleanup", max_attempts=2)
+
+        # When: 첫 번째 실패 → 재시도 대기
+        job = job_dao.claim_next()
+        retried = job_dao.fail(job.id, "boom", retry_delay=0)
+
+        # Then
+        assert retried.status == 'queued'
+        assert retried.last_error == "boom"
+
+        # When: 두 번째 실패 → 최종 실패
+        job = job_dao.claim_next()
+        failed = job_dao.fail(job.id, "boom again", retry_delay=0)
+
+        # Then
+        assert failed.status == 'failed'
+        assert failed.attempts == 2
+
+    def test_fail_retry_delay(self, job_dao):
+        """retry_delay 동안은 다시 가져가지 않는지 테스트"""
+        # Given
+        job_dao.enqueue("session.cleanup")
+        job = job_dao.claim_next()
+
+        # When
+        job_dao.fail(job.id, "boom", retry_delay=60)
+
+        # Then
+        assert job_dao.claim_next() is None
+
+    def test_requeue_stale(self, job_dao):
+        """오래된 running 작업을 queued로 되돌리는지 테스트"""
+        # Given
+        job_dao.enqueue("session.cleanup")
+        job = job_dao.claim_next()
+        job.started_at = datetime.now(timezone.utc) - timedelta(hours=1)
+        db.session.commit()
+
+        # When
+        count = job_dao.requeue_stale(older_than_seconds=60)
+
+        # Then
+        assert count == 1
+        assert job_dao.count_by_status() == {'queued': 1}
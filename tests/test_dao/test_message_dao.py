@@ -278,4 +278,152 @@ class TestMessageDAO:
         assert messages[0].timestamp <= messages[1].timestamp <= messages[2].timestamp
         # 메시지 ID 목록 확인
         message_ids = {m.id for m in messages}
-        assert message_ids == {message1.id, message2.id, message3.id} 
\ No newline at end of file
+        assert message_ids == {message1.id, message2.id, message3.id}
+
+    def test_get_missing_vector_page(self, message_dao, sample_session, sample_user):
+        """벡터가 없는 메시지 페이지 조회 테스트"""
+        # Given
+        missing = [
+            message_dao.create(
+                session_id=sample_session.id,
+                user_id=sample_user.id,
+                content=f"Missing {i}",
+                role="user"
+            )
+            for i in range(3)
+        ]
+        message_dao.create(
+            session_id=sample_session.id,
+            user_id=sample_user.id,
+            content="Embedded",
+            role="user",
+            vector=create_test_vector()
+        )
+
+        # When
+        first_page = message_dao.get_missing_vector_page(user_id=sample_user.id, limit=2)
+        second_page = message_dao.get_missing_vector_page(
+            user_id=sample_user.id, after_id=first_page[-1][0], limit=2)
+
+        # Then
+        assert len(first_page) == 2
+        assert len(second_page) == 1
+        page_ids = [row[0] for row in first_page + second_page]
+        assert page_ids == sorted(page_ids)
+        assert set(page_ids) == {m.id for m in missing}
+        assert message_dao.count_missing_vectors(sample_user.id) == 3
+
+    def test_bulk_update_vectors(self, message_dao, sample_session, sample_user):
+        """벡터 bulk 업데이트 테스트"""
+        # Given
+        messages = [
+            message_dao.create(
+                session_id=sample_session.id,
+                user_id=sample_user.id,
+                content=f"Message {i}",
+                role="user"
+            )
+            for i in range(3)
+        ]
+        vectors = {m.id: create_test_vector() for m in messages}
+
+        # When
+        updated = message_dao.bulk_update_vectors(vectors)
+
+        # Then
+        assert updated == 3
+        assert message_dao.count_missing_vectors(sample_user.id) == 0
+        db.session.expire_all()
+        for m in messages:
+            saved = message_dao.get(m.id)
+            assert np.allclose(saved.vector, vectors[m.id])
+
+    def test_bulk_create(self, message_dao, sample_session, sample_user):
+        """한 턴의 메시지 bulk 생성 테스트"""
+        # Given
+        base = datetime.now(timezone.utc)
+        messages = [
+            {"role": "user", "content": "질문", "timestamp": base.isoformat()},
+            {"role": "tool", "content": "도구 결과", "metadata": {"tool_call_id": "call_1"},
+             "timestamp": (base + timedelta(seconds=1)).isoformat()},
+            {"role": "assistant", "content": "답변", "vector": create_test_vector(),
+             "timestamp": (base + timedelta(seconds=2)).isoformat()}
+        ]
+
+        # When
+        created = message_dao.bulk_create(sample_session.id, sample_user.id, messages)
+
+        # Then
+        assert len(created) == 3
+        saved = message_dao.get_all_by_session_id(sample_session.id)
+        assert [m.role for m in saved] == ["user", "tool", "assistant"]
+        assert saved[1].message_metadata == {"tool_call_id": "call_1"}
+        assert saved[0].vector is None
+        assert saved[2].vector is not None
+
+    def test_bulk_create_invalid_session(self, message_dao, sample_user):
+        """존재하지 않는 세션에 bulk 생성 시 예외 테스트"""
+        with pytest.raises(ValueError):
+            message_dao.bulk_create(uuid.uuid4(), sample_user.id,
+                                    [{"role": "user", "content": "Hello"}])
+
+    def test_bulk_create_idempotency_key(self, message_dao, sample_session, sample_user):
+        """같은 idempotency_key로 다시 저장하면 중복 저장되지 않는지 테스트"""
+        # Given
+        messages = [
+            {"role": "user", "content": "질문", "idempotency_key": "turn-1:0:user"},
+            {"role": "assistant", "content": "답변", "idempotency_key": "turn-1:1:assistant"}
+        ]
+        message_dao.bulk_create(sample_session.id, sample_user.id, messages)
+
+        # When
+        created = message_dao.bulk_create(sample_session.id, sample_user.id, messages)
+
+        # Then
+        assert created == []
+        assert len(message_dao.get_all_by_session_id(sample_session.id)) == 2
+
+    def test_get_similar_pgvector_with_distance(self, message_dao, sample_session, sample_user):
+        """유사도 검색 결과에 거리가 함께 반환되고 max_distance로 걸러지는지 테스트"""
+        # Given
+        near = np.zeros(1536, dtype=np.float32)
+        near[0] = 1.0
+        far = np.zeros(1536, dtype=np.float32)
+        far[1] = 1.0
+        near_message = message_dao.create(
+            session_id=sample_session.id, user_id=sample_user.id,
+            content="Near", role="user", vector=near)
+        message_dao.create(
+            session_id=sample_session.id, user_id=sample_user.id,
+            content="Far", role="user", vector=far)
+
+        # When
+        results = message_dao.get_similar_pgvector(sample_user.id, near, top_k=5, metric="cosine")
+        filtered = message_dao.get_similar_pgvector(
+            sample_user.id, near, top_k=5, metric="cosine", max_distance=0.5)
+
+        # Then
+        assert [round(distance, 4) for _, distance in results] == [0.0, 1.0]
+        assert [msg.id for msg, _ in filtered] == [near_message.id]
+
+    def test_get_similar_pgvector_restores_settings(self, message_dao, sample_session, sample_user):
+        """exact/ef_search/iterative_scan 설정이 검색 쿼리에만 적용되고 같은 트랜잭션의 이후 쿼리에는 남지 않는지 테스트"""
+        # Given
+        vector = create_test_vector()
+        message_dao.create(
+            session_id=sample_session.id, user_id=sample_user.id,
+            content="Vector", role="user", vector=vector)
+        before = db.session.execute(db.text("SHOW enable_indexscan")).scalar()
+
+        # When
+        exact = message_dao.get_similar_pgvector(sample_user.id, vector, top_k=1, exact=True)
+        message_dao.get_similar_pgvector(
+            sample_user.id, vector, top_k=1, ef_search=200, iterative_scan="relaxed_order")
+
+        # Then
+        assert len(exact) == 1
+        assert db.session.execute(db.text("SHOW enable_indexscan")).scalar() == before
+        assert db.session.execute(
+            db.text("SELECT current_setting('hnsw.ef_search', true)")).scalar() in (None, '', '40')
+        assert db.session.execute(
+            db.text("SELECT current_setting('hnsw.iterative_scan', true)")).scalar() in (None, '', 'off')
@@ -0,0 +1,110 @@
+import pickle
+import uuid
+import pytest
+from datetime import datetime, timezone
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from pydantic import BaseModel
+from app.utils.agent_state_codec import (
+    COMPRESS_MIN_BYTES, FLAG_ZSTD, MAGIC, SCHEMA_VERSION, ZSTD_FRAME_MAGIC,
+    decode_state, decode_value, encode_state, encode_value
+)
+
+
+class Location(BaseModel):
+    city: str
+
+
+def sample_state(content="안녕하세요"):
+    return {
+        "messages": [
+            SystemMessage(content="시스템 프롬프트"),
+            HumanMessage(content=content, additional_kwargs={"source": "voice"}),
+            AIMessage(
+                content="",
+                tool_calls=[{"name": "search_web", "args": {"query": "날씨"}, "id": "call_1"}],
+                additional_kwargs={"refusal": None, "metadata": {"step": 1}}
+            ),
+            ToolMessage(content="맑음", tool_call_id="call_1", name="search_web"),
+            AIMessage(content="오늘은 맑습니다.")
+        ],
+        "summary": "",
+        "user_id": str(uuid.uuid4()),
+        "scratchpad": [],
+        "step_count": 2,
+        "next_step": "agent"
+    }
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestAgentStateCodec:
+    """AgentState 직렬화 포맷 테스트 클래스"""
+
+    def test_round_trip_messages(self):
+        """tool_calls, additional_kwargs를 포함한 메시지가 그대로 복원되는지 테스트"""
+        state = sample_state()
+
+        decoded = decode_value(encode_value(state["messages"]))
+
+        assert decoded == state["messages"]
+        assert [type(message) for message in decoded] == [type(message) for message in state["messages"]]
+        assert decoded[2].tool_calls[0]["args"] == {"query": "날씨"}
+        assert decoded[1].additional_kwargs == {"source": "voice"}
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip_state(self, compress):
+        """압축 여부와 상관없이 state가 그대로 복원되는지 테스트"""
+        state = sample_state(content="긴 본문 " * COMPRESS_MIN_BYTES)
+
+        data = encode_state(state, compress=compress)
+        decoded, legacy = decode_state(data)
+
+        assert data.startswith(MAGIC)
+        assert bool(data[3] & FLAG_ZSTD) == compress
+        assert decoded == state
+        assert legacy is False
+
+    def test_small_state_not_compressed(self):
+        """COMPRESS_MIN_BYTES보다 작은 본문은 압축하지 않는지 테스트"""
+        data = encode_state({"summary": "짧은 요약"}, compress=True)
+
+        assert not data[3] & FLAG_ZSTD
+        assert decode_state(data) == ({"summary": "짧은 요약"}, False)
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_round_trip_value(self, compress):
+        """개별 값이 압축 여부와 상관없이 복원되고, 큰 값만 zstd 프레임으로 저장되는지 테스트"""
+        message = HumanMessage(content="긴 본문 " * COMPRESS_MIN_BYTES)
+
+        data = encode_value(message, compress=compress)
+
+        assert data.startswith(ZSTD_FRAME_MAGIC) == compress
+        assert decode_value(data) == message
+
+    def test_decode_legacy_pickle(self):
+        """이전 pickle 포맷으로 저장된 state를 읽는지 테스트"""
+        state = sample_state()
+
+        decoded, legacy = decode_state(pickle.dumps(state))
+
+        assert decoded == state
+        assert legacy is True
+
+    def test_reject_newer_schema(self):
+        """더 새로운 스키마 버전은 읽지 않는지 테스트"""
+        data = MAGIC + bytes([SCHEMA_VERSION + 1, 0]) + b"{}"
+
+        with pytest.raises(ValueError):
+            decode_state(data)
+
+    def test_encode_known_types(self):
+        """datetime, UUID, pydantic 모델을 인코딩하는지 테스트"""
+        now = datetime(2025, 6, 13, 9, 0, tzinfo=timezone.utc)
+        value_id = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        decoded = decode_value(encode_value({"at": now, "id": value_id, "location": Location(city="서울")}))
+
+        assert decoded == {"at": now.isoformat(), "id": str(value_id), "location": {"city": "서울"}}
+
+    def test_encode_unknown_type(self):
+        """변환할 수 없는 값은 문자열로 저장하지 않고 TypeError를 내는지 테스트"""
+        with pytest.raises(TypeError):
+            encode_value({"value": object()})
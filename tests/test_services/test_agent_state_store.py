@@ -0,0 +1,171 @@
+import pickle
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from app.utils import agent_state_store
+from app.utils.agent_state_codec import encode_state, encode_value
+from app.utils.agent_state_store import AGENT_MESSAGE_WINDOW, AgentStateStore
+from app.utils.redis_client import LocalRedis
+
+USER_ID = "user-1"
+
+
+@pytest.fixture
+def redis(monkeypatch):
+    """테스트마다 비어 있는 인프로세스 Redis를 사용하도록 하는 fixture"""
+    client = LocalRedis()
+    monkeypatch.setattr(agent_state_store, "get_redis", lambda: client)
+    monkeypatch.setattr(agent_state_store, "get_redis_config", lambda: {"compress": False})
+    return client
+
+
+def messages(*indexes):
+    return [HumanMessage(content=f"질문 {i}") if i % 2 == 0 else AIMessage(content=f"답변 {i}") for i in indexes]
+
+
+def contents(state):
+    return [message.content for message in state["messages"]]
+
+
+def encoded_size(items):
+    return sum(len(encode_value(item)) for item in items)
+
+
+def save(*indexes, **fields):
+    state = AgentStateStore.get(USER_ID)
+    state["messages"] = messages(*indexes)
+    state.update(fields)
+    AgentStateStore.set(USER_ID, state)
+    return AgentStateStore.get(USER_ID)
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestAgentStateStore:
+    """AgentStateStore 증분 저장 테스트 클래스"""
+
+    def test_append_messages(self, redis):
+        """메시지만 추가된 턴은 새 메시지만 기록하는지 테스트"""
+        # Given
+        state = save(0, 1)
+        new_messages = messages(2, 3)
+        state["messages"].extend(new_messages)
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == encoded_size(new_messages)
+        assert contents(AgentStateStore.get(USER_ID)) == ["질문 0", "답변 1", "질문 2", "답변 3"]
+
+    def test_append_beyond_window(self, redis):
+        """메시지가 AGENT_MESSAGE_WINDOW개를 넘으면 최근 메시지만 남기는지 테스트"""
+        # Given
+        state = save(*range(AGENT_MESSAGE_WINDOW))
+        new_messages = messages(AGENT_MESSAGE_WINDOW)
+        state["messages"].extend(new_messages)
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == encoded_size(new_messages)
+        expected = [message.content for message in messages(*range(1, AGENT_MESSAGE_WINDOW + 1))]
+        assert contents(AgentStateStore.get(USER_ID)) == expected
+
+    def test_summarize_trim_then_append(self, redis):
+        """요약으로 앞부분이 잘린 뒤 메시지가 추가되면 잘라내기와 새 메시지만 기록하는지 테스트"""
+        # Given
+        state = save(0, 1, 2, 3)
+        new_messages = messages(4)
+        state["messages"] = state["messages"][2:] + new_messages
+        state["summary"] = "요약"
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == encoded_size(new_messages) + len("summary") + len(encode_value("요약"))
+        loaded = AgentStateStore.get(USER_ID)
+        assert contents(loaded) == ["질문 2", "답변 3", "질문 4"]
+        assert loaded["summary"] == "요약"
+
+    def test_rewrite_when_not_contiguous(self, redis):
+        """기존 메시지 뒤에 이어지지 않으면 메시지 목록 전체를 다시 쓰는지 테스트"""
+        # Given
+        state = save(0, 1, 2)
+        state["messages"][1] = AIMessage(content="수정된 답변")
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == encoded_size(state["messages"])
+        assert contents(AgentStateStore.get(USER_ID)) == ["질문 0", "수정된 답변", "질문 2"]
+
+    def test_removed_field_deleted(self, redis):
+        """state에서 없어진 필드는 Redis hash에서도 삭제하는지 테스트"""
+        # Given
+        state = save(0, extra={"key": "value"})
+        assert state["extra"] == {"key": "value"}
+        del state["extra"]
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == 0
+        assert "extra" not in AgentStateStore.get(USER_ID)
+
+    def test_set_without_get(self, redis):
+        """get()으로 읽지 않은 dict를 set()하면 기존 값을 모두 덮어쓰는지 테스트"""
+        # Given
+        save(0, 1, 2, extra="old")
+        state = {"messages": messages(5), "summary": "새 요약"}
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == encoded_size(state["messages"]) + len("summary") + len(encode_value("새 요약"))
+        loaded = AgentStateStore.get(USER_ID)
+        assert contents(loaded) == ["답변 5"]
+        assert loaded["summary"] == "새 요약"
+        assert "extra" not in loaded
+
+    @pytest.mark.parametrize("encode", [pickle.dumps, encode_state])
+    def test_migrate_legacy_key(self, redis, encode):
+        """단일 키(pickle/이전 포맷)에 저장된 state를 새 구조로 옮기고 기존 키를 삭제하는지 테스트"""
+        # Given
+        legacy = {"messages": messages(0, 1), "summary": "요약", "user_id": USER_ID, "step_count": 3}
+        redis.set(f"agent_state:{USER_ID}", encode(legacy))
+
+        # When
+        state = AgentStateStore.get(USER_ID)
+
+        # Then
+        assert contents(state) == ["질문 0", "답변 1"]
+        assert state["summary"] == "요약"
+        assert redis.get(f"agent_state:{USER_ID}") is None
+        reloaded = AgentStateStore.get(USER_ID)
+        assert contents(reloaded) == ["질문 0", "답변 1"]
+        assert reloaded["step_count"] == 3
+
+    def test_no_change_writes_nothing(self, redis):
+        """바뀐 것이 없으면 기록한 바이트 수가 0인지 테스트"""
+        # Given
+        state = save(0, 1, summary="요약")
+
+        # When / Then
+        assert AgentStateStore.set(USER_ID, state) == 0
+        assert AgentStateStore.set(USER_ID, AgentStateStore.get(USER_ID)) == 0
+
+    def test_transient_fields_not_saved(self, redis):
+        """턴마다 새로 채우는 turn_context는 저장하지 않는지 테스트"""
+        # Given
+        state = save(0)
+        state["turn_context"] = {"user_name": "홍길동", "search_results": ["이전 대화"]}
+
+        # When
+        written = AgentStateStore.set(USER_ID, state)
+
+        # Then
+        assert written == 0
+        assert "turn_context" not in AgentStateStore.get(USER_ID)
@@ -0,0 +1,198 @@
+import random
+import uuid
+import pytest
+import pytz
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from app.dao.auto_task_dao import AutoTaskDAO
+from app.services.auto_task_scheduler import AutoTaskScheduler, dispatch_auto_task, is_fire_time
+from app.utils.job_queue import job_queue
+from app.utils.cron import CronExpression
+
+START = datetime(2025, 6, 13, 0, 0, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """테스트용 시계 (epoch 초)"""
+
+    def __init__(self, now: datetime = START):
+        self.now = now.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, **kwargs):
+        self.now += timedelta(**kwargs).total_seconds()
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def dispatched():
+    return []
+
+@pytest.fixture
+def scheduler(clock, dispatched):
+    """가짜 시계와 동기 실행으로 만든 스케줄러"""
+    return AutoTaskScheduler(
+        dispatch=lambda task_id, user_id, fire_at: dispatched.append((task_id, fire_at)),
+        clock=clock,
+        submit=lambda fn, *args: fn(*args),
+        max_workers=4,
+        jitter_seconds=0,
+        timezone_name='UTC'
+    )
+
+def make_task(repeat=None, preferred_at=None, active=True):
+    return {
+        'id': str(uuid.uuid4()),
+        'user_id': str(uuid.uuid4()),
+        'repeat': repeat,
+        'preferred_at': preferred_at.isoformat() if preferred_at else None,
+        'active': active
+    }
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestAutoTaskScheduler:
+    """AutoTaskScheduler 테스트 클래스"""
+
+    def test_cron_next_after(self):
+        """cron 표현식의 다음 실행 시각 계산 테스트"""
+        cron = CronExpression("30 7 * * 1-5")
+        # 2025-06-13은 금요일 → 다음 평일은 월요일
+        assert cron.next_after(START.replace(hour=8)) == datetime(2025, 6, 16, 7, 30, tzinfo=timezone.utc)
+
+    def test_invalid_cron(self):
+        """잘못된 cron 표현식 테스트"""
+        with pytest.raises(ValueError):
+            CronExpression("61 * * * *")
+
+    def test_fires_when_due(self, scheduler, clock, dispatched):
+        """실행 시각이 되기 전에는 실행하지 않고, 지나면 실행하는지 테스트"""
+        # Given
+        task = make_task(preferred_at=START + timedelta(minutes=10))
+        scheduler.on_task_changed(task)
+
+        # When / Then
+        clock.advance(minutes=9)
+        assert scheduler.run_pending() == 0
+
+        clock.advance(minutes=1)
+        assert scheduler.run_pending() == 1
+        assert dispatched == [(task['id'], START + timedelta(minutes=10))]
+
+        # 한 번만 실행하는 업무는 다시 실행되지 않음
+        clock.advance(days=1)
+        assert scheduler.run_pending() == 0
+        assert scheduler.pending() == 0
+
+    def test_repeating_task_reschedules(self, scheduler, clock, dispatched):
+        """반복 업무가 실행 후 다음 시각으로 다시 등록되는지 테스트"""
+        # Given
+        scheduler.on_task_changed(make_task(repeat="0 * * * *"))
+
+        # When
+        for _ in range(3):
+            clock.advance(hours=1)
+            scheduler.run_pending()
+
+        # Then
+        assert [fire_at.hour for _, fire_at in dispatched] == [1, 2, 3]
+
+    def test_task_change_and_removal(self, scheduler, clock, dispatched):
+        """수정된 업무는 새 시각으로, 비활성/삭제된 업무는 실행하지 않는지 테스트"""
+        # Given
+        moved = make_task(preferred_at=START + timedelta(minutes=5))
+        disabled = make_task(preferred_at=START + timedelta(minutes=5))
+        removed = make_task(preferred_at=START + timedelta(minutes=5))
+        for task in (moved, disabled, removed):
+            scheduler.on_task_changed(task)
+
+        # When
+        moved['preferred_at'] = (START + timedelta(hours=1)).isoformat()
+        scheduler.on_task_changed(moved)
+        disabled['active'] = False
+        scheduler.on_task_changed(disabled)
+        scheduler.on_task_removed(removed['id'])
+
+        clock.advance(minutes=10)
+        scheduler.run_pending()
+        assert dispatched == []
+
+        clock.advance(hours=1)
+        scheduler.run_pending()
+
+        # Then
+        assert [task_id for task_id, _ in dispatched] == [moved['id']]
+
+    def test_max_workers_limits_dispatch(self, clock, dispatched):
+        """동시에 실행 중인 dispatch가 max_workers를 넘지 않는지 테스트"""
+        # Given: submit이 바로 실행하지 않고 보관만 함 (실행 중 상태 유지)
+        submitted = []
+        scheduler = AutoTaskScheduler(
+            dispatch=lambda task_id, user_id, fire_at: dispatched.append(task_id),
+            clock=clock, submit=lambda fn, *args: submitted.append((fn, args)),
+            max_workers=2, jitter_seconds=0, timezone_name='UTC'
+        )
+        for _ in range(5):
+            scheduler.on_task_changed(make_task(preferred_at=START + timedelta(minutes=1)))
+        clock.advance(minutes=1)
+
+        # When / Then
+        assert scheduler.run_pending() == 2
+        assert scheduler.run_pending() == 0
+
+        fn, args = submitted.pop(0)
+        fn(*args)
+        assert scheduler.run_pending() == 1
+
+    def test_jitter_spreads_same_time(self, clock, dispatched):
+        """같은 시각의 업무가 jitter 범위 안으로 흩어지는지 테스트"""
+        # Given
+        scheduler = AutoTaskScheduler(
+            dispatch=lambda task_id, user_id, fire_at: dispatched.append(task_id),
+            clock=clock, submit=lambda fn, *args: fn(*args),
+            max_workers=100, jitter_seconds=60, timezone_name='UTC', rng=random.Random(0)
+        )
+        for _ in range(20):
+            scheduler.on_task_changed(make_task(preferred_at=START + timedelta(minutes=1)))
+
+        # When
+        clock.advance(minutes=1, seconds=30)
+        first_half = scheduler.run_pending()
+        clock.advance(seconds=30)
+        second_half = scheduler.run_pending()
+
+        # Then
+        assert 0 < first_half < 20
+        assert first_half + second_half == 20
+
+    def test_is_fire_time(self):
+        """실행 시각이 업무의 현재 repeat/preferred_at 기준 실행 시각인지 판단하는지 테스트"""
+        preferred_at = START + timedelta(hours=7)
+        assert is_fire_time("0 * * * *", None, START + timedelta(hours=3), pytz.utc)
+        assert not is_fire_time("30 * * * *", None, START + timedelta(hours=3), pytz.utc)
+        assert is_fire_time(None, preferred_at, preferred_at, pytz.utc)
+        assert not is_fire_time(None, preferred_at + timedelta(hours=1), preferred_at, pytz.utc)
+        assert is_fire_time("매일", preferred_at, preferred_at + timedelta(days=2), pytz.utc)
+        assert not is_fire_time("61 * * * *", None, START, pytz.utc)
+
+    def test_dispatch_skips_stale_fire_time(self, monkeypatch):
+        """다른 프로세스에서 실행 시각이 바뀐 업무는 이전 시각에 실행하지 않는지 테스트"""
+        # Given: 이 프로세스의 heap에는 07:00이 남아 있지만 DB에서는 08:00으로 바뀜
+        old_fire_at = START + timedelta(hours=7)
+        task = SimpleNamespace(id=uuid.uuid4(), active=True, status='done', repeat=None,
+                               preferred_at=old_fire_at + timedelta(hours=1))
+        enqueued = []
+        monkeypatch.setattr(AutoTaskDAO, "get", lambda self, task_id: task)
+        monkeypatch.setattr(AutoTaskDAO, "update_status", lambda self, task_id, status: None)
+        monkeypatch.setattr(job_queue, "enqueue", lambda job_type, payload, dedup_key=None: enqueued.append(payload))
+
+        # When
+        dispatch_auto_task(str(task.id), str(uuid.uuid4()), old_fire_at)
+        dispatch_auto_task(str(task.id), str(uuid.uuid4()), task.preferred_at)
+
+        # Then
+        assert [payload["task_id"] for payload in enqueued] == [str(task.id)]
@@ -0,0 +1,74 @@
+import pytest
+from app.langgraph.insight.nodes.news_dedup import (
+    _same_title, canonicalize_url, dedupe_news_items, normalize_title
+)
+
+CANONICAL = "https://news.example.com/article/123?id=5"
+
+
+def same(a, b):
+    return _same_title(normalize_title(a), normalize_title(b))
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestNewsDedup:
+    """뉴스 URL/제목 중복 제거 테스트 클래스"""
+
+    @pytest.mark.parametrize("url", [
+        "https://news.example.com/article/123?id=5",
+        "http://www.news.example.com/article/123/?id=5",
+        "https://m.news.example.com/article/123?id=5",
+        "https://amp.news.example.com/article/123?id=5",
+        "https://news.example.com/article/123/amp?id=5",
+        "https://news.example.com/amp/article/123?id=5",
+        "https://news.example.com/article/123?utm_source=naver&utm_medium=social&id=5",
+        "https://news.example.com/article/123?id=5&fbclid=abc#comments",
+    ])
+    def test_canonicalize_url_variants(self, url):
+        """AMP/모바일 주소, 추적 파라미터, fragment가 달라도 같은 URL로 맞추는지 테스트"""
+        assert canonicalize_url(url) == CANONICAL
+
+    def test_canonicalize_url_keeps_distinct_articles(self):
+        """기사 경로나 의미 있는 쿼리 파라미터가 다르면 다른 URL로 남는지 테스트"""
+        assert canonicalize_url("https://news.example.com/article/124?id=5") != CANONICAL
+        assert canonicalize_url("https://news.example.com/article/123?id=6") != CANONICAL
+        assert canonicalize_url("https://news.example.com/article/123?b=2&a=1") == \
+            canonicalize_url("https://news.example.com/article/123?a=1&b=2")
+
+    def test_normalize_title(self):
+        """언론사 접미사, 특수문자, 공백, 대소문자를 제거하는지 테스트"""
+        assert normalize_title("삼성, 새 AI 칩 공개 - 연합뉴스") == "삼성새ai칩공개"
+        assert normalize_title("삼성 새 AI칩 공개 | 한국경제") == "삼성새ai칩공개"
+        assert normalize_title(None) == ""
+
+    def test_same_title(self):
+        """같은 기사의 제목 변형은 같은 기사로 보는지 테스트"""
+        assert same("삼성, 새 AI 칩 공개 - 연합뉴스", "삼성 새 AI칩 공개 | 한국경제")
+        assert same("삼성전자 2분기 영업이익 10조 돌파", "삼성전자 2분기 영업이익 10조 돌파(종합)")
+        assert not same("", "")
+
+    @pytest.mark.parametrize("a, b", [
+        ("삼성전자 2분기 영업이익 증가 - 연합뉴스", "LG전자 2분기 영업이익 감소 - 연합뉴스"),
+        ("한국은행, 기준금리 0.25%p 인상", "한국은행, 기준금리 0.25%p 인하"),
+    ])
+    def test_same_title_distinct_headlines(self, a, b):
+        """표현이 비슷해도 내용이 다른 제목은 합치지 않는지 테스트"""
+        assert not same(a, b)
+
+    def test_dedupe_news_items(self):
+        """버킷 간 중복 기사를 하나로 합치고, AMP보다 원문 주소를 사용하는지 테스트"""
+        # Given
+        amp = {"title": "삼성, 새 AI 칩 공개 - 연합뉴스", "link": "https://m.news.example.com/article/1/amp"}
+        original = {"title": "삼성 새 AI칩 공개 | 한국경제", "link": "https://news.example.com/article/1"}
+        other = {"title": "LG전자 2분기 영업이익 감소", "link": "https://news.example.com/article/2"}
+
+        # When
+        documents, refs = dedupe_news_items({
+            "recent_news": {"삼성": [amp, other]},
+            "past_news": {"AI 칩": [original]},
+        })
+
+        # Then
+        assert len(documents) == 2
+        assert documents[0]["url"] == original["link"]
+        assert documents[0]["links"] == [amp["link"], original["link"]]
+        assert refs == {"recent_news": [0, 1], "past_news": [0]}
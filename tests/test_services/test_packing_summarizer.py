@@ -0,0 +1,61 @@
+import json
+import pytest
+from app.utils import packing_summarizer
+from app.utils.packing_summarizer import parse_batch_response, summarize_batch
+
+IDS = ["d0", "d1"]
+
+
+@pytest.fixture
+def completions(monkeypatch):
+    """get_completion 호출을 기록하고, 지정한 응답을 순서대로 돌려주는 fixture"""
+    calls = []
+    responses = []
+
+    def fake_completion(messages, max_completion_tokens=3000):
+        calls.append(messages)
+        return responses.pop(0)
+
+    monkeypatch.setattr(packing_summarizer, "get_completion", fake_completion)
+    return calls, responses
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestPackingSummarizer:
+    """packing summarizer 배치 응답 해석 테스트 클래스"""
+
+    def test_parse_fenced_json(self):
+        """코드블록(```json)으로 감싼 응답을 해석하는지 테스트"""
+        response = '```json\n{"summaries": [{"id": "d0", "summary": "첫 번째\\n 요약"}, {"id": "d1", "summary": "두 번째"}]}\n```'
+        assert parse_batch_response(response, IDS) == {"d0": "첫 번째 요약", "d1": "두 번째"}
+
+    def test_parse_bare_list(self):
+        """summaries 키 없이 목록만 온 응답을 해석하는지 테스트"""
+        response = json.dumps([{"id": "d1", "summary": "요약"}], ensure_ascii=False)
+        assert parse_batch_response(response, IDS) == {"d1": "요약"}
+
+    def test_parse_ignores_unknown_id(self):
+        """요청하지 않은 id, 빈 요약, 문자열이 아닌 요약은 버리는지 테스트"""
+        response = json.dumps({"summaries": [
+            {"id": "d9", "summary": "다른 문서"},
+            {"id": "d0", "summary": "  "},
+            {"id": "d1", "summary": ["목록"]},
+        ]}, ensure_ascii=False)
+        assert parse_batch_response(response, IDS) == {}
+
+    @pytest.mark.parametrize("response", [None, "", "요약할 수 없습니다.", '{"summaries": "없음"}', '{"summaries": [', "42"])
+    def test_parse_malformed(self, response):
+        """형식이 틀린 응답은 빈 dict를 반환하는지 테스트"""
+        assert parse_batch_response(response, IDS) == {}
+
+    def test_summarize_batch_falls_back_to_single(self, completions):
+        """배치 응답을 해석하지 못하면 문서별 요청으로 다시 요약하는지 테스트"""
+        # Given
+        calls, responses = completions
+        responses.extend(["잘못된 응답", "첫 번째 요약", "두 번째 요약"])
+
+        # When
+        summaries = summarize_batch([("d0", "첫 번째 기사"), ("d1", "두 번째 기사")])
+
+        # Then
+        assert summaries == {"d0": "첫 번째 요약", "d1": "두 번째 요약"}
+        assert len(calls) == 3
@@ -0,0 +1,155 @@
+import pytest
+from concurrent.futures import Future
+from app.langgraph.background.nodes import run_ready_steps
+from app.langgraph.background.nodes.run_ready_steps import run_plan
+
+
+class FakeWorkers:
+    """
+    submit/wait를 대신하는 가짜 워커.
+    submit은 끝나지 않은 Future를 반환하고, wait는 가장 먼저 시작한 Step 하나를 실행해 완료시킨다.
+    """
+
+    def __init__(self, task, scores):
+        self.task = task
+        self.scores = scores  # step_id -> 시도별 quality_score 목록 (예외를 넣으면 실행 중 예외)
+        self.pending = []
+        self.events = []
+        self.running_at_wait = []
+
+    def submit(self, step_id):
+        future = Future()
+        self.pending.append((future, step_id))
+        self.events.append(("start", step_id))
+        return future
+
+    def wait(self, futures, return_when=None):
+        self.running_at_wait.append(len(futures))
+        future, step_id = next((f, s) for f, s in self.pending if f in futures)
+        self.pending.remove((future, step_id))
+        score = self.scores[step_id].pop(0)
+        self.events.append(("done", step_id))
+        if isinstance(score, Exception):
+            future.set_exception(score)
+        else:
+            step = dict(self.task["plan"][step_id])
+            step["output"] = {"quality_score": score}
+            future.set_result(step)
+        return {future}, set(futures) - {future}
+
+    def started(self):
+        return [step_id for event, step_id in self.events if event == "start"]
+
+
+def make_task(*steps):
+    """(step_id, depends_on, max_attempt) 목록으로 TaskRuntime을 만든다. (목록 순서 = ready_queue 순서)"""
+    return {
+        "task_id": "task-1",
+        "plan": {
+            step_id: {"step_id": step_id, "tool": "search_web", "depends_on": depends_on,
+                      "status": "pending", "attempt": 0, "max_attempt": max_attempt}
+            for step_id, depends_on, max_attempt in steps
+        },
+        "ready_queue": [step_id for step_id, _, _ in steps],
+        "completed_ids": [],
+    }
+
+
+@pytest.fixture
+def run(monkeypatch):
+    """가짜 워커로 run_plan을 실행하고 (에러, 워커)를 반환하는 fixture"""
+    def runner(task, scores, max_parallel, on_status=lambda step: None):
+        workers = FakeWorkers(task, scores)
+        monkeypatch.setattr(run_ready_steps, "wait", workers.wait)
+        return run_plan(task, workers.submit, max_parallel, on_status), workers
+    return runner
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestRunPlan:
+    """run_plan DAG 스케줄러 테스트 클래스"""
+
+    def test_independent_steps_start_together(self, run):
+        """서로 의존하지 않는 Step을 결과를 기다리지 않고 함께 시작하는지 테스트"""
+        # Given
+        task = make_task(("a", [], 2), ("b", [], 2), ("c", [], 2))
+        statuses = []
+
+        # When
+        error, workers = run(task, {"a": [0.9], "b": [0.9], "c": [0.9]}, max_parallel=3,
+                             on_status=lambda step: statuses.append((step["step_id"], step["status"])))
+
+        # Then
+        assert error is None
+        assert workers.events[:3] == [("start", "a"), ("start", "b"), ("start", "c")]
+        assert workers.running_at_wait[0] == 3
+        assert statuses[:3] == [("a", "running"), ("b", "running"), ("c", "running")]
+        assert sorted(task["completed_ids"]) == ["a", "b", "c"]
+
+    def test_max_parallel(self, run):
+        """동시에 실행 중인 Step이 max_parallel을 넘지 않는지 테스트"""
+        # Given
+        task = make_task(*[(step_id, [], 2) for step_id in "abcde"])
+
+        # When
+        error, workers = run(task, {step_id: [0.9] for step_id in "abcde"}, max_parallel=2)
+
+        # Then
+        assert error is None
+        assert max(workers.running_at_wait) == 2
+        assert workers.started() == list("abcde")
+        assert all(step["status"] == "done" for step in task["plan"].values())
+
+    def test_dependent_step_waits(self, run):
+        """의존하는 Step은 선행 Step이 done이 된 뒤에 시작하는지 테스트"""
+        # Given
+        task = make_task(("a", [], 2), ("b", ["a"], 2), ("c", [], 2))
+
+        # When
+        error, workers = run(task, {"a": [0.9], "b": [0.9], "c": [0.9]}, max_parallel=3)
+
+        # Then
+        assert error is None
+        assert workers.events.index(("start", "b")) > workers.events.index(("done", "a"))
+        assert workers.events[:2] == [("start", "a"), ("start", "c")]
+
+    def test_retry_step(self, run):
+        """점수가 낮은 Step은 다시 시작하고, 재시도가 통과하면 done이 되는지 테스트"""
+        # Given
+        task = make_task(("a", [], 2), ("b", ["a"], 2))
+
+        # When
+        error, workers = run(task, {"a": [0.2, 0.9], "b": [0.9]}, max_parallel=2)
+
+        # Then
+        assert error is None
+        assert workers.started() == ["a", "a", "b"]
+        assert task["plan"]["a"]["status"] == "done"
+        assert task["plan"]["a"]["attempt"] == 1
+
+    def test_failure_stops_new_steps(self, run):
+        """실패한 Step이 생기면 새 Step은 시작하지 않고, 실행 중인 Step은 끝까지 기다리는지 테스트"""
+        # Given
+        task = make_task(("a", [], 0), ("b", [], 2), ("c", [], 2))
+
+        # When
+        error, workers = run(task, {"a": [0.1], "b": [0.9], "c": [0.9]}, max_parallel=2)
+
+        # Then
+        assert error is not None and "a" in error
+        assert workers.started() == ["a", "b"]
+        assert task["plan"]["a"]["status"] == "failed"
+        assert task["plan"]["b"]["status"] == "done"
+        assert task["plan"]["c"]["status"] == "pending"
+
+    def test_worker_exception_marks_failed(self, run):
+        """워커에서 예외가 나면 Step을 failed로 표시하고 에러를 기록하는지 테스트"""
+        # Given
+        task = make_task(("a", [], 0))
+
+        # When
+        error, workers = run(task, {"a": [RuntimeError("tool crashed")]}, max_parallel=1)
+
+        # Then
+        assert error is not None
+        assert task["plan"]["a"]["status"] == "failed"
+        assert task["plan"]["a"]["output"] == {"error": "tool crashed"}
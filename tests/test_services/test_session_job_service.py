@@ -0,0 +1,81 @@
+import uuid
+import pytest
+from app.services import session_job_service as module
+from app.services.session_job_service import (
+    JOB_BACKGROUND_AUTO_TASK, JOB_CREATE_AUTO_TASKS, SessionJobService
+)
+
+GENERATED_TASKS = [{"title": "업무", "description": "설명", "dependencies": [], "repeat": None,
+                    "preferred_at": None, "category": "기타"}]
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """cleanup LLM 호출, 업무 생성, 작업 큐를 가짜로 바꾼 SessionJobService"""
+    service = SessionJobService()
+    service.calls = {"cleanup": 0, "created": [], "enqueued": []}
+
+    def cleanup_session(session_id):
+        service.calls["cleanup"] += 1
+        return {"generated_tasks": GENERATED_TASKS}
+
+    def enqueue(job_type, payload=None, dedup_key=None):
+        service.calls["enqueued"].append((job_type, payload, dedup_key))
+        return "job-id"
+
+    monkeypatch.setattr(service.cleanup_service, "cleanup_session", cleanup_session)
+    monkeypatch.setattr(service.auto_task_service, "create_from_cleanup_result",
+                        lambda user_id, result: service.calls["created"].append(result["generated_tasks"]))
+    monkeypatch.setattr(module.job_queue, "enqueue", enqueue)
+    return service
+
+
+def make_payload():
+    return {"session_id": str(uuid.uuid4()), "user_id": str(uuid.uuid4())}
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestSessionJobService:
+    """세션 종료 후처리 작업 테스트 클래스"""
+
+    def test_cleanup_enqueues_task_creation(self, service):
+        """cleanup은 업무를 직접 만들지 않고 세션당 하나의 업무 생성 작업을 추가하는지 테스트"""
+        # Given
+        payload = make_payload()
+
+        # When
+        service.cleanup(payload)
+
+        # Then
+        assert service.calls["created"] == []
+        job_type, job_payload, dedup_key = service.calls["enqueued"][0]
+        assert job_type == JOB_CREATE_AUTO_TASKS
+        assert job_payload == dict(payload, generated_tasks=GENERATED_TASKS)
+        assert dedup_key == f"{JOB_CREATE_AUTO_TASKS}:{payload['session_id']}"
+
+    def test_create_auto_tasks(self, service):
+        """업무 생성 작업이 업무를 만들고 백그라운드 실행 작업을 추가하는지 테스트"""
+        # Given
+        payload = dict(make_payload(), generated_tasks=GENERATED_TASKS)
+
+        # When
+        service.create_auto_tasks(payload)
+
+        # Then
+        assert service.calls["created"] == [GENERATED_TASKS]
+        assert service.calls["enqueued"] == [(
+            JOB_BACKGROUND_AUTO_TASK, {"user_id": payload["user_id"]},
+            f"{JOB_BACKGROUND_AUTO_TASK}:{payload['session_id']}"
+        )]
+
+    def test_create_auto_tasks_does_not_retry(self, service, monkeypatch):
+        """업무를 만든 뒤 실행 작업 추가에 실패해도 예외를 내지 않아 업무가 다시 생성되지 않는지 테스트"""
+        # Given
+        def failing_enqueue(job_type, payload=None, dedup_key=None):
+            raise RuntimeError("db unavailable")
+        monkeypatch.setattr(module.job_queue, "enqueue", failing_enqueue)
+
+        # When
+        service.create_auto_tasks(dict(make_payload(), generated_tasks=GENERATED_TASKS))
+
+        # Then
+        assert service.calls["created"] == [GENERATED_TASKS]
@@ -0,0 +1,137 @@
+import threading
+import pytest
+from app.utils import tool_cache
+from app.utils.tool_cache import ToolResultCache, tool_cache_key
+
+TTL = 60
+STALE_SECONDS = 30
+
+
+class FakeClock:
+    """테스트용 시계 (초)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float):
+        self.now += seconds
+
+
+class CountingTool:
+    """호출 횟수를 세고, 호출할 때마다 다른 결과를 반환하는 가짜 도구"""
+
+    def __init__(self, results=None):
+        self.calls = 0
+        self.results = results
+
+    def __call__(self):
+        self.calls += 1
+        if self.results is not None:
+            return self.results[self.calls - 1]
+        return f"result {self.calls}"
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+@pytest.fixture
+def cache(monkeypatch, clock):
+    """search_web만 TTL이 있는 캐시 (설정은 고정값 사용)"""
+    monkeypatch.setattr(tool_cache, "get_tool_cache_config", lambda: {
+        'enabled': True, 'size': 100, 'stale_seconds': STALE_SECONDS, 'refresh_workers': 2, 'ttls': {}
+    })
+    cache = ToolResultCache(ttls={"search_web": TTL}, clock=clock)
+    yield cache
+    if cache._executor is not None:
+        cache._executor.shutdown(wait=True)
+
+@pytest.mark.run(order=4)  # DB 설정(1) -> 모델(2) -> DAO(3) -> Service(4) -> Route(5) -> DB 정리(6)
+class TestToolResultCache:
+    """ToolResultCache 테스트 클래스"""
+
+    def test_miss_hit_and_expire(self, cache, clock):
+        """처음에는 실행하고, TTL 안에서는 캐시를 반환하고, stale 구간이 지나면 다시 실행하는지 테스트"""
+        tool = CountingTool()
+        query = {"query": "서울 날씨"}
+
+        assert cache.get_or_call("search_web", query, tool) == "result 1"
+        clock.advance(TTL - 1)
+        assert cache.get_or_call("search_web", query, tool) == "result 1"
+        clock.advance(STALE_SECONDS + 2)
+        assert cache.get_or_call("search_web", query, tool) == "result 2"
+
+        assert tool.calls == 2
+        stats = cache.stats()["tools"]["search_web"]
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 0, 2)
+
+    def test_stale_hit_refreshes_in_background(self, cache, clock):
+        """TTL이 지난 결과는 바로 반환하고, 백그라운드 갱신 후에는 새 결과를 반환하는지 테스트"""
+        tool = CountingTool()
+        cache.get_or_call("search_web", "서울 날씨", tool)
+        clock.advance(TTL + 1)
+
+        assert cache.get_or_call("search_web", "서울 날씨", tool) == "result 1"
+        cache._executor.shutdown(wait=True)
+        assert cache.get_or_call("search_web", "서울 날씨", tool) == "result 2"
+
+        assert tool.calls == 2
+        stats = cache.stats()["tools"]["search_web"]
+        assert (stats["hits"], stats["stale_hits"], stats["misses"]) == (1, 1, 1)
+
+    def test_refresh_runs_once_per_key(self, cache, clock):
+        """같은 키의 갱신이 진행 중이면 stale 조회가 여러 번 와도 한 번만 다시 실행하는지 테스트"""
+        # Given
+        cache.get_or_call("search_web", "서울 날씨", lambda: "old")
+        clock.advance(TTL + 1)
+        release = threading.Event()
+        refreshes = []
+
+        def slow_refresh():
+            refreshes.append(1)
+            release.wait(5)
+            return "new"
+
+        # When
+        results = [cache.get_or_call("search_web", "서울 날씨", slow_refresh) for _ in range(5)]
+        release.set()
+        cache._executor.shutdown(wait=True)
+
+        # Then
+        assert results == ["old"] * 5
+        assert len(refreshes) == 1
+        assert cache.get_or_call("search_web", "서울 날씨", slow_refresh) == "new"
+
+    @pytest.mark.parametrize("error", [
+        "검색 중 오류가 발생했습니다", {"error": "timeout"}, [{"error": "timeout"}], None
+    ])
+    def test_error_result_not_cached(self, cache, error):
+        """오류 결과는 캐시하지 않고 다음 호출에서 다시 실행하는지 테스트"""
+        tool = CountingTool(results=[error, "ok"])
+
+        assert cache.get_or_call("search_web", "서울 날씨", tool) == error
+        assert cache.get_or_call("search_web", "서울 날씨", tool) == "ok"
+        assert tool.calls == 2
+
+    def test_tool_without_ttl_bypasses_cache(self, cache):
+        """TTL이 없는 도구는 캐시하지 않고 매번 실행하는지 테스트"""
+        tool = CountingTool()
+
+        assert cache.get_or_call("send_email", {"to": "a@example.com"}, tool) == "result 1"
+        assert cache.get_or_call("send_email", {"to": "a@example.com"}, tool) == "result 2"
+        assert "send_email" not in cache.stats()["tools"]
+
+    def test_normalized_key(self, cache):
+        """대소문자, 공백, dict 키 순서가 달라도 같은 키로 보는지 테스트"""
+        tool = CountingTool()
+        first = {"query": "  Seoul   Weather\n", "num_results": 5}
+        second = {"num_results": 5, "query": "seoul weather"}
+
+        assert tool_cache_key("search_web", first) == tool_cache_key("search_web", second)
+        assert tool_cache_key("search_web", first) != tool_cache_key("search_web", {"query": "busan weather"})
+        cache.get_or_call("search_web", first, tool)
+        assert cache.get_or_call("search_web", second, tool) == "result 1"
+        assert tool.calls == 1